@@ -0,0 +1,89 @@
+"""
+Filter latency: facet posting lists vs. a linear scan.
+
+Usage:
+    python benchmarks/bench_filter.py [CATALOG_ROOT] [--prompts N]
+
+Without a root, a synthetic catalog of N prompts (default 20000) is generated
+in a temporary directory. Each filter combination is run against
+``Catalog.filter_prompts`` and against the previous per-prompt scan, and the
+median time per call is reported.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from prompt_catalog_mcp.catalog import SKILL_ORDER, Catalog
+from prompt_catalog_mcp.generator import generate_catalog
+
+REPEAT = 20
+
+
+def scan(catalog: Catalog, *, category=None, subcategory=None, skill_level=None,
+         platform=None, tag=None, query=None):
+    """The pre-index ``filter_prompts`` loop, for comparison."""
+    results = []
+    for p in catalog.prompts.values():
+        if category and p.category != category:
+            continue
+        if subcategory and p.subcategory != subcategory:
+            continue
+        if skill_level and SKILL_ORDER.index(p.skill_level) > SKILL_ORDER.index(skill_level):
+            continue
+        if platform and platform not in p.platforms and "all" not in p.platforms:
+            continue
+        if tag and tag not in p.tags:
+            continue
+        if query:
+            searchable = f"{p.title} {p.description} {' '.join(p.tags)}".lower()
+            if query.lower() not in searchable:
+                continue
+        results.append(p)
+    return results
+
+
+def median_ms(fn, **filters) -> float:
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn(**filters)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("root", nargs="?")
+    parser.add_argument("--prompts", type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(args.root) if args.root else Path(tmp)
+        if not args.root:
+            generate_catalog(root, prompts=args.prompts, kits=10, seed=1)
+        catalog = Catalog.load(root, cache=False)
+
+        start = time.perf_counter()
+        catalog.facet_index()
+        print(f"{len(catalog.prompts)} prompts, index built in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        cases = [
+            {"category": "security"},
+            {"platform": "web", "skill_level": "intermediate"},
+            {"category": "development", "tag": "api", "platform": "linux"},
+            {"skill_level": "advanced", "query": "review"},
+        ]
+        for filters in cases:
+            assert catalog.filter_prompts(**filters) == scan(catalog, **filters)
+            indexed = median_ms(catalog.filter_prompts, **filters)
+            linear = median_ms(lambda **f: scan(catalog, **f), **filters)
+            print(f"  {filters}: {indexed:.3f} ms indexed, {linear:.3f} ms scan")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Resident memory per prompt, measured with tracemalloc.
+
+Usage:
+    python benchmarks/bench_memory.py [CATALOG_ROOT]
+
+Loads the catalog with and without ``compact=True`` (snapshot disabled so
+both pay the same parsing cost) and reports the bytes still allocated per
+prompt once loading finishes.
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+from prompt_catalog_mcp.catalog import Catalog
+
+
+def bytes_per_prompt(root: Path, **load_kwargs) -> tuple[int, float]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    catalog = Catalog.load(root, cache=False, **load_kwargs)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    count = len(catalog.prompts)
+    return count, (after - before) / max(count, 1)
+
+
+def main() -> None:
+    root = Path(sys.argv[1] if len(sys.argv) > 1 else Path(__file__).resolve().parents[2])
+    # Warm imports and interned constants so they are not charged to the first run.
+    Catalog.load(root, cache=False)
+
+    count, default = bytes_per_prompt(root)
+    _, compact = bytes_per_prompt(root, compact=True)
+    print(f"{count} prompts in {root}")
+    print(f"  default : {default:10,.0f} bytes/prompt")
+    print(f"  compact : {compact:10,.0f} bytes/prompt  ({compact / default:.0%} of default)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Render latency: compiled templates vs. one ``str.replace`` pass per argument.
+
+Usage:
+    python benchmarks/bench_render.py [--kib N] [--variables N]
+
+Builds a prompt body of roughly N KiB (default 64) that uses N variables
+(default 20) throughout, then reports the median time per render for
+``PromptEntry.render`` (a compiled template, one join) and for the previous
+replace loop, plus the one-off compile time and a render cache hit.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+from prompt_catalog_mcp.catalog import Catalog, PromptEntry
+from prompt_catalog_mcp.template import Template
+
+REPEAT = 50
+
+
+def replace_render(text: str, arguments: dict[str, str]) -> str:
+    """The pre-template ``render``, for comparison."""
+    for key, value in arguments.items():
+        text = text.replace(f"{{{{{key}}}}}", value)
+    return text
+
+
+def make_entry(kib: int, variables: int) -> PromptEntry:
+    names = [f"var_{n}" for n in range(variables)]
+    sentences, size, n = [], 0, 0
+    while size < kib * 1024:
+        sentences.append(f"Step {n}: review the {{{{{names[n % variables]}}}}} design and list its risks.")
+        size += len(sentences[-1]) + 1
+        n += 1
+    text = "\n".join(sentences)
+    return PromptEntry(
+        id="BENCH-RENDER-001", version="1.0.0", title="Render benchmark", description="",
+        category="development", subcategory="", skill_level="advanced", platforms=["all"],
+        tags=[], prompt_text=text, variables=[{"name": n, "description": n} for n in names],
+        expected_output="", quality_criteria=[], anti_patterns=[], adversarial_tests=[],
+        related_prompts=[], chain_position={}, file_path=Path("bench.yaml"), raw={},
+    )
+
+
+def median_us(fn) -> float:
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--kib", type=int, default=64)
+    parser.add_argument("--variables", type=int, default=20)
+    args = parser.parse_args()
+
+    entry = make_entry(args.kib, args.variables)
+    arguments = {name: f"value for {name}" for name in entry.extract_variable_names()}
+    print(f"{len(entry.prompt_text) / 1024:.0f} KiB prompt, {len(arguments)} arguments")
+    print(f"  compile: {median_us(lambda: Template.compile(entry.prompt_text)):.1f} us (once per prompt)")
+
+    assert entry.render(arguments) == replace_render(entry.prompt_text, arguments)
+    for n in sorted({1, len(arguments) // 2, len(arguments)} - {0}):
+        subset = dict(list(arguments.items())[:n])
+        compiled = median_us(lambda: entry.render(subset))
+        replaced = median_us(lambda: replace_render(entry.prompt_text, subset))
+        print(f"  {n:>3} args: {compiled:.1f} us compiled, {replaced:.1f} us replace")
+
+    catalog = Catalog(root=Path("."), prompts={entry.id: entry})
+    catalog.enable_render_cache()
+    catalog.render(entry, arguments)
+    print(f"  render cache hit: {median_us(lambda: catalog.render(entry, arguments)):.1f} us")
+
+
+if __name__ == "__main__":
+    main()
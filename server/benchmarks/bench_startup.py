@@ -0,0 +1,81 @@
+"""
+CLI startup latency: ``--help``, ``list --json`` and the MCP ``serve`` handshake.
+
+Usage:
+    python benchmarks/bench_startup.py [CATALOG_ROOT] [--runs N]
+
+Each scenario runs in a fresh interpreter; the median wall time over N runs
+is reported (``list --json`` after one warm-up run, so the catalog snapshot
+is in place). ``python -X importtime`` on the same commands shows where the
+time goes; ``tests/test_startup.py`` guards the import budget.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+CLI = [sys.executable, "-c", "from prompt_catalog_mcp.cli import main; main()"]
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "bench_startup", "version": "0"},
+    },
+}
+
+
+def run_command(args: list[str], env: dict) -> float:
+    start = time.perf_counter()
+    subprocess.run(CLI + args, env=env, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def serve_handshake(env: dict) -> float:
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        CLI + ["serve"], env=env, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True
+    )
+    proc.stdin.write(json.dumps(INITIALIZE) + "\n")
+    proc.stdin.flush()
+    response = json.loads(proc.stdout.readline())
+    elapsed = time.perf_counter() - start
+    proc.stdin.close()
+    proc.wait()
+    assert response["id"] == 1 and "result" in response, response
+    return elapsed
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    runs = 5
+    if "--runs" in args:
+        i = args.index("--runs")
+        runs = int(args[i + 1])
+        del args[i:i + 2]
+    root = Path(args[0] if args else Path(__file__).resolve().parents[2])
+    env = {**os.environ, "CATALOG_ROOT": str(root)}
+
+    run_command(["list", "--json"], env)  # warm the snapshot
+    scenarios = {
+        "--help": lambda: run_command(["--help"], env),
+        "list --json": lambda: run_command(["list", "--json"], env),
+        "serve handshake": lambda: serve_handshake(env),
+    }
+    print(f"{root} (median of {runs} runs)")
+    for name, fn in scenarios.items():
+        times = [fn() for _ in range(runs)]
+        print(f"  {name:16s} {statistics.median(times) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Batch rendering — one prompt rendered for a stream of JSON argument sets.
+
+Input is JSON lines, one object of ``{variable: value}`` per line; blank
+lines are skipped. Each input line produces one output line, in order::
+
+    {"line": 3, "arguments": {...}, "text": "..."}
+    {"line": 4, "arguments": ..., "error": "Missing required argument(s) ..."}
+
+Callers should decode input with ``errors="surrogateescape"``: a line that
+is not valid UTF-8 is then reported as that line's error instead of aborting
+the batch.
+
+Lines are read, rendered and written one chunk at a time, so memory stays
+flat however long the batch is. With ``jobs`` > 1 chunks are parsed,
+rendered and serialized in a process pool; only the compiled template is
+sent to the workers, once, and at most a few chunks per worker are in
+flight, so a slow writer throttles the reader instead of queueing output.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from .template import MissingArgumentsError, Template
+
+if TYPE_CHECKING:
+    from .catalog import PromptEntry
+
+# Input lines per unit of work, and chunks in flight per worker process.
+CHUNK_LINES = 256
+CHUNKS_PER_JOB = 4
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    """What a worker needs to render one prompt: no catalog, no file handles."""
+
+    prompt_id: str
+    template: Template
+    required: tuple[str, ...]  # checked only when non-empty
+
+    @classmethod
+    def for_entry(cls, entry: "PromptEntry", check_required: bool = False) -> "BatchJob":
+        required = tuple(entry.required_variables()) if check_required else ()
+        return cls(entry.id, entry.template, required)
+
+    def render_line(self, number: int, line: str) -> tuple[bool, str]:
+        """Whether input ``line`` rendered, and its output line; errors are reported, not raised."""
+        arguments = None
+        try:
+            try:
+                line.encode("utf-8")
+            except UnicodeEncodeError:
+                raise ValueError("Line is not valid UTF-8") from None
+            arguments = json.loads(line)
+            if not isinstance(arguments, dict):
+                raise ValueError("Expected a JSON object of argument values")
+            values = {str(k): v if isinstance(v, str) else json.dumps(v) for k, v in arguments.items()}
+            missing = [name for name in self.required if name not in values]
+            if missing:
+                raise MissingArgumentsError(self.prompt_id, missing)
+            record = {"line": number, "arguments": arguments, "text": self.template.render(values)}
+        except ValueError as exc:  # includes json.JSONDecodeError
+            return False, json.dumps({"line": number, "arguments": arguments, "error": str(exc)}, ensure_ascii=False)
+        return True, json.dumps(record, ensure_ascii=False)
+
+    def render_chunk(self, chunk: list[tuple[int, str]]) -> list[tuple[bool, str]]:
+        return [self.render_line(number, line) for number, line in chunk]
+
+
+_job: BatchJob | None = None
+
+
+def _init_worker(job: BatchJob) -> None:
+    global _job
+    _job = job
+
+
+def _render_chunk(chunk: list[tuple[int, str]]) -> list[tuple[bool, str]]:
+    return _job.render_chunk(chunk)
+
+
+def _chunks(lines: Iterable[str]) -> Iterator[list[tuple[int, str]]]:
+    numbered = ((n, line) for n, line in enumerate(lines, 1) if line.strip())
+    while chunk := list(islice(numbered, CHUNK_LINES)):
+        yield chunk
+
+
+def render_jsonl(
+    entry: "PromptEntry",
+    lines: Iterable[str],
+    *,
+    check_required: bool = False,
+    jobs: int | None = None,
+) -> Iterator[tuple[bool, str]]:
+    """``(rendered, output line)`` for each input line of argument values, in input order."""
+    job = BatchJob.for_entry(entry, check_required)
+    if not jobs or jobs <= 1:
+        for chunk in _chunks(lines):
+            yield from job.render_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(job,)) as pool:
+        pending: deque = deque()
+        for chunk in _chunks(lines):
+            pending.append(pool.submit(_render_chunk, chunk))
+            if len(pending) >= jobs * CHUNKS_PER_JOB:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
@@ -8,14 +8,36 @@ from __future__ import annotations
 
 import json
 import logging
-import re
-from dataclasses import dataclass, field
+import os
+import sys
+from bisect import bisect_right
+from dataclasses import dataclass, field, fields
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, TypeVar
 
-import yaml
+from .manifest import MANIFEST_FIELDS, MANIFEST_NAME_FIELDS, Manifest
+from .parsing import load_yaml, read_body, read_markdown_head
+from .snapshot import CatalogSnapshot, SourceKey
+from .template import MissingArgumentsError, Template
+
+if TYPE_CHECKING:
+    from .complete import CompletionIndex, Completions
+    from .facets import FacetIndex, FacetResult
+    from .fuzzy import FuzzyIndex, FuzzyMatch
+    from .names import NameIndex, Resolution
+    from .query import QueryPlan
+    from .querycache import QueryCache
+    from .rendercache import RenderCache
+    from .search import SearchHit, SearchIndex
+    from .similar import SimilarHit, SimilarityIndex
+    from .store import CatalogStore
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
 # ── Constants ────────────────────────────────────────────────────────
 
 PROMPT_DIRS = [
@@ -37,7 +59,7 @@ SKILL_ORDER = ["beginner", "intermediate", "advanced", "expert"]
 # ── Data classes ─────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptEntry:
     """A single prompt loaded from a YAML file."""
 
@@ -60,10 +82,14 @@ class PromptEntry:
     chain_position: dict
     file_path: Path
     raw: dict  # full parsed YAML
+    aliases: list[str] = field(default_factory=list)  # other names it answers to
+    deprecated_ids: list[str] = field(default_factory=list)  # former IDs
+    # Compiled from ``prompt_text`` on first render; see ``template``.
+    _template: Template | None = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def from_yaml(cls, path: Path) -> "PromptEntry":
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+        data = load_yaml(path.read_text(encoding="utf-8"))
         return cls(
             id=data["id"],
             version=data.get("version", "1.0.0"),
@@ -84,53 +110,177 @@ class PromptEntry:
             chain_position=data.get("chain_position", {}),
             file_path=path,
             raw=data,
+            aliases=data.get("aliases", []),
+            deprecated_ids=data.get("deprecated_ids", []),
         )
 
+    def __getattr__(self, name: str):
+        # Only reached for unset slots: compact() drops ``raw``, and entries
+        # built without ``__init__`` (store, pack, manifest) never set
+        # ``_template``.
+        if name == "raw":
+            return load_yaml(self.read_text())
+        if name == "_template":
+            return None
+        raise AttributeError(name)
+
+    def compact(self) -> None:
+        """Intern shared strings and drop ``raw``, which is re-read on demand."""
+        self.id = sys.intern(self.id)
+        self.related_prompts = [sys.intern(r) for r in self.related_prompts]
+        self.category = sys.intern(self.category)
+        self.subcategory = sys.intern(self.subcategory)
+        self.skill_level = sys.intern(self.skill_level)
+        self.platforms = [sys.intern(p) for p in self.platforms]
+        self.tags = [sys.intern(t) for t in self.tags]
+        try:
+            del self.raw
+        except AttributeError:
+            pass
+
+    def read_text(self) -> str:
+        """The YAML source file."""
+        return self.file_path.read_text(encoding="utf-8")
+
+    @property
+    def template(self) -> Template:
+        """``prompt_text`` split into literals and variable slots, compiled once."""
+        template = self._template
+        if template is None:
+            template = self._template = Template.compile(self.prompt_text)
+        return template
+
     def extract_variable_names(self) -> list[str]:
         """Return ordered unique {{variable}} names from the prompt text."""
-        return list(dict.fromkeys(re.findall(r"\{\{(\w+)\}\}", self.prompt_text)))
+        return list(self.template.variables)
 
-    def render(self, arguments: dict[str, str] | None = None) -> str:
-        """Substitute {{variables}} with supplied values."""
-        text = self.prompt_text
-        if arguments:
-            for key, value in arguments.items():
-                text = text.replace(f"{{{{{key}}}}}", value)
-        return text
+    def required_variables(self) -> list[str]:
+        """Names of the variables declared ``required: true``."""
+        return [v["name"] for v in self.variables if v.get("required", False) and "name" in v]
 
+    def check_arguments(self, arguments: dict[str, str] | None) -> None:
+        """Raise ``MissingArgumentsError`` if a ``required`` variable has no value."""
+        missing = [n for n in self.required_variables() if not arguments or n not in arguments]
+        if missing:
+            raise MissingArgumentsError(self.id, missing)
 
-@dataclass
+    def render(self, arguments: dict[str, str] | None = None, *, check_required: bool = False) -> str:
+        """Substitute {{variables}} with supplied values.
+
+        Placeholders without a value are left as they are, unless
+        ``check_required`` is set and a ``required`` variable has no value,
+        which raises ``MissingArgumentsError``.
+        """
+        if check_required:
+            self.check_arguments(arguments)
+        return self.template.render(arguments)
+
+    def render_many(
+        self, arguments: Iterable[dict[str, str] | None], *, check_required: bool = False
+    ) -> Iterator[str]:
+        """Render once per argument set, lazily, in order.
+
+        The template is compiled once for the whole batch and nothing is
+        held between items, so ``arguments`` may be an unbounded stream.
+        See ``batch.render_jsonl`` for JSON lines and a process pool.
+        """
+        template = self.template
+        for args in arguments:
+            if check_required:
+                self.check_arguments(args)
+            yield template.render(args)
+
+
+class LazyPromptEntry(PromptEntry):
+    """A prompt built from its index.json manifest row.
+
+    Listing fields come from the manifest; the YAML file is parsed the first
+    time any other field (``prompt_text``, ``variables``, ``raw``, …) is read.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_manifest(cls, row: dict, path: Path) -> "LazyPromptEntry":
+        entry = cls.__new__(cls)
+        for name in MANIFEST_FIELDS:
+            setattr(entry, name, row[name])
+        for name in MANIFEST_NAME_FIELDS:
+            setattr(entry, name, row.get(name, []))
+        entry.file_path = path
+        return entry
+
+    def __getattr__(self, name: str):
+        # Only called for attributes that are not set yet.
+        if name not in _LAZY_FIELDS:
+            return PromptEntry.__getattr__(self, name)
+        self._hydrate()
+        return object.__getattribute__(self, name)
+
+    def _hydrate(self) -> None:
+        full = PromptEntry.from_yaml(self.file_path)
+        for f in fields(PromptEntry):
+            setattr(self, f.name, getattr(full, f.name))
+
+
+_LAZY_FIELDS = (
+    {f.name for f in fields(PromptEntry)}
+    - set(MANIFEST_FIELDS) - set(MANIFEST_NAME_FIELDS) - {"file_path", "_template"}
+)
+
+
+@dataclass(slots=True)
 class InstructionEntry:
-    """A single instruction file."""
+    """A single instruction file.
+
+    Only the frontmatter and ``<!-- Catalog Metadata -->`` block are read at
+    load time; the body stays on disk until ``read_body``/``read_text``.
+    """
 
     stem: str
     scope: str  # phases | guardrails | platforms
     file_path: Path
     name: str = ""
     description: str = ""
+    id: str = ""
+    version: str = ""
+    priority: str = ""
+    load_with: list[str] = field(default_factory=list)
+    metadata: dict[str, str] = field(default_factory=dict)  # full metadata block
+    body_offset: int = 0
 
     @classmethod
     def from_path(cls, scope: str, path: Path) -> "InstructionEntry":
-        # Parse YAML frontmatter for name/description
-        text = path.read_text(encoding="utf-8")
-        name = ""
-        description = ""
-        if text.startswith("---"):
-            end = text.index("---", 3)
-            fm = yaml.safe_load(text[3:end])
-            if fm:
-                name = fm.get("name", "")
-                description = fm.get("description", "")
+        head = read_markdown_head(path)
+        fm = head.frontmatter or {}
+        meta = head.metadata
         return cls(
             stem=path.stem,
             scope=scope,
             file_path=path,
-            name=name or path.stem,
-            description=description,
+            name=fm.get("name", "") or path.stem,
+            description=fm.get("description", ""),
+            id=meta.get("id", ""),
+            version=meta.get("version", ""),
+            priority=meta.get("priority", ""),
+            load_with=[s.strip() for s in meta.get("load_with", "").split(",") if s.strip()],
+            metadata=meta,
+            body_offset=head.body_offset,
         )
 
+    def read_text(self) -> str:
+        """The full file, frontmatter included."""
+        return self.file_path.read_text(encoding="utf-8")
 
-@dataclass
+    def read_body(self) -> str:
+        """The markdown body after the frontmatter and metadata block."""
+        return read_body(self.file_path, self.body_offset)
+
+    def compact(self) -> None:
+        self.scope = sys.intern(self.scope)
+
+
+@dataclass(slots=True)
 class StarterKit:
     """A pre-configured bundle of prompts and instructions."""
 
@@ -145,7 +295,7 @@ class StarterKit:
 
     @classmethod
     def from_yaml(cls, path: Path) -> "StarterKit":
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+        data = load_yaml(path.read_text(encoding="utf-8"))
         return cls(
             id=data["id"],
             name=data["name"],
@@ -157,6 +307,115 @@ class StarterKit:
             raw=data,
         )
 
+    def compact(self) -> None:
+        """Intern shared strings. ``raw`` is kept: kits have no source path to re-read."""
+        self.prompts = [sys.intern(p) for p in self.prompts]
+        self.instructions = [sys.intern(i) for i in self.instructions]
+        self.tags = [sys.intern(t) for t in self.tags]
+
+
+# ── Sources ──────────────────────────────────────────────────────────
+
+SOURCE_LABELS = {
+    "prompt": "prompt",
+    "instruction": "instruction",
+    "starter_kit": "starter kit",
+}
+
+
+def iter_sources(root: Path) -> Iterator[tuple[str, str, Path]]:
+    """Yield ``(kind, scope, path)`` for every catalog source file, in load order."""
+    for dir_name in PROMPT_DIRS:
+        dir_path = root / "prompts" / dir_name
+        if not dir_path.is_dir():
+            continue
+        for f in sorted(dir_path.glob("*.yaml")):
+            if f.name.startswith("_"):
+                continue
+            yield "prompt", dir_name, f
+
+    for scope in INSTRUCTION_SCOPES:
+        scope_dir = root / "instructions" / scope
+        if not scope_dir.is_dir():
+            continue
+        for f in sorted(scope_dir.glob("*.instructions.md")):
+            yield "instruction", scope, f
+
+    kits_dir = root / "starter-kits"
+    if kits_dir.is_dir():
+        for f in sorted(kits_dir.glob("*.yaml")):
+            yield "starter_kit", "", f
+
+
+def source_dirs(root: Path) -> list[Path]:
+    """Every directory ``iter_sources`` looks in, whether or not it exists."""
+    dirs = [root / "prompts" / d for d in PROMPT_DIRS]
+    dirs += [root / "instructions" / s for s in INSTRUCTION_SCOPES]
+    dirs.append(root / "starter-kits")
+    return dirs
+
+
+def classify_source(root: Path, path: Path) -> tuple[str, str] | None:
+    """Return ``(kind, scope)`` if ``path`` is a file ``iter_sources`` would yield."""
+    try:
+        parts = path.relative_to(root).parts
+    except ValueError:
+        return None
+
+    if len(parts) == 3 and parts[0] == "prompts" and parts[1] in PROMPT_DIRS:
+        if path.suffix == ".yaml" and not path.name.startswith("_"):
+            return "prompt", parts[1]
+    elif len(parts) == 3 and parts[0] == "instructions" and parts[1] in INSTRUCTION_SCOPES:
+        if path.name.endswith(".instructions.md"):
+            return "instruction", parts[1]
+    elif len(parts) == 2 and parts[0] == "starter-kits" and path.suffix == ".yaml":
+        return "starter_kit", ""
+    return None
+
+
+def parse_source(kind: str, scope: str, path: Path):
+    """Parse one source file into its catalog entry."""
+    if kind == "prompt":
+        return PromptEntry.from_yaml(path)
+    if kind == "instruction":
+        return InstructionEntry.from_path(scope, path)
+    return StarterKit.from_yaml(path)
+
+
+def _parse_job(job: tuple[str, str, Path]) -> tuple[object | None, str | None]:
+    """Parse one source, returning ``(entry, None)`` or ``(None, error)``."""
+    kind, scope, path = job
+    try:
+        return parse_source(kind, scope, path), None
+    except Exception as exc:
+        return None, str(exc)
+
+
+def _parse_all(
+    jobs: list[tuple[str, str, Path]], workers: int | None
+) -> list[tuple[object | None, str | None]]:
+    """Parse ``jobs`` in order, optionally across a process pool."""
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    if not workers or workers < 2 or len(jobs) < 2:
+        return [_parse_job(job) for job in jobs]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = min(workers, len(jobs))
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_parse_job, jobs, chunksize=chunksize))
+
+
+def _value_set(values: str | Iterable[str] | None) -> tuple[str, ...] | None:
+    """Order-insensitive cache key for a one-or-many filter value."""
+    if values is None:
+        return None
+    if isinstance(values, str):
+        return (values,)
+    return tuple(sorted(set(values)))
+
 
 # ── Catalog ──────────────────────────────────────────────────────────
 
@@ -169,49 +428,282 @@ class Catalog:
     prompts: dict[str, PromptEntry] = field(default_factory=dict)
     instructions: dict[str, InstructionEntry] = field(default_factory=dict)
     starter_kits: dict[str, StarterKit] = field(default_factory=dict)
+    # Source file → (kind, entry key), used to apply incremental reloads.
+    files: dict[Path, tuple[str, str]] = field(default_factory=dict, repr=False)
+    generation: int = 0
+    compact: bool = False
+    # Set by ``open_store``: queries run against the SQLite store.
+    store: "CatalogStore | None" = field(default=None, repr=False)
+    # Derived indexes (facets, search, …), built on first use and dropped
+    # whenever entries change.
+    _indexes: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Set by ``enable_query_cache`` and handed on to later generations.
+    query_cache: "QueryCache | None" = field(default=None, repr=False, compare=False)
+    # Set by ``enable_render_cache`` and handed on to later generations.
+    render_cache: "RenderCache | None" = field(default=None, repr=False, compare=False)
 
     @classmethod
-    def load(cls, root: str | Path) -> "Catalog":
+    def load(
+        cls,
+        root: str | Path,
+        *,
+        cache: bool = True,
+        workers: int | None = None,
+        lazy: bool = False,
+        compact: bool = False,
+        trust_index: bool = False,
+    ) -> "Catalog":
+        """Load every prompt, instruction and starter kit under ``root``.
+
+        With ``cache`` enabled, parsed entries are restored from the compiled
+        snapshot in the user's cache directory and only files whose size,
+        mtime or content changed are parsed again.
+
+        ``workers`` > 1 parses those files across a process pool (``0`` means
+        one worker per CPU). Entries are merged in the same order as a serial
+        load, and malformed files are still logged and skipped.
+
+        With ``lazy``, prompts whose ``prompts/index.json`` row still matches
+        the file are built from that row, and their YAML is only parsed when a
+        body field is first read.
+
+        ``compact`` interns repeated strings (IDs, tags, platforms, categories)
+        and drops each prompt's ``raw`` dict, which is re-read from the YAML
+        file on access. Use it when many catalogs share one process.
+
+        With ``trust_index``, an index written by ``prompt-catalog index build``
+        whose source directories are unchanged supplies the file list and
+        fingerprints: no directory is globbed and unchanged files are not
+        stat-ed. In-place edits are not detected in this mode; rebuild the
+        index after editing sources.
+        """
         root = Path(root).resolve()
-        cat = cls(root=root)
+        cat = cls(root=root, compact=compact)
+        snapshot = CatalogSnapshot.open(root) if cache else None
+        manifest = Manifest.open(root) if lazy or trust_index else None
+        trusted = manifest.trusted_sources() if trust_index and manifest else None
 
-        # Load prompts
-        for dir_name in PROMPT_DIRS:
-            dir_path = root / "prompts" / dir_name
-            if not dir_path.is_dir():
-                continue
-            for f in sorted(dir_path.glob("*.yaml")):
-                if f.name.startswith("_"):
+        if trusted is not None:
+            sources = []
+            for path, (kind, _) in trusted.items():
+                source = classify_source(root, path)
+                if source is not None and source[0] == kind:
+                    sources.append((kind, source[1], path))
+        else:
+            sources = list(iter_sources(root))
+        entries: list = [None] * len(sources)
+        keys: list = [None] * len(sources)
+        pending: list[int] = []
+        for i, (kind, _, path) in enumerate(sources):
+            try:
+                trusted_row = trusted[path][1] if trusted is not None else None
+                row = None
+                if lazy and kind == "prompt":
+                    if trusted_row is not None and all(n in trusted_row for n in MANIFEST_FIELDS):
+                        row = trusted_row
+                    elif manifest is not None:
+                        row = manifest.fresh_row(path)
+                if row is not None:
+                    entries[i] = LazyPromptEntry.from_manifest(row, path)
+                    if snapshot is not None:
+                        snapshot.retain(path)
                     continue
-                try:
-                    entry = PromptEntry.from_yaml(f)
-                    cat.prompts[entry.id] = entry
-                except Exception as exc:
-                    logger.warning("Skipping malformed prompt %s: %s", f, exc)
+                if snapshot is not None and trusted_row is not None:
+                    key = SourceKey(trusted_row["size"], trusted_row["mtime_ns"], trusted_row["sha256"])
+                    entries[i] = snapshot.lookup_trusted(path, key)
+                    keys[i] = key
+                if snapshot is not None and entries[i] is None:
+                    entries[i], keys[i] = snapshot.lookup(path)
+            except OSError as exc:
+                logger.warning("Skipping unreadable %s %s: %s", SOURCE_LABELS[kind], path, exc)
+                continue
+            if entries[i] is None:
+                pending.append(i)
 
-        # Load instructions
-        for scope in INSTRUCTION_SCOPES:
-            scope_dir = root / "instructions" / scope
-            if not scope_dir.is_dir():
+        results = _parse_all([sources[i] for i in pending], workers)
+        for i, (entry, error) in zip(pending, results):
+            kind, _, path = sources[i]
+            if error is not None:
+                logger.warning("Skipping malformed %s %s: %s", SOURCE_LABELS[kind], path, error)
                 continue
-            for f in sorted(scope_dir.glob("*.instructions.md")):
-                try:
-                    entry = InstructionEntry.from_path(scope, f)
-                    cat.instructions[entry.stem] = entry
-                except Exception as exc:
-                    logger.warning("Skipping malformed instruction %s: %s", f, exc)
+            entries[i] = entry
+            if snapshot is not None:
+                snapshot.store(path, keys[i], entry)
+
+        for (kind, _, path), entry in zip(sources, entries):
+            if entry is not None:
+                if compact:
+                    entry.compact()
+                cat._add(kind, entry, path)
+
+        if snapshot is not None:
+            logger.debug(
+                "Catalog snapshot: %d cached, %d parsed", snapshot.hits, snapshot.misses
+            )
+            snapshot.save()
+        return cat
+
+    @classmethod
+    def open_store(cls, path: str | Path) -> "Catalog":
+        """Open a catalog compiled by ``CatalogStore.build``.
+
+        Instructions and starter kits are read up front; prompts are fetched
+        from the database as they are accessed, and ``filter_prompts``,
+        ``search``, ``resolve_kit`` and ``get_chain`` run as SQL queries.
+        """
+        from .store import CatalogStore
+
+        store = CatalogStore.open(path)
+        return cls(
+            root=store.root,
+            prompts=store.prompts,
+            instructions=store.load_instructions(),
+            starter_kits=store.load_kits(),
+            store=store,
+        )
 
-        # Load starter kits
-        kits_dir = root / "starter-kits"
-        if kits_dir.is_dir():
-            for f in sorted(kits_dir.glob("*.yaml")):
+    @classmethod
+    def open_packed(cls, path: str | Path) -> "Catalog":
+        """Open a catalog written by ``prompt-catalog pack``.
+
+        The file is memory-mapped; prompt metadata, bodies and sources and
+        instruction files are decoded from it only when read, so processes
+        sharing a host share one page-cached copy.
+        """
+        from .packed import open_packed
+
+        return open_packed(path)
+
+    def reload(self, changed: Iterable[str | Path]) -> "Catalog":
+        """Return the next catalog generation with ``changed`` files re-read.
+
+        Each path may have been added, modified or deleted; only those files
+        are parsed. ``self`` is left untouched, so callers holding the old
+        generation keep a consistent view. Modified entries keep their
+        position; newly added files are appended.
+
+        A store-backed catalog is a build artifact and cannot be reloaded;
+        rebuild the store instead.
+        """
+        if self.store is not None:
+            raise ValueError(
+                f"{self.store.path} is a compiled catalog store; rebuild it with "
+                "'prompt-catalog store build' instead of reloading it"
+            )
+        new = Catalog(
+            root=self.root,
+            prompts=dict(self.prompts),
+            instructions=dict(self.instructions),
+            starter_kits=dict(self.starter_kits),
+            files=dict(self.files),
+            generation=self.generation + 1,
+            compact=self.compact,
+            query_cache=self.query_cache,
+            render_cache=self.render_cache,
+        )
+        for path in changed:
+            path = Path(path)
+            source = classify_source(self.root, path)
+            if source is None:
+                continue
+            kind, scope = source
+            entry = None
+            if path.is_file():
                 try:
-                    kit = StarterKit.from_yaml(f)
-                    cat.starter_kits[kit.id] = kit
+                    entry = parse_source(kind, scope, path)
                 except Exception as exc:
-                    logger.warning("Skipping malformed starter kit %s: %s", f, exc)
+                    logger.warning("Skipping malformed %s %s: %s", SOURCE_LABELS[kind], path, exc)
 
-        return cat
+            if entry is not None and new.compact:
+                entry.compact()
+            if path in new.files and (entry is None or new.files[path][1] != new._key(kind, entry)):
+                new._remove(path)
+            if entry is not None:
+                new._add(kind, entry, path)
+        return new
+
+    @staticmethod
+    def _key(kind: str, entry) -> str:
+        return entry.stem if kind == "instruction" else entry.id
+
+    def _entries(self, kind: str) -> dict:
+        if kind == "prompt":
+            return self.prompts
+        if kind == "instruction":
+            return self.instructions
+        return self.starter_kits
+
+    def _add(self, kind: str, entry, path: Path) -> None:
+        key = self._key(kind, entry)
+        self._entries(kind)[key] = entry
+        self.files[path] = (kind, key)
+        self._indexes.clear()
+
+    def _remove(self, path: Path) -> None:
+        kind, key = self.files.pop(path)
+        self._entries(kind).pop(key, None)
+        self._indexes.clear()
+
+    # ── Query cache ──────────────────────────────────────────────────
+
+    def enable_query_cache(
+        self, max_entries: int | None = None, max_bytes: int | None = None
+    ) -> "QueryCache":
+        """Cache filter, facet, search and suggest results from now on.
+
+        The cache is shared with every generation ``reload`` returns and is
+        emptied the first time a newer generation uses it.
+        """
+        from .querycache import DEFAULT_MAX_BYTES, DEFAULT_MAX_ENTRIES, QueryCache
+
+        self.query_cache = QueryCache(
+            DEFAULT_MAX_ENTRIES if max_entries is None else max_entries,
+            DEFAULT_MAX_BYTES if max_bytes is None else max_bytes,
+        )
+        return self.query_cache
+
+    def _cached(self, key: tuple, compute: Callable[[], T]) -> T:
+        if self.query_cache is None:
+            return compute()
+        return self.query_cache.get_or_compute(self.generation, key, compute)
+
+    # ── Render cache ─────────────────────────────────────────────────
+
+    def enable_render_cache(
+        self, max_entries: int | None = None, max_bytes: int | None = None
+    ) -> "RenderCache":
+        """Cache rendered prompts from now on (see ``render`` and ``rendered``).
+
+        Like the query cache, it is shared with every generation ``reload``
+        returns and emptied the first time a newer generation uses it.
+        """
+        from .rendercache import DEFAULT_MAX_BYTES, DEFAULT_MAX_ENTRIES, RenderCache
+
+        self.render_cache = RenderCache(
+            DEFAULT_MAX_ENTRIES if max_entries is None else max_entries,
+            DEFAULT_MAX_BYTES if max_bytes is None else max_bytes,
+        )
+        return self.render_cache
+
+    def render(
+        self, entry: PromptEntry, arguments: dict[str, str] | None = None, *, check_required: bool = False
+    ) -> str:
+        """``entry.render(arguments)``, served from the render cache when enabled."""
+        if check_required:
+            entry.check_arguments(arguments)
+        return self.rendered(entry, arguments, "text", lambda: entry.render(arguments))
+
+    def rendered(
+        self, entry: PromptEntry, arguments: dict[str, str] | None, kind: str, build: Callable[[], T]
+    ) -> T:
+        """The value ``build`` makes from rendering ``entry``, cached under ``kind``.
+
+        A hit returns the very object an earlier call built, so callers must
+        treat it as read-only.
+        """
+        if self.render_cache is None:
+            return build()
+        return self.render_cache.get_or_render(self.generation, kind, entry, arguments, build)
 
     # ── Filtering ────────────────────────────────────────────────────
 
@@ -225,31 +717,299 @@ class Catalog:
         tag: str | None = None,
         query: str | None = None,
     ) -> list[PromptEntry]:
-        results = []
-        for p in self.prompts.values():
-            if category and p.category != category:
-                continue
-            if subcategory and p.subcategory != subcategory:
-                continue
-            if skill_level:
-                max_idx = SKILL_ORDER.index(skill_level)
-                cur_idx = SKILL_ORDER.index(p.skill_level)
-                if cur_idx > max_idx:
-                    continue
-            if platform and platform not in p.platforms and "all" not in p.platforms:
-                continue
-            if tag and tag not in p.tags:
-                continue
-            if query:
-                q = query.lower()
-                searchable = f"{p.title} {p.description} {' '.join(p.tags)}".lower()
-                if q not in searchable:
-                    continue
-            results.append(p)
-        return results
+        """Prompts matching every given filter, in catalog order.
+
+        ``skill_level`` is an upper bound, and prompts targeting the ``all``
+        platform match any ``platform``. Filters run against posting lists
+        built once per catalog (see ``facets.FacetIndex``).
+        """
+        key = (
+            "filter", category, subcategory, skill_level, platform, tag,
+            query.lower() if query else None,
+        )
+        return list(self._cached(key, lambda: self._filter_prompts(
+            category=category,
+            subcategory=subcategory,
+            skill_level=skill_level,
+            platform=platform,
+            tag=tag,
+            query=query,
+        )))
+
+    def _filter_prompts(self, **filters: str | None) -> list[PromptEntry]:
+        if self.store is not None:
+            return self.store.filter_prompts(**filters)
+        return self.facet_index().filter(**filters)
+
+    def count_prompts(self, **filters: str | None) -> int:
+        """Number of prompts ``filter_prompts(**filters)`` would return."""
+        if self.store is not None:
+            return len(self.store.filter_prompts(**filters))
+        return self.facet_index().count(**filters)
+
+    def iter_prompts(
+        self,
+        *,
+        category: str | None = None,
+        subcategory: str | None = None,
+        skill_level: str | None = None,
+        platform: str | None = None,
+        tag: str | None = None,
+        query: str | None = None,
+        order: str = "id",
+        cursor: str | None = None,
+    ) -> Iterator[PromptEntry]:
+        """Stream the prompts ``filter_prompts`` matches, sorted by ``order``.
+
+        ``order`` is ``"id"`` or ``"title"``. A ``cursor`` from
+        ``paging.prompt_cursor`` (for the last prompt of a previous page, in
+        the same order) resumes right after that prompt. Prompts are yielded
+        one at a time from presorted posting lists, so the caller can print
+        the first page before the rest is read. Raises ``ValueError`` for an
+        unknown order or a malformed cursor.
+        """
+        from .paging import decode_cursor, sort_key
+
+        key = sort_key(order)
+        after = decode_cursor(cursor, order) if cursor else None
+        filters = dict(
+            category=category,
+            subcategory=subcategory,
+            skill_level=skill_level,
+            platform=platform,
+            tag=tag,
+            query=query,
+        )
+        if self.store is not None:
+            matches = sorted(self.store.filter_prompts(**filters), key=key)
+            start = 0 if after is None else bisect_right(matches, after, key=key)
+            return islice(matches, start, None)
+        return self.facet_index().iter_sorted(order, after, **filters)
+
+    def facets(
+        self,
+        *,
+        category: str | Iterable[str] | None = None,
+        subcategory: str | Iterable[str] | None = None,
+        skill_level: str | None = None,
+        platform: str | Iterable[str] | None = None,
+        tag: str | Iterable[str] | None = None,
+        query: str | None = None,
+    ) -> "FacetResult":
+        """Matching prompt IDs plus a count for every facet value.
+
+        Unlike ``filter_prompts``, category, subcategory and platform accept
+        several values (any may match) and ``tag`` several tags (all must
+        match). See ``facets.FacetIndex.facets`` for how counts are taken.
+        With a query cache the result may be shared between callers, so
+        treat it as read-only.
+        """
+        key = (
+            "facets", _value_set(category), _value_set(subcategory), skill_level,
+            _value_set(platform), _value_set(tag), query.lower() if query else None,
+        )
+        return self._cached(key, lambda: self.facet_index().facets(
+            category=category,
+            subcategory=subcategory,
+            skill_level=skill_level,
+            platform=platform,
+            tag=tag,
+            query=query,
+        ))
+
+    def name_index(self) -> "NameIndex":
+        """Every name of every prompt and kit, folded, built once per catalog."""
+        index = self._indexes.get("names")
+        if index is None:
+            from .names import NameIndex
+
+            # A store resolves prompt names in SQL; only its kits are in memory.
+            prompts = self.prompts.values() if self.store is None else ()
+            index = self._indexes["names"] = NameIndex(prompts, self.starter_kits.values())
+        return index
+
+    def lookup_prompt(self, name: str) -> "Resolution | None":
+        """How ``name`` resolves to a prompt: by ID (any case), alias or deprecated ID."""
+        if self.store is not None:
+            return self.store.lookup_prompt(name)
+        return self.name_index().prompt(name)
+
+    def find_prompt(self, name: str) -> PromptEntry | None:
+        """The prompt ``name`` resolves to (see ``lookup_prompt``), if any."""
+        found = self.lookup_prompt(name)
+        return self.prompts.get(found.key) if found is not None else None
+
+    def find_kit(self, name: str) -> StarterKit | None:
+        """The starter kit called ``name`` in any case, or by one of its aliases."""
+        found = self.name_index().kit(name)
+        return self.starter_kits.get(found.key) if found is not None else None
+
+    def facet_index(self) -> "FacetIndex":
+        """Posting lists over the current prompts, built once per catalog."""
+        index = self._indexes.get("facets")
+        if index is None:
+            from .facets import FacetIndex
+
+            index = self._indexes["facets"] = FacetIndex(self.prompts.values())
+        return index
+
+    def search_index(self) -> "SearchIndex":
+        """BM25 index over the current prompts, built on the first search."""
+        index = self._indexes.get("search")
+        if index is None:
+            from .search import SearchIndex
+
+            index = self._indexes["search"] = SearchIndex(self.prompts.values())
+        return index
+
+    def fuzzy_index(self) -> "FuzzyIndex":
+        """Trigram index over prompt IDs, titles, tags and kit IDs."""
+        index = self._indexes.get("fuzzy")
+        if index is None:
+            from .fuzzy import FuzzyIndex
+
+            index = self._indexes["fuzzy"] = FuzzyIndex(
+                self.prompts.values(), self.starter_kits.values()
+            )
+        return index
+
+    def suggest(
+        self, name: str, *, kinds: Iterable[str] | None = None, limit: int = 5
+    ) -> list["FuzzyMatch"]:
+        """Names close to ``name`` ("did you mean"), closest first.
+
+        ``kinds`` limits the match to ``"id"``, ``"title"``, ``"tag"`` and/or
+        ``"kit"``; the number of typos tolerated grows with ``name``'s length.
+        """
+        key = ("suggest", name.strip().lower(), _value_set(kinds) or None, limit)
+        return list(self._cached(
+            key, lambda: self.fuzzy_index().lookup(name, kinds=kinds, limit=limit)
+        ))
+
+    def completion_index(self) -> "CompletionIndex":
+        """Sorted prefix arrays over prompt IDs, tags, kit IDs and argument values."""
+        index = self._indexes.get("complete")
+        if index is None:
+            from .complete import CompletionIndex
+
+            index = self._indexes["complete"] = CompletionIndex(
+                self.prompts.values(), self.starter_kits.values()
+            )
+        return index
+
+    def complete(self, kind: str, prefix: str = "", limit: int = 20) -> "Completions":
+        """Names starting with ``prefix`` (any case), most used first.
+
+        ``kind`` is ``"id"``, ``"tag"``, ``"kit"`` or ``"category"``; see
+        ``complete.CompletionIndex`` for how names are ranked.
+        """
+        return self.completion_index().complete(kind, prefix, limit)
+
+    def complete_argument(
+        self, prompt_id: str, name: str, prefix: str = "", limit: int = 20
+    ) -> "Completions":
+        """Values for argument ``name`` of a prompt, starting with ``prefix``.
+
+        Values come from the ``examples`` and ``default`` of that prompt's
+        variable first, then of same-named variables in other prompts.
+        ``prompt_id`` may be any name ``find_prompt`` accepts.
+        """
+        entry = self.find_prompt(prompt_id)
+        if entry is None:
+            from .complete import Completions
+
+            return Completions([], 0)
+        return self.completion_index().complete_argument(entry, name, prefix, limit)
+
+    def search(self, query: str, limit: int | None = None) -> list[PromptEntry]:
+        """Search prompts by keyword, best match first."""
+        return [hit.prompt for hit in self.search_hits(query, limit)]
+
+    def search_hits(self, query: str, limit: int | None = None) -> list["SearchHit"]:
+        """Ranked full-text search with BM25 scores.
+
+        Every term in ``query`` must appear in the prompt's ID, title,
+        description, tags, body, quality criteria or anti-patterns; the last
+        term may also be a prefix. Matches are scored with field-boosted
+        BM25 (see ``search.SearchIndex``), or by the SQLite store's FTS5
+        index when the catalog was opened with ``open_store``.
+        """
+        if self.store is not None:
+            return list(self._cached(
+                ("search", query, limit), lambda: self.store.search_hits(query, limit)
+            ))
+        from .search import tokenize
+
+        # The index only sees the distinct terms, the last one as a prefix.
+        key = ("search", tuple(dict.fromkeys(tokenize(query))), limit)
+        return list(self._cached(key, lambda: self.search_index().search(query, limit)))
+
+    def query(self, text: str, limit: int | None = None) -> list["SearchHit"]:
+        """Prompts matching a boolean query, best first.
+
+        ``text`` combines facet terms (``category:testing``, ``skill<=advanced``),
+        words and quoted phrases with ``AND``, ``OR``, ``NOT`` and parentheses;
+        see ``prompt_catalog_mcp.query`` for the syntax. A query of plain
+        words returns the same hits as ``search_hits``. Raises
+        ``query.QuerySyntaxError`` (a ``ValueError``) for malformed queries.
+        """
+        return list(self.query_plan(text, limit).hits)
+
+    def query_plan(self, text: str, limit: int | None = None) -> "QueryPlan":
+        """Run a boolean query and return its plan, hits and match count.
+
+        ``plan.explain()`` shows each step with its estimated and actual
+        cardinality. Store-backed catalogs run the query as SQL against the
+        store's tables and FTS5 index (see ``CatalogStore.query_plan``).
+        """
+        from .query import QueryEngine, parse
+
+        key = ("query", str(parse(text)), limit)
+        if self.store is not None:
+            return self._cached(key, lambda: self.store.query_plan(text, limit))
+        return self._cached(
+            key, lambda: QueryEngine(self.facet_index(), self.search_index()).run(text, limit)
+        )
+
+    def iter_search(self, query: str, cursor: str | None = None) -> Iterator["SearchHit"]:
+        """Stream ``search_hits(query)``, resuming after a ``paging.hit_cursor``.
+
+        Ranking needs every match's score, so the full ranking is computed
+        (and, with a query cache, kept) once; later pages reuse it.
+        """
+        hits = self.search_hits(query)
+        if not cursor:
+            return iter(hits)
+        from .paging import resume_hits
+
+        return islice(hits, resume_hits(hits, cursor), None)
+
+    def similarity_index(self) -> "SimilarityIndex":
+        """Hashed TF-IDF vectors over the current prompts (requires NumPy)."""
+        index = self._indexes.get("similar")
+        if index is None:
+            from .similar import SimilarityIndex
+
+            index = self._indexes["similar"] = SimilarityIndex(self.prompts.values())
+        return index
+
+    def similar(self, query: str, limit: int = 5) -> list["SimilarHit"]:
+        """Prompts most like a prompt ID or a piece of text, closest first.
+
+        Unlike ``search`` no word has to match exactly: prompts are compared
+        as TF-IDF vectors (see ``similar.SimilarityIndex``). Raises
+        ``ImportError`` when NumPy is not installed.
+        """
+        entry = self.find_prompt(query)
+        if entry is not None:
+            query = entry.id
+        key = ("similar", query.strip().lower(), limit)
+        return list(self._cached(key, lambda: self.similarity_index().similar(query, limit)))
 
     def get_chain(self, start_id: str) -> list[PromptEntry]:
         """Walk a prompt chain forward from the given prompt ID."""
+        if self.store is not None:
+            return self.store.get_chain(start_id)
         chain = []
         visited = set()
         current_id = start_id
@@ -267,6 +1027,8 @@ class Catalog:
 
     def resolve_kit(self, kit_id: str) -> tuple[list[PromptEntry], list[InstructionEntry]]:
         """Resolve a starter kit into its constituent prompts and instructions."""
+        if self.store is not None:
+            return self.store.resolve_kit(kit_id)
         kit = self.starter_kits.get(kit_id)
         if not kit:
             raise ValueError(f"Starter kit not found: {kit_id}")
@@ -2,32 +2,62 @@
 Prompt Catalog CLI.
 
 Usage:
-    prompt-catalog list [--category CAT] [--platform PLAT] [--skill LEVEL] [--tag TAG]
-    prompt-catalog search QUERY
+    prompt-catalog list [--category CAT] [--platform PLAT] [--skill LEVEL] [--tag TAG] [--json]
+                        [--order id|title] [-n N] [--offset N] [--cursor CURSOR]
+    prompt-catalog search QUERY [-n N] [--offset N] [--cursor CURSOR]
     prompt-catalog show PROMPT_ID
+    prompt-catalog render PROMPT_ID [-a NAME=VALUE ...] [--strict]
+    prompt-catalog render PROMPT_ID --batch ARGS.jsonl [--out OUT.jsonl] [--jobs N]
+    prompt-catalog suggest NAME [--kind KIND] [-n N]
+    prompt-catalog similar PROMPT_ID|TEXT [-n N]   # Needs the [similar] extra
     prompt-catalog kit list
     prompt-catalog kit show KIT_ID
     prompt-catalog kit export KIT_ID [--output DIR]
     prompt-catalog start                     # Interactive guided mode
-    prompt-catalog serve                     # Start MCP server
+    prompt-catalog serve [--watch]           # Start MCP server
+    prompt-catalog --workers N COMMAND       # Parse the catalog across N processes
+    prompt-catalog index build [--check]     # Regenerate prompts/index.json
+    prompt-catalog store build [--output DB]  # Compile the catalog into SQLite
+    prompt-catalog --store DB COMMAND        # Query a compiled SQLite store
+    prompt-catalog pack [--output FILE]      # Write a memory-mapped packed catalog
+    prompt-catalog --packed FILE COMMAND     # Serve/query a packed catalog
+    prompt-catalog dev gen-catalog --prompts N --kits M --output DIR
+    eval "$(_PROMPT_CATALOG_COMPLETE=bash_source prompt-catalog)"  # TAB completion
 """
 
 from __future__ import annotations
 
 import os
 import sys
+from itertools import islice
 from pathlib import Path
 
+from typing import TYPE_CHECKING, Iterable, Iterator
+
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.prompt import Prompt as RichPrompt
-from rich.syntax import Syntax
 
-from .catalog import Catalog, SKILL_ORDER
+from . import __version__
+
+if TYPE_CHECKING:
+    from .catalog import Catalog
+
+# Heavy modules (rich, the catalog loader and its YAML parser, the MCP stack)
+# are imported inside the commands that use them: editors run this CLI for
+# shell completion, so ``--help`` and friends must start fast.
+
+
+class _LazyConsole:
+    """Stands in for the shared ``rich`` console until something is printed."""
 
-console = Console()
+    def __getattr__(self, name: str):
+        from rich.console import Console
+
+        global console
+        console = Console()
+        return getattr(console, name)
+
+
+console = _LazyConsole()
 
 
 def _find_catalog_root() -> Path:
@@ -49,19 +79,163 @@ def _find_catalog_root() -> Path:
     return cwd
 
 
-def _load_catalog() -> Catalog:
-    root = _find_catalog_root()
-    return Catalog.load(root)
+def _load_catalog(*, lazy: bool = False) -> Catalog:
+    from .catalog import Catalog
+
+    ctx = click.get_current_context(silent=True)
+    params = ctx.find_root().params if ctx else {}
+    if params.get("store"):
+        return Catalog.open_store(params["store"])
+    if params.get("packed"):
+        return Catalog.open_packed(params["packed"])
+    return Catalog.load(_find_catalog_root(), workers=params.get("workers"), lazy=lazy)
+
+
+# Completions offered per TAB press.
+COMPLETION_LIMIT = 50
+
+
+def _completer(kind: str):
+    """A ``shell_complete`` callback offering catalog names of ``kind``, most used first."""
+
+    def complete(ctx: click.Context, param: click.Parameter, incomplete: str) -> list:
+        from click.shell_completion import CompletionItem
+
+        try:
+            with ctx:
+                catalog = _load_catalog(lazy=True)
+            found = catalog.complete(kind, incomplete, COMPLETION_LIMIT)
+        except Exception:
+            # A broken catalog must not spill a traceback into the shell.
+            return []
+        return [CompletionItem(value) for value in found.values]
+
+    return complete
+
+
+# Rows per rich table when streaming long listings.
+STREAM_CHUNK = 100
+
+
+class _Page:
+    """Yields at most ``limit`` items after ``offset``, noting where the page ended."""
+
+    def __init__(self, items: Iterable, offset: int = 0, limit: int | None = None):
+        self._items = islice(items, offset, None)
+        self.limit = limit
+        self.last = None
+        self.more = False
+
+    def __iter__(self) -> Iterator:
+        for n, item in enumerate(self._items):
+            if self.limit is not None and n == self.limit:
+                self.more = True
+                return
+            self.last = item
+            yield item
+
+
+def _stream_table(title: str, columns: list[tuple[str, dict]], rows: Iterable[tuple[str, ...]]) -> int:
+    """Print ``rows`` as a table, ``STREAM_CHUNK`` rows at a time; returns the row count.
+
+    Every chunk gets the same column widths, so later chunks line up under
+    the first without holding every row in memory: columns with a ``ratio``
+    share the terminal width left over by the others, which are sized to fit
+    the first chunk.
+    """
+    from rich import box
+    from rich.table import Table
+
+    rows = iter(rows)
+    widths: list[int | None] = []
+    count = 0
+    while chunk := list(islice(rows, STREAM_CHUNK)):
+        if not widths:
+            for i, (name, opts) in enumerate(columns):
+                width = max([len(name)] + [len(row[i]) for row in chunk])
+                widths.append(None if "ratio" in opts else width)
+        table = Table(
+            title=title if not count else None,
+            show_header=not count,
+            box=box.SIMPLE_HEAD,
+            show_edge=False,
+            expand=True,
+        )
+        for (name, opts), width in zip(columns, widths):
+            table.add_column(name, width=width, **opts)
+        for row in chunk:
+            table.add_row(*row)
+        console.print(table)
+        count += len(chunk)
+    return count
+
+
+def _echo_json_array(items: Iterable) -> None:
+    """Write ``items`` as an indented JSON array, one element at a time."""
+    import json
+    import textwrap
+
+    first = True
+    for item in items:
+        click.echo("[\n" if first else ",\n", nl=False)
+        click.echo(textwrap.indent(json.dumps(item, indent=2), "  "), nl=False)
+        first = False
+    click.echo("[]" if first else "\n]")
 
 
 # ── Main Group ───────────────────────────────────────────────────────
 
 
+def _did_you_mean(catalog: Catalog, name: str, kinds: tuple[str, ...]) -> None:
+    """Print the closest catalog names to a lookup that missed."""
+    keys = list(dict.fromkeys(m.key for m in catalog.suggest(name, kinds=kinds, limit=3)))
+    if keys:
+        console.print(f"[dim]Did you mean: {', '.join(keys)}?[/dim]")
+
+
+def _print_version(ctx: click.Context, param: click.Parameter, value: bool) -> None:
+    if not value or ctx.resilient_parsing:
+        return
+    from .parsing import YAML_BACKEND
+
+    click.echo(f"prompt-catalog {__version__} (YAML backend: {YAML_BACKEND})")
+    ctx.exit()
+
+
 @click.group(invoke_without_command=True)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=0),
+    envvar="PROMPT_CATALOG_WORKERS",
+    help="Parse catalog files across N processes (0 = one per CPU)",
+)
+@click.option(
+    "--store",
+    type=click.Path(dir_okay=False),
+    envvar="PROMPT_CATALOG_STORE",
+    help="Query a SQLite store built by 'prompt-catalog store build'",
+)
+@click.option(
+    "--packed",
+    type=click.Path(dir_okay=False),
+    envvar="PROMPT_CATALOG_PACK",
+    help="Read a packed catalog written by 'prompt-catalog pack'",
+)
+@click.option(
+    "--version",
+    is_flag=True,
+    expose_value=False,
+    is_eager=True,
+    callback=_print_version,
+    help="Show the version and exit.",
+)
 @click.pass_context
-def main(ctx):
+def main(ctx, workers, store, packed):
     """Prompt Catalog — AI-assisted software development prompt library."""
     if ctx.invoked_subcommand is None:
+        from rich.panel import Panel
+
         console.print(
             Panel(
                 "[bold]Prompt Catalog[/bold] — open-source prompt library for AI-assisted development\n\n"
@@ -84,43 +258,69 @@ def main(ctx):
 
 
 @main.command("list")
-@click.option("--category", "-c", help="Filter by category (planning, architecture, development, etc.)")
+@click.option(
+    "--category", "-c", shell_complete=_completer("category"),
+    help="Filter by category (planning, architecture, development, etc.)",
+)
 @click.option("--platform", "-p", help="Filter by platform (web, windows, linux, android, ios, cloud)")
 @click.option("--skill", "-s", help="Max skill level (beginner, intermediate, advanced, expert)")
-@click.option("--tag", "-t", help="Filter by tag")
+@click.option("--tag", "-t", shell_complete=_completer("tag"), help="Filter by tag")
 @click.option("--domain", "-d", is_flag=True, help="Show only domain prompts")
-def list_prompts(category, platform, skill, tag, domain):
-    """List prompts with optional filtering."""
-    catalog = _load_catalog()
+@click.option("--json", "json_out", is_flag=True, help="Output results as JSON")
+@click.option("--order", type=click.Choice(["id", "title"]), default="id", show_default=True, help="Sort order")
+@click.option("--limit", "-n", type=click.IntRange(min=1), default=None, help="Show at most N prompts")
+@click.option("--offset", type=click.IntRange(min=0), default=0, help="Skip the first N matches")
+@click.option("--cursor", help="Continue after the page that printed this cursor")
+def list_prompts(category, platform, skill, tag, domain, json_out, order, limit, offset, cursor):
+    """List prompts with optional filtering.
+
+    Rows are printed as they are read, so long listings start at once. With
+    --limit, the last line gives a --cursor for the next page.
+    """
+    from .paging import prompt_cursor
+
+    catalog = _load_catalog(lazy=True)
 
     if domain:
         category = "domains"
 
-    results = catalog.filter_prompts(
-        category=category,
-        skill_level=skill,
-        platform=platform,
-        tag=tag,
-    )
+    filters = dict(category=category, skill_level=skill, platform=platform, tag=tag)
+    try:
+        page = _Page(catalog.iter_prompts(**filters, order=order, cursor=cursor), offset, limit)
+    except ValueError as exc:
+        console.print(f"[red]{exc}[/red]")
+        sys.exit(1)
 
-    if not results:
-        console.print("[yellow]No prompts match your filters.[/yellow]")
+    if json_out:
+        fields = ("id", "title", "category", "subcategory", "skill_level", "platforms", "tags")
+        _echo_json_array({name: getattr(p, name) for name in fields} for p in page)
+        if page.more:
+            click.echo(f"next cursor: {prompt_cursor(page.last, order)}", err=True)
         return
 
-    table = Table(title=f"Prompts ({len(results)} found)", show_lines=False)
-    table.add_column("ID", style="cyan", no_wrap=True)
-    table.add_column("Title", style="white")
-    table.add_column("Category", style="green")
-    table.add_column("Skill", style="yellow")
-    table.add_column("Platforms", style="dim")
-
-    for p in sorted(results, key=lambda x: x.id):
-        platforms = ", ".join(p.platforms[:3])
-        if len(p.platforms) > 3:
-            platforms += "…"
-        table.add_row(p.id, p.title, p.category, p.skill_level, platforms)
+    total = catalog.count_prompts(**filters)
+    if not total:
+        console.print("[yellow]No prompts match your filters.[/yellow]")
+        return
 
-    console.print(table)
+    def rows() -> Iterator[tuple[str, ...]]:
+        for p in page:
+            platforms = ", ".join(p.platforms[:3])
+            if len(p.platforms) > 3:
+                platforms += "…"
+            yield p.id, p.title, p.category, p.skill_level, platforms
+
+    columns = [
+        ("ID", {"style": "cyan", "no_wrap": True}),
+        ("Title", {"style": "white", "ratio": 3}),
+        ("Category", {"style": "green"}),
+        ("Skill", {"style": "yellow"}),
+        ("Platforms", {"style": "dim", "ratio": 2}),
+    ]
+    if not _stream_table(f"Prompts ({total} found)", columns, rows()):
+        console.print("[yellow]No more prompts.[/yellow]")
+    if page.more:
+        console.print(f"[dim]Next page: --cursor {prompt_cursor(page.last, order)}[/dim]", soft_wrap=True)
 
 
 # ── search ───────────────────────────────────────────────────────────
@@ -128,25 +328,126 @@ def list_prompts(category, platform, skill, tag, domain):
 
 @main.command("search")
 @click.argument("query")
-def search_prompts(query):
-    """Search prompts by keyword in title, description, and tags."""
+@click.option("--limit", "-n", type=click.IntRange(min=1), default=None, help="Show only the N best matches")
+@click.option("--offset", type=click.IntRange(min=0), default=0, help="Skip the N best matches")
+@click.option("--cursor", help="Continue after the page that printed this cursor")
+@click.option("--explain", is_flag=True, help="Print the query plan with estimated and actual sizes")
+def search_prompts(query, limit, offset, cursor, explain):
+    """Search prompts, best match first.
+
+    Every word must appear in the prompt's ID, title, description, tags or
+    body; the last word also matches as a prefix. QUERY may also use facet
+    terms (category:, subcategory:, platform:, tag:, skill<=LEVEL), "quoted
+    phrases", AND, OR, NOT and parentheses, e.g.
+
+    \b
+        category:testing AND (platform:web OR platform:cloud) "load test"
+
+    With --limit, the last line gives a --cursor for the next page.
+    """
+    from .paging import hit_cursor, resume_hits
+
     catalog = _load_catalog()
-    results = catalog.filter_prompts(query=query)
+    try:
+        # Without a cursor, one extra hit tells whether another page follows.
+        top = None if cursor or limit is None else offset + limit + 1
+        plan = catalog.query_plan(query, top)
+        hits = plan.hits
+        start = resume_hits(hits, cursor) if cursor else 0
+        page = _Page(islice(hits, start, None), offset, limit)
+        hits = list(page)
+    except ValueError as exc:
+        console.print(f"[red]{exc}[/red]")
+        sys.exit(1)
 
-    if not results:
+    if explain:
+        console.print(plan.explain(), markup=False, highlight=False)
+
+    if not hits:
         console.print(f"[yellow]No prompts match '{query}'.[/yellow]")
         return
 
-    table = Table(title=f"Search results for '{query}' ({len(results)} found)")
+    def rows() -> Iterator[tuple[str, ...]]:
+        for hit in hits:
+            p = hit.prompt
+            desc = p.description[:50] + "…" if len(p.description) > 50 else p.description
+            yield p.id, p.title, p.category, desc, f"{hit.score:.2f}"
+
+    columns = [
+        ("ID", {"style": "cyan", "no_wrap": True}),
+        ("Title", {"style": "white", "ratio": 1}),
+        ("Category", {"style": "green"}),
+        ("Description", {"style": "dim", "ratio": 1}),
+        ("Score", {"style": "magenta", "justify": "right"}),
+    ]
+    _stream_table(f"Search results for '{query}' ({plan.total} found)", columns, rows())
+    if page.more:
+        console.print(f"[dim]Next page: --cursor {hit_cursor(page.last)}[/dim]", soft_wrap=True)
+
+
+# ── suggest ──────────────────────────────────────────────────────────
+
+
+@main.command("suggest")
+@click.argument("name")
+@click.option(
+    "--kind", "kinds", multiple=True, type=click.Choice(["id", "title", "tag", "kit"]),
+    help="Only match this kind of name (repeatable)",
+)
+@click.option("--limit", "-n", type=int, default=5, show_default=True, help="Maximum suggestions")
+def suggest_names(name, kinds, limit):
+    """Suggest prompt IDs, titles, tags and kits close to a misspelled NAME."""
+    from rich.table import Table
+
+    catalog = _load_catalog()
+    matches = catalog.suggest(name, kinds=kinds or None, limit=limit)
+    if not matches:
+        console.print(f"[yellow]Nothing close to '{name}'.[/yellow]")
+        return
+
+    table = Table(title=f"Did you mean '{name}'?")
+    table.add_column("Kind", style="green")
+    table.add_column("Name", style="cyan")
+    table.add_column("Prompt / Kit", style="white")
+    table.add_column("Edits", justify="right")
+    for m in matches:
+        table.add_row(m.kind, m.text, m.key if m.kind != "tag" else "", str(m.distance))
+    console.print(table)
+
+
+# ── similar ──────────────────────────────────────────────────────────
+
+
+@main.command("similar")
+@click.argument("query", shell_complete=_completer("id"))
+@click.option("--limit", "-n", type=int, default=5, show_default=True, help="Maximum results")
+def similar_prompts(query, limit):
+    """Find prompts similar to a prompt ID or a description (QUERY).
+
+    Prompts are compared as TF-IDF vectors, so they need not share the exact
+    words. Requires NumPy: pip install 'prompt-catalog[similar]'.
+    """
+    from rich.table import Table
+
+    catalog = _load_catalog()
+    try:
+        hits = catalog.similar(query, limit)
+    except ImportError as exc:
+        console.print(f"[red]{exc}[/red]")
+        sys.exit(1)
+
+    if not hits:
+        console.print(f"[yellow]No prompts similar to '{query}'.[/yellow]")
+        return
+
+    table = Table(title=f"Prompts similar to '{query}'")
     table.add_column("ID", style="cyan", no_wrap=True)
     table.add_column("Title", style="white")
     table.add_column("Category", style="green")
-    table.add_column("Description", style="dim", max_width=50)
-
-    for p in results:
-        desc = p.description[:50] + "…" if len(p.description) > 50 else p.description
-        table.add_row(p.id, p.title, p.category, desc)
-
+    table.add_column("Similarity", style="magenta", justify="right")
+    for hit in hits:
+        p = hit.prompt
+        table.add_row(p.id, p.title, p.category, f"{hit.score:.2f}")
     console.print(table)
 
 
@@ -154,25 +455,29 @@ def search_prompts(query):
 
 
 @main.command("show")
-@click.argument("prompt_id")
+@click.argument("prompt_id", shell_complete=_completer("id"))
 @click.option("--raw", is_flag=True, help="Show raw YAML content")
 def show_prompt(prompt_id, raw):
     """Show full details for a specific prompt."""
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+    from rich.table import Table
+
     catalog = _load_catalog()
 
-    # Case-insensitive match
-    entry = None
-    for p in catalog.prompts.values():
-        if p.id.lower() == prompt_id.lower():
-            entry = p
-            break
+    # Any case, an alias or a deprecated ID
+    found = catalog.lookup_prompt(prompt_id)
+    entry = catalog.prompts.get(found.key) if found else None
 
     if not entry:
         console.print(f"[red]Prompt not found: {prompt_id}[/red]")
+        _did_you_mean(catalog, prompt_id, ("id", "title"))
         sys.exit(1)
+    if found.via == "deprecated":
+        console.print(f"[yellow]{prompt_id} is deprecated; it is now {entry.id}.[/yellow]")
 
     if raw:
-        content = entry.file_path.read_text(encoding="utf-8")
+        content = entry.read_text()
         console.print(Syntax(content, "yaml", theme="monokai", line_numbers=True))
         return
 
@@ -229,6 +534,63 @@ def show_prompt(prompt_id, raw):
             console.print(f"[dim]→ Next:[/dim] {', '.join(nxt)}")
 
 
+def _parse_assignment(ctx: click.Context, param: click.Parameter, values: tuple[str, ...]) -> dict[str, str]:
+    arguments = {}
+    for value in values:
+        name, sep, text = value.partition("=")
+        if not sep or not name:
+            raise click.BadParameter(f"expected NAME=VALUE, got {value!r}")
+        arguments[name] = text
+    return arguments
+
+
+@main.command("render")
+@click.argument("prompt_id", shell_complete=_completer("id"))
+@click.option("--arg", "-a", "arguments", multiple=True, callback=_parse_assignment, metavar="NAME=VALUE",
+              help="A variable value (repeatable)")
+@click.option("--batch", "-b", type=click.File("r", encoding="utf-8", errors="surrogateescape"),
+              help="JSON lines of argument objects to render, one output line each ('-' for stdin)")
+@click.option("--out", "-o", type=click.File("w", encoding="utf-8", lazy=True), default="-",
+              help="Write output here instead of stdout")
+@click.option("--jobs", "-j", type=click.IntRange(min=1), default=1, show_default=True,
+              help="Render --batch chunks in N processes")
+@click.option("--strict", is_flag=True, help="Fail when a required variable has no value")
+def render_prompt(prompt_id, arguments, batch, out, jobs, strict):
+    """Fill in a prompt's variables and print the result.
+
+    With --batch, each input line is a JSON object of variable values and
+    each output line is {"line", "arguments", "text"}, or {"line",
+    "arguments", "error"} when that line could not be rendered. Input is
+    streamed, so batches of any length render in constant memory.
+    """
+    from .batch import render_jsonl
+    from .template import MissingArgumentsError
+
+    catalog = _load_catalog(lazy=True)
+    entry = catalog.find_prompt(prompt_id)
+    if not entry:
+        console.print(f"[red]Prompt not found: {prompt_id}[/red]")
+        _did_you_mean(catalog, prompt_id, ("id", "title"))
+        sys.exit(1)
+
+    if batch is None:
+        try:
+            out.write(catalog.render(entry, arguments, check_required=strict) + "\n")
+        except MissingArgumentsError as exc:
+            console.print(f"[red]{exc}[/red]")
+            sys.exit(1)
+        return
+
+    total = errors = 0
+    for ok, line in render_jsonl(entry, batch, check_required=strict, jobs=jobs):
+        out.write(line + "\n")
+        total += 1
+        errors += not ok
+    click.echo(f"Rendered {total - errors} of {total} argument sets ({errors} errors)", err=True)
+    if errors:
+        sys.exit(1)
+
+
 # ── kit ──────────────────────────────────────────────────────────────
 
 
@@ -241,6 +603,8 @@ def kit_group():
 @kit_group.command("list")
 def kit_list():
     """List all available starter kits."""
+    from rich.table import Table
+
     catalog = _load_catalog()
 
     if not catalog.starter_kits:
@@ -267,21 +631,17 @@ def kit_list():
 
 
 @kit_group.command("show")
-@click.argument("kit_id")
+@click.argument("kit_id", shell_complete=_completer("kit"))
 def kit_show(kit_id):
     """Show details and contents of a starter kit."""
-    catalog = _load_catalog()
+    from rich.panel import Panel
 
-    kit = catalog.starter_kits.get(kit_id)
-    if not kit:
-        # Try case-insensitive
-        for k in catalog.starter_kits.values():
-            if k.id.lower() == kit_id.lower():
-                kit = k
-                break
+    catalog = _load_catalog()
 
+    kit = catalog.find_kit(kit_id)
     if not kit:
         console.print(f"[red]Starter kit not found: {kit_id}[/red]")
+        _did_you_mean(catalog, kit_id, ("kit",))
         console.print("[dim]Run 'prompt-catalog kit list' to see available kits.[/dim]")
         sys.exit(1)
 
@@ -313,21 +673,16 @@ def kit_show(kit_id):
 
 
 @kit_group.command("export")
-@click.argument("kit_id")
+@click.argument("kit_id", shell_complete=_completer("kit"))
 @click.option("--output", "-o", default=".", help="Output directory")
 def kit_export(kit_id, output):
     """Export a starter kit's prompts and instructions to a directory."""
     catalog = _load_catalog()
 
-    kit = catalog.starter_kits.get(kit_id)
-    if not kit:
-        for k in catalog.starter_kits.values():
-            if k.id.lower() == kit_id.lower():
-                kit = k
-                break
-
+    kit = catalog.find_kit(kit_id)
     if not kit:
         console.print(f"[red]Starter kit not found: {kit_id}[/red]")
+        _did_you_mean(catalog, kit_id, ("kit",))
         sys.exit(1)
 
     out_dir = Path(output).resolve() / kit.id
@@ -341,7 +696,7 @@ def kit_export(kit_id, output):
         p = catalog.prompts.get(pid)
         if p:
             dest = prompts_dir / p.file_path.name
-            dest.write_text(p.file_path.read_text(encoding="utf-8"), encoding="utf-8")
+            dest.write_text(p.read_text(), encoding="utf-8")
             count += 1
 
     # Export instructions
@@ -352,7 +707,7 @@ def kit_export(kit_id, output):
         inst = catalog.instructions.get(iid)
         if inst:
             dest = inst_dir / inst.file_path.name
-            dest.write_text(inst.file_path.read_text(encoding="utf-8"), encoding="utf-8")
+            dest.write_text(inst.read_text(), encoding="utf-8")
             inst_count += 1
 
     console.print(
@@ -367,6 +722,11 @@ def kit_export(kit_id, output):
 @main.command("start")
 def interactive_start():
     """Interactive guided mode — answer questions, get the right prompts."""
+    from rich.panel import Panel
+    from rich.prompt import Prompt as RichPrompt
+
+    from .catalog import SKILL_ORDER
+
     catalog = _load_catalog()
 
     console.print(
@@ -533,6 +893,8 @@ def interactive_start():
 @click.option("--json-output", "json_out", is_flag=True, help="Output results as JSON")
 def validate(check_prompts, check_instructions, check_index, check_kits, json_out):
     """Validate prompts, instructions, index, and starter kits."""
+    from rich.panel import Panel
+
     from .validator import validate_all, validate_prompts as vp, validate_instructions as vi
     from .validator import validate_index as vidx, validate_kits as vk
 
@@ -622,13 +984,159 @@ def validate(check_prompts, check_instructions, check_index, check_kits, json_ou
 
 
 @main.command("serve")
-def serve():
+@click.option("--watch", is_flag=True, help="Reload changed catalog files without restarting")
+@click.pass_context
+def serve(ctx, watch):
     """Start the MCP server (stdio transport)."""
+    params = ctx.find_root().params
+    if watch and (params.get("store") or params.get("packed")):
+        raise click.UsageError(
+            "--watch cannot be combined with --store or --packed; "
+            "rebuild the store or pack after editing the sources"
+        )
     os.environ.setdefault("CATALOG_ROOT", str(_find_catalog_root()))
+    if watch:
+        os.environ["PROMPT_CATALOG_WATCH"] = "1"
+    if params.get("workers") is not None:
+        os.environ["PROMPT_CATALOG_WORKERS"] = str(params["workers"])
+    if params.get("store"):
+        os.environ["PROMPT_CATALOG_STORE"] = str(Path(params["store"]).resolve())
+    if params.get("packed"):
+        os.environ["PROMPT_CATALOG_PACK"] = str(Path(params["packed"]).resolve())
     from .server import main as server_main
 
     server_main()
 
 
+# ── index ────────────────────────────────────────────────────────────
+
+
+@main.group("index")
+def index_group():
+    """Maintain prompts/index.json."""
+    pass
+
+
+@index_group.command("build")
+@click.option("--check", is_flag=True, help="Exit 1 if the index is out of date instead of writing it")
+def index_build(check):
+    """Regenerate prompts/index.json from the catalog sources."""
+    from .indexer import build_index, index_content, read_index, write_index
+
+    root = _find_catalog_root()
+    build = build_index(root)
+    for error in build.errors:
+        console.print(f"[red]✗[/red] {error}")
+
+    if check:
+        # Mtimes differ after a fresh clone or a touch; only content counts.
+        if index_content(build.index) != index_content(read_index(root)):
+            console.print("[red]✗ prompts/index.json is out of date; run 'prompt-catalog index build'[/red]")
+            sys.exit(1)
+        console.print("[green]✓ prompts/index.json is up to date[/green]")
+        sys.exit(1 if build.errors else 0)
+
+    written = write_index(root, build.index)
+    console.print(
+        f"[green]✓[/green] {'Wrote' if written else 'Unchanged:'} prompts/index.json "
+        f"({build.parsed} parsed, {build.reused} reused)"
+    )
+    sys.exit(1 if build.errors else 0)
+
+
+# ── store ────────────────────────────────────────────────────────────
+
+
+@main.group("store")
+def store_group():
+    """Compile the catalog into a SQLite store."""
+    pass
+
+
+@store_group.command("build")
+@click.option("--output", "-o", type=click.Path(dir_okay=False),
+              help="Database path (default: .prompt-catalog-cache/catalog.sqlite3)")
+def store_build(output):
+    """Build a SQLite store with full-text search from the catalog sources."""
+    from .catalog import Catalog
+    from .store import CatalogStore, fts5_available
+
+    root = _find_catalog_root()
+    ctx = click.get_current_context()
+    catalog = Catalog.load(root, workers=ctx.find_root().params.get("workers"))
+    path = CatalogStore.build(catalog, output)
+    console.print(
+        f"[green]✓[/green] Compiled {len(catalog.prompts)} prompts, "
+        f"{len(catalog.instructions)} instructions and {len(catalog.starter_kits)} starter kits "
+        f"into {path}"
+    )
+    if not fts5_available():
+        console.print("[yellow]SQLite was built without FTS5; search falls back to substring matching.[/yellow]")
+
+
+# ── pack ─────────────────────────────────────────────────────────────
+
+
+@main.command("pack")
+@click.option("--output", "-o", type=click.Path(dir_okay=False),
+              help="Packed file path (default: .prompt-catalog-cache/catalog.pack)")
+def pack(output):
+    """Write the catalog to a single read-only, memory-mappable file."""
+    from .catalog import Catalog
+    from .packed import write_pack
+
+    root = _find_catalog_root()
+    ctx = click.get_current_context()
+    catalog = Catalog.load(root, workers=ctx.find_root().params.get("workers"))
+    path = write_pack(catalog, output)
+    console.print(
+        f"[green]✓[/green] Packed {len(catalog.prompts)} prompts and "
+        f"{len(catalog.instructions)} instructions into {path} "
+        f"({path.stat().st_size / 1e6:.1f} MB)"
+    )
+
+
+# ── dev ──────────────────────────────────────────────────────────────
+
+
+@main.group("dev")
+def dev_group():
+    """Developer tools (synthetic catalogs for scale testing)."""
+    pass
+
+
+@dev_group.command("gen-catalog")
+@click.option("--prompts", "n_prompts", type=click.IntRange(min=1), default=1000, show_default=True,
+              help="Number of prompts to generate")
+@click.option("--kits", "n_kits", type=click.IntRange(min=0), default=10, show_default=True,
+              help="Number of starter kits to generate")
+@click.option("--instructions", "n_instructions", type=click.IntRange(min=1), default=18, show_default=True,
+              help="Number of instruction files to generate")
+@click.option("--seed", type=int, default=0, show_default=True, help="Random seed")
+@click.option("--output", "-o", required=True, type=click.Path(file_okay=False), help="Output directory")
+@click.option("--force", is_flag=True, help="Write into a non-empty output directory")
+def dev_gen_catalog(n_prompts, n_kits, n_instructions, seed, output, force):
+    """Generate a deterministic synthetic catalog for scale testing."""
+    from .generator import generate_catalog
+
+    out = Path(output)
+    if out.exists() and any(out.iterdir()) and not force:
+        console.print(f"[red]{out} is not empty (use --force to write into it)[/red]")
+        sys.exit(1)
+
+    summary = generate_catalog(
+        out,
+        prompts=n_prompts,
+        kits=n_kits,
+        instructions=n_instructions,
+        seed=seed,
+        schema_dir=_find_catalog_root() / "schema",
+    )
+    console.print(
+        f"[green]✓[/green] Wrote {summary.prompts} prompts, {summary.instructions} instructions, "
+        f"{summary.kits} starter kits ({summary.bytes_written / 1e6:.1f} MB) to {summary.root}"
+    )
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,171 @@
+"""
+Completion — prefix autocomplete for prompt IDs, tags, kit IDs, categories
+and prompt argument values.
+
+Each kind of name is one sorted array of lowercased keys, so the names
+starting with a prefix are the contiguous run found by two binary searches.
+Names are ranked by how often the catalog uses them: tags and categories by
+the prompts carrying them, prompt IDs by the starter kits bundling them,
+kits by the prompts they bundle, and argument values by the prompts whose
+variable of that name offers them (``examples`` or ``default``). A sparse
+table of range minima over the ranks picks the best name in any run in
+O(1), so the top ``limit`` completions come out of a small heap in
+O(limit · log limit) however many names share the prefix.
+
+Columns are built on first use, and argument values only when one is asked
+for: shell completion of an ID never reads the prompt bodies of a lazily
+loaded catalog.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
+from heapq import heappop, heappush
+from typing import Iterable
+
+from .catalog import PromptEntry, StarterKit
+
+KINDS = ("id", "tag", "kit", "category")
+# Sorts after every character a key can contain, closing a prefix's run.
+_END = "\U0010ffff"
+
+
+@dataclass(frozen=True)
+class Completions:
+    """Best completions for a prefix, and how many names it matched in all."""
+
+    values: list[str]
+    total: int
+
+    @property
+    def has_more(self) -> bool:
+        return self.total > len(self.values)
+
+
+class _Column:
+    """Names of one kind, sorted by lowercase key, with a range-minimum table over their ranks."""
+
+    def __init__(self, counts: Counter[str]):
+        names = sorted(counts, key=lambda name: (name.lower(), name))
+        self.keys = [name.lower() for name in names]
+        self.names = names
+        # rank → position: most used first, then alphabetical.
+        self.at = sorted(range(len(names)), key=lambda i: -counts[names[i]])
+        ranks = [0] * len(names)
+        for rank, i in enumerate(self.at):
+            ranks[i] = rank
+        # levels[j][i] is the best rank in positions [i, i + 2**j).
+        self.levels = [ranks]
+        width = 1
+        while width * 2 <= len(ranks):
+            prev = self.levels[-1]
+            self.levels.append(list(map(min, prev, prev[width:])))
+            width *= 2
+
+    def span(self, prefix: str) -> tuple[int, int]:
+        return bisect_left(self.keys, prefix), bisect_left(self.keys, prefix + _END)
+
+    def _best(self, lo: int, hi: int) -> int:
+        level = self.levels[(hi - lo).bit_length() - 1]
+        return min(level[lo], level[hi - (1 << ((hi - lo).bit_length() - 1))])
+
+    def top(self, lo: int, hi: int, limit: int) -> list[str]:
+        """The ``limit`` best-ranked names in positions [lo, hi), best first."""
+        out: list[str] = []
+        heap = [(self._best(lo, hi), lo, hi)] if lo < hi else []
+        while heap and len(out) < limit:
+            rank, lo, hi = heappop(heap)
+            i = self.at[rank]
+            out.append(self.names[i])
+            if lo < i:
+                heappush(heap, (self._best(lo, i), lo, i))
+            if i + 1 < hi:
+                heappush(heap, (self._best(i + 1, hi), i + 1, hi))
+        return out
+
+    def complete(self, prefix: str, limit: int) -> Completions:
+        lo, hi = self.span(prefix.lower())
+        return Completions(self.top(lo, hi, limit), hi - lo)
+
+
+def _values(variable: dict) -> list[str]:
+    """The values a prompt variable suggests: its examples, then its default."""
+    values = variable.get("examples")
+    if values is None:
+        values = [variable["example"]] if "example" in variable else []
+    elif isinstance(values, str):
+        values = [values]
+    default = variable.get("default")
+    if default is not None:
+        values = [*values, default]
+    return [v for v in dict.fromkeys(map(str, values)) if v.strip()]
+
+
+class CompletionIndex:
+    """Prefix lookup over one catalog generation's names."""
+
+    def __init__(self, prompts: Iterable[PromptEntry], kits: Iterable[StarterKit] = ()):
+        self.prompts = list(prompts)
+        self.kits = list(kits)
+        self._columns: dict[str, _Column] = {}
+        self._values: dict[str, Counter[str]] | None = None
+        self._arguments: dict[str, _Column] = {}
+
+    def column(self, kind: str) -> _Column:
+        column = self._columns.get(kind)
+        if column is None:
+            counts: Counter[str] = Counter()
+            if kind == "id":
+                counts.update({p.id: 0 for p in self.prompts})
+                counts.update(pid for kit in self.kits for pid in kit.prompts if pid in counts)
+            elif kind == "tag":
+                counts.update(tag for p in self.prompts for tag in p.tags)
+            elif kind == "category":
+                counts.update(p.category for p in self.prompts if p.category)
+            elif kind == "kit":
+                counts.update({kit.id: len(kit.prompts) for kit in self.kits})
+            else:
+                raise ValueError(f"Unknown completion kind {kind!r}; expected one of {', '.join(KINDS)}")
+            column = self._columns[kind] = _Column(counts)
+        return column
+
+    def complete(self, kind: str, prefix: str = "", limit: int = 20) -> Completions:
+        """Names of ``kind`` starting with ``prefix`` (any case), most used first."""
+        return self.column(kind).complete(prefix, limit)
+
+    def _argument_column(self, name: str) -> _Column | None:
+        """Values offered for variables called ``name``, counted over all prompts."""
+        if self._values is None:
+            self._values = {}
+            for p in self.prompts:
+                for variable in p.variables:
+                    if "name" in variable:
+                        self._values.setdefault(variable["name"], Counter()).update(_values(variable))
+        column = self._arguments.get(name)
+        if column is None and name in self._values:
+            column = self._arguments[name] = _Column(self._values[name])
+        return column
+
+    def complete_argument(
+        self, prompt: PromptEntry, name: str, prefix: str = "", limit: int = 20
+    ) -> Completions:
+        """Values for argument ``name`` of ``prompt``, starting with ``prefix``.
+
+        The prompt's own examples come first, then values other prompts
+        offer for a variable of the same name, most common first.
+        """
+        variable = next((v for v in prompt.variables if v.get("name") == name), None)
+        if variable is None:
+            return Completions([], 0)
+
+        needle = prefix.lower()
+        own = [v for v in _values(variable) if v.lower().startswith(needle)]
+        column = self._argument_column(name)
+        if column is None:
+            return Completions(own[:limit], len(own))
+        lo, hi = column.span(needle)
+        # Own values are in the shared column too; ask for enough to skip them.
+        shared = [v for v in column.top(lo, hi, limit + len(own)) if v not in own]
+        return Completions((own + shared)[:limit], hi - lo)
@@ -0,0 +1,331 @@
+"""
+Facet index — inverted posting lists behind ``Catalog.filter_prompts``.
+
+Prompts are numbered densely in catalog order. Each facet value (category,
+subcategory, skill rank, platform, tag) maps to the set of prompt numbers
+carrying it, so a filter is an intersection of a few sets, smallest first,
+instead of a scan over every entry. Prompts listing the ``all`` platform are
+folded into every platform's set. The lowercase text matched by ``query`` is
+only built the first time a query is run, so metadata-only (lazy) prompts are
+not hydrated by plain facet filters.
+
+``Catalog.facets`` uses the same posting lists as integer bitmaps (bit ``n``
+set for prompt ``n``), built on first use. Multi-value selections and the
+count for every facet value are then a handful of big-integer ANDs/ORs and
+popcounts per value, independent of how many filters are combined.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from itertools import compress
+from typing import Iterable, Iterator
+
+from .catalog import SKILL_ORDER, PromptEntry
+from .paging import sort_key
+
+ALL_PLATFORMS = "all"
+
+
+def skill_rank(level: str) -> int:
+    # Unknown levels sort past "expert" so no skill filter includes them.
+    return SKILL_ORDER.index(level) if level in SKILL_ORDER else len(SKILL_ORDER)
+
+
+# Facets whose selected values are OR-ed together; their counts ignore the
+# facet's own selection, so a UI can show what adding another value would match.
+DISJUNCTIVE = ("category", "subcategory", "skill_level", "platform")
+FACETS = (*DISJUNCTIVE, "tag")
+
+
+@dataclass
+class FacetResult:
+    """Prompts matching a ``Catalog.facets`` selection, with per-value counts."""
+
+    ids: list[str]
+    # facet name → value → number of matching prompts
+    counts: dict[str, dict[str, int]]
+
+
+def _values(selection: str | Iterable[str] | None) -> list[str]:
+    if not selection:
+        return []
+    if isinstance(selection, str):
+        return [selection]
+    return [v for v in selection if v]
+
+
+def _bitmap(members: set[int], size: int) -> int:
+    buf = bytearray((size + 7) // 8)
+    for n in members:
+        buf[n >> 3] |= 1 << (n & 7)
+    return int.from_bytes(buf, "little")
+
+
+_BIT_BYTES = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def _select(items: list, bits: int) -> list:
+    """The items whose bit is set in ``bits``, in order."""
+    # One byte per bit, least significant first; compress() reads 0/1 as falsy/truthy.
+    return list(compress(items, bin(bits)[:1:-1].encode("ascii").translate(_BIT_BYTES)))
+
+
+def _post(postings: dict[str, set[int]], key: str, n: int) -> None:
+    members = postings.get(key)
+    if members is None:
+        postings[key] = {n}
+    else:
+        members.add(n)
+
+
+class FacetIndex:
+    """Posting lists over one catalog generation's prompts."""
+
+    def __init__(self, prompts: Iterable[PromptEntry]):
+        self.entries: list[PromptEntry] = list(prompts)
+        self.ids: list[str] = [p.id for p in self.entries]
+        self.category: dict[str, set[int]] = {}
+        self.subcategory: dict[str, set[int]] = {}
+        self.platform: dict[str, set[int]] = {}
+        self.tag: dict[str, set[int]] = {}
+        ranks: list[set[int]] = [set() for _ in range(len(SKILL_ORDER) + 1)]
+        wildcard: set[int] = set()
+
+        for n, p in enumerate(self.entries):
+            _post(self.category, p.category, n)
+            _post(self.subcategory, p.subcategory, n)
+            ranks[skill_rank(p.skill_level)].add(n)
+            for platform in p.platforms:
+                if platform == ALL_PLATFORMS:
+                    wildcard.add(n)
+                else:
+                    _post(self.platform, platform, n)
+            for tag in p.tags:
+                _post(self.tag, tag, n)
+
+        self._ranks = ranks
+        # skill_at_most[r] holds every prompt ranked r or below.
+        self.skill_at_most: list[set[int]] = []
+        running: set[int] = set()
+        for members in ranks[: len(SKILL_ORDER)]:
+            running = running | members
+            self.skill_at_most.append(running)
+
+        self.wildcard = wildcard
+        for members in self.platform.values():
+            members |= wildcard
+        self._searchable: list[str] | None = None
+        self._bitmaps: dict[str, dict[str, int]] | None = None
+        self._skill_bits: list[int] = []
+        self._wildcard_bits = 0
+        # order → (prompt numbers in that order, their sort keys, rank per number)
+        self._orders: dict[str, tuple[list[int], list[tuple], list[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def searchable(self) -> list[str]:
+        """Lowercase title, description and tags per prompt, built on first use."""
+        if self._searchable is None:
+            self._searchable = [
+                f"{p.title} {p.description} {' '.join(p.tags)}".lower() for p in self.entries
+            ]
+        return self._searchable
+
+    @property
+    def bitmaps(self) -> dict[str, dict[str, int]]:
+        """Facet name → value → bitmap of prompts, built on first use."""
+        if self._bitmaps is None:
+            size = len(self.entries)
+            self._bitmaps = {
+                "category": {k: _bitmap(v, size) for k, v in self.category.items()},
+                "subcategory": {k: _bitmap(v, size) for k, v in self.subcategory.items()},
+                "skill_level": {
+                    level: _bitmap(self._ranks[rank], size) for rank, level in enumerate(SKILL_ORDER)
+                },
+                "platform": {k: _bitmap(v, size) for k, v in self.platform.items()},
+                "tag": {k: _bitmap(v, size) for k, v in self.tag.items()},
+            }
+            self._skill_bits = [_bitmap(members, size) for members in self.skill_at_most]
+            self._wildcard_bits = _bitmap(self.wildcard, size)
+        return self._bitmaps
+
+    def facets(
+        self,
+        *,
+        category: str | Iterable[str] | None = None,
+        subcategory: str | Iterable[str] | None = None,
+        skill_level: str | None = None,
+        platform: str | Iterable[str] | None = None,
+        tag: str | Iterable[str] | None = None,
+        query: str | None = None,
+    ) -> FacetResult:
+        """Match a multi-value selection and count every facet value.
+
+        Several categories, subcategories or platforms match any of them;
+        several tags must all be present; ``skill_level`` is an upper bound.
+        Counts for tags are taken over the matching prompts. Counts for the
+        other facets ignore that facet's own selection, so selecting ``web``
+        still reports how many prompts ``cloud`` would add.
+        """
+        bitmaps = self.bitmaps
+        everything = (1 << len(self.entries)) - 1
+        selected: dict[str, int] = {}
+        for name, values in (("category", category), ("subcategory", subcategory), ("platform", platform)):
+            values = _values(values)
+            if values:
+                # Unknown platforms still match prompts targeting "all".
+                missing = self._wildcard_bits if name == "platform" else 0
+                bits = 0
+                for value in values:
+                    bits |= bitmaps[name].get(value, missing)
+                selected[name] = bits
+        if skill_level:
+            selected["skill_level"] = self._skill_bits[SKILL_ORDER.index(skill_level)]
+        tags = _values(tag)
+        if tags:
+            bits = everything
+            for value in tags:
+                bits &= bitmaps["tag"].get(value, 0)
+            selected["tag"] = bits
+        if query:
+            q = query.lower()
+            selected["query"] = _bitmap(
+                {n for n, text in enumerate(self.searchable) if q in text}, len(self.entries)
+            )
+
+        match = everything
+        for bits in selected.values():
+            match &= bits
+
+        counts: dict[str, dict[str, int]] = {}
+        for name in FACETS:
+            base = match
+            if name in DISJUNCTIVE and name in selected:
+                base = everything
+                for other, bits in selected.items():
+                    if other != name:
+                        base &= bits
+            counts[name] = {
+                value: count
+                for value, bits in bitmaps[name].items()
+                if (count := (bits & base).bit_count())
+            }
+
+        return FacetResult(ids=_select(self.ids, match), counts=counts)
+
+    def postings(
+        self,
+        *,
+        category: str | None = None,
+        subcategory: str | None = None,
+        skill_level: str | None = None,
+        platform: str | None = None,
+        tag: str | None = None,
+    ) -> list[set[int]]:
+        """The posting list for each active filter (unset filters are skipped)."""
+        empty: set[int] = set()
+        lists = []
+        if category:
+            lists.append(self.category.get(category, empty))
+        if subcategory:
+            lists.append(self.subcategory.get(subcategory, empty))
+        if skill_level:
+            lists.append(self.skill_at_most[SKILL_ORDER.index(skill_level)])
+        if platform:
+            lists.append(self.platform.get(platform, self.wildcard))
+        if tag:
+            lists.append(self.tag.get(tag, empty))
+        return lists
+
+    def skill(self, op: str, level: str) -> set[int]:
+        """Prompts whose skill level compares to ``level`` by ``op``.
+
+        ``op`` is ``<=``, ``<``, ``>=``, ``>``, or ``=``/``:`` for an exact
+        level; prompts with an unknown level never match.
+        """
+        rank = SKILL_ORDER.index(level)
+        if op == "<=":
+            return self.skill_at_most[rank]
+        if op == "<":
+            return self.skill_at_most[rank - 1] if rank else set()
+        if op in ("=", ":"):
+            return self._ranks[rank]
+        start = rank if op == ">=" else rank + 1
+        return set().union(*self._ranks[start:len(SKILL_ORDER)])
+
+    def _intersect(self, **filters: str | None) -> set[int] | None:
+        """Prompt numbers matching every facet filter, or None if none is set."""
+        lists = sorted(self.postings(**filters), key=len)
+        if not lists:
+            return None
+        hits = set(lists[0])
+        for members in lists[1:]:
+            if not hits:
+                break
+            hits &= members
+        return hits
+
+    def match(self, *, query: str | None = None, **filters: str | None) -> list[int]:
+        """Prompt numbers matching every filter, in catalog order."""
+        hits = self._intersect(**filters)
+        candidates: Iterable[int] = range(len(self.entries)) if hits is None else sorted(hits)
+
+        if query:
+            q = query.lower()
+            searchable = self.searchable
+            return [n for n in candidates if q in searchable[n]]
+        return list(candidates)
+
+    def filter(self, **filters: str | None) -> list[PromptEntry]:
+        entries = self.entries
+        return [entries[n] for n in self.match(**filters)]
+
+    def count(self, *, query: str | None = None, **filters: str | None) -> int:
+        if query:
+            return len(self.match(query=query, **filters))
+        hits = self._intersect(**filters)
+        return len(self.entries) if hits is None else len(hits)
+
+    def sorted_by(self, order: str) -> tuple[list[int], list[tuple], list[int]]:
+        """Prompt numbers sorted by ``order``, their keys, and each number's rank."""
+        cached = self._orders.get(order)
+        if cached is None:
+            key = sort_key(order)
+            keys = [key(p) for p in self.entries]
+            numbers = sorted(range(len(keys)), key=keys.__getitem__)
+            ranks = [0] * len(numbers)
+            for rank, n in enumerate(numbers):
+                ranks[n] = rank
+            cached = self._orders[order] = (numbers, [keys[n] for n in numbers], ranks)
+        return cached
+
+    def iter_sorted(
+        self,
+        order: str = "id",
+        after: tuple | None = None,
+        *,
+        query: str | None = None,
+        **filters: str | None,
+    ) -> Iterator[PromptEntry]:
+        """Matching prompts sorted by ``order``, starting past the key ``after``."""
+        numbers, keys, ranks = self.sorted_by(order)
+        start = 0 if after is None else bisect_right(keys, after)
+        hits = self._intersect(**filters)
+        if hits is None:
+            candidates: Iterable[int] = (numbers[r] for r in range(start, len(numbers)))
+        elif len(hits) * 8 < len(numbers) - start:
+            # Few matches: sort just those rather than walking the whole order.
+            candidates = sorted((n for n in hits if ranks[n] >= start), key=ranks.__getitem__)
+        else:
+            candidates = (numbers[r] for r in range(start, len(numbers)) if numbers[r] in hits)
+
+        entries = self.entries
+        q = query.lower() if query else None
+        searchable = self.searchable if q else None
+        for n in candidates:
+            if q is None or q in searchable[n]:
+                yield entries[n]
@@ -0,0 +1,165 @@
+"""
+Fuzzy lookup — "did you mean" for prompt IDs, titles, tags and kit IDs.
+
+Every name is lowercased, padded and split into trigrams, and each trigram
+keeps the names containing it. A lookup only compares the query against
+names that share enough trigrams with it: a name within ``k`` edits of the
+query keeps all but at most ``k * (N + 1)`` of the query's trigrams.
+Candidates are visited from most to fewest shared trigrams and checked with
+an edit distance (adjacent transpositions count as one edit) that gives up
+as soon as it exceeds the bound. Once ``limit`` matches are found the bound
+tightens to what could still improve on them, so the scan usually stops
+after a handful of candidates.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Iterable
+
+from .catalog import PromptEntry, StarterKit
+
+N = 3
+KINDS = ("id", "title", "tag", "kit")
+
+
+def trigrams(text: str) -> set[str]:
+    padded = "  " + text + " "
+    return {padded[i:i + N] for i in range(len(padded) - N + 1)}
+
+
+def default_distance(query: str) -> int:
+    """Edits tolerated for a query of this length."""
+    if len(query) <= 3:
+        return 0 if len(query) < 3 else 1
+    if len(query) <= 7:
+        return 1
+    return 2 if len(query) <= 15 else 3
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance, or ``limit + 1`` once it exceeds ``limit``."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    # Catalog names share long prefixes and suffixes ("SEC-THREAT-0…"); a
+    # shared character at either end never takes part in an optimal edit.
+    i = 0
+    while i < len(a) and i < len(b) and a[i] == b[i]:
+        i += 1
+    a, b = a[i:], b[i:]
+    j = 0
+    while j < len(a) and j < len(b) and a[-1 - j] == b[-1 - j]:
+        j += 1
+    if j:
+        a, b = a[:-j], b[:-j]
+    if not a or not b:
+        return min(max(len(a), len(b)), limit + 1)
+
+    prev2: list[int] | None = None
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        row = [i] + [0] * len(b)
+        for j, cb in enumerate(b, 1):
+            best = min(prev[j] + 1, row[j - 1] + 1, prev[j - 1] + (ca != cb))
+            if prev2 is not None and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                best = min(best, prev2[j - 2] + 1)
+            row[j] = best
+        if min(row) > limit:
+            return limit + 1
+        prev2, prev = prev, row
+    return prev[-1] if prev[-1] <= limit else limit + 1
+
+
+@dataclass(frozen=True)
+class FuzzyMatch:
+    """A name close to the query."""
+
+    kind: str  # "id", "title", "tag" or "kit"
+    text: str  # the name as it appears in the catalog
+    key: str  # prompt ID for "id"/"title", the tag, or the kit ID
+    distance: int
+
+
+class FuzzyIndex:
+    """Trigram postings over one catalog generation's names."""
+
+    def __init__(self, prompts: Iterable[PromptEntry], kits: Iterable[StarterKit] = ()):
+        # (kind, text, key) per name; several names may share a lowercase form.
+        self.names: list[tuple[str, str, str]] = []
+        seen_tags: set[str] = set()
+        for p in prompts:
+            self.names.append(("id", p.id, p.id))
+            if p.title:
+                self.names.append(("title", p.title, p.id))
+            for tag in p.tags:
+                if tag not in seen_tags:
+                    seen_tags.add(tag)
+                    self.names.append(("tag", tag, tag))
+        for kit in kits:
+            self.names.append(("kit", kit.id, kit.id))
+
+        self.lowered = [text.lower() for _, text, _ in self.names]
+        self.postings: dict[str, list[int]] = {}
+        for n, text in enumerate(self.lowered):
+            for gram in trigrams(text):
+                members = self.postings.get(gram)
+                if members is None:
+                    self.postings[gram] = [n]
+                else:
+                    members.append(n)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def lookup(
+        self,
+        query: str,
+        *,
+        kinds: Iterable[str] | None = None,
+        limit: int = 5,
+        max_distance: int | None = None,
+    ) -> list[FuzzyMatch]:
+        """Names within ``max_distance`` edits of ``query``, closest first."""
+        q = query.strip().lower()
+        if not q or limit <= 0:
+            return []
+        bound = default_distance(q) if max_distance is None else max_distance
+        wanted = set(kinds or KINDS)
+
+        grams = trigrams(q)
+        shared: Counter[int] = Counter()
+        for gram in grams:
+            shared.update(self.postings.get(gram, ()))
+
+        # A name within ``bound`` edits keeps all but bound*(N+1) trigrams.
+        floor = len(grams) - bound * (N + 1)
+        candidates = sorted(
+            (item for item in shared.items() if item[1] >= floor), key=itemgetter(1), reverse=True
+        )
+
+        best: dict[tuple[str, str], tuple[int, int, FuzzyMatch]] = {}
+        for n, count in candidates:
+            if count < len(grams) - bound * (N + 1):
+                break
+            kind, text, key = self.names[n]
+            if kind not in wanted:
+                continue
+            d = edit_distance(q, self.lowered[n], bound)
+            if d > bound:
+                continue
+            # An ID and its title both point at one prompt; keep the closer.
+            slot = ("prompt" if kind in ("id", "title") else kind, key)
+            if slot in best and best[slot][0] <= d:
+                continue
+            best[slot] = (d, -count, FuzzyMatch(kind, text, key, d))
+            if len(best) >= limit:
+                # Only strictly closer names can still change the result.
+                worst = sorted(v[:2] for v in best.values())[limit - 1][0]
+                bound = min(bound, worst - 1)
+                if bound < 0:
+                    break
+
+        ranked = sorted(best.values(), key=lambda v: (v[0], v[1], v[2].text.lower()))
+        return [match for _, _, match in ranked[:limit]]
@@ -0,0 +1,417 @@
+"""
+Synthetic catalog generator for scale testing.
+
+Usage:
+    prompt-catalog dev gen-catalog --prompts 10000 --kits 50 --output /tmp/cat10k
+
+Writes a complete, schema-valid catalog (prompts, instructions, starter kits
+and a matching ``prompts/index.json``) whose shape follows the real catalog:
+category and skill mixes match ``index.json`` statistics, tags follow a Zipf
+distribution, prompt bodies are log-normally sized around the real median,
+and prompts are linked into chains and related groups. Output depends only
+on the arguments, so the same seed always produces the same files.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .catalog import INSTRUCTION_SCOPES, PROMPT_DIRS, SKILL_ORDER
+
+# Mix of the real catalog (index.json statistics).
+CATEGORY_WEIGHTS = {
+    "planning": 4,
+    "architecture": 4,
+    "development": 4,
+    "testing": 4,
+    "security": 2,
+    "deployment": 2,
+    "operations": 3,
+    "domains": 13,
+}
+SKILL_WEIGHTS = [2, 11, 15, 8]  # same order as SKILL_ORDER
+
+PLATFORMS = [
+    "web", "cloud", "android", "ios", "linux", "windows", "cross-platform",
+    "cloud-azure", "cloud-aws", "cloud-gcp", "cloud-oracle", "cloud-multi",
+    "embedded", "game", "blockchain",
+]
+PLATFORM_WEIGHTS = [15, 14, 8, 8, 7, 6, 2, 2, 2, 2, 2, 2, 1, 1, 1]
+
+SUBCATEGORIES = {
+    "planning": ["requirements", "scoping", "estimation", "roadmap"],
+    "architecture": ["system-design", "data", "cloud", "microservices", "integration"],
+    "development": ["web", "api", "mobile", "desktop", "refactoring", "data-pipeline"],
+    "testing": ["unit-testing", "integration-testing", "performance-testing", "security-testing"],
+    "security": ["threat-modeling", "code-review", "secrets", "identity"],
+    "deployment": ["ci-cd", "iac", "release", "containers"],
+    "operations": ["monitoring", "incident-response", "capacity", "cost"],
+    "domains": ["fintech", "healthcare", "legal", "retail", "education", "logistics", "media"],
+}
+
+CATEGORY_PREFIX = {
+    "planning": "PLAN",
+    "architecture": "ARCH",
+    "development": "DEV",
+    "testing": "TEST",
+    "security": "SEC",
+    "deployment": "DEPLOY",
+    "operations": "OPS",
+    "domains": "DOM",
+}
+
+BASE_TAGS = [
+    "security", "api", "testing", "performance", "cloud", "compliance", "architecture",
+    "database", "monitoring", "automation", "requirements", "web", "mobile", "scalability",
+    "observability", "ci-cd", "kubernetes", "microservices", "privacy", "authentication",
+    "caching", "logging", "frontend", "backend", "infrastructure", "migration", "cost",
+    "accessibility", "documentation", "refactoring", "resilience", "data-modeling",
+    "event-driven", "rest", "graphql", "sql", "nosql", "terraform", "containers",
+    "incident-response", "load-testing", "threat-modeling", "owasp", "encryption",
+    "payments", "healthcare", "fintech", "audit", "analytics", "machine-learning",
+]
+
+WORDS = (
+    "system service request response latency throughput cache queue database schema "
+    "index query transaction consistency availability partition replica cluster node "
+    "deployment pipeline release rollback feature flag config secret token session user "
+    "account tenant role permission audit log metric trace alert dashboard incident "
+    "runbook capacity budget cost region zone failover backup restore migration version "
+    "contract interface endpoint payload validation error retry timeout circuit breaker "
+    "rate limit quota batch stream event handler worker job scheduler test coverage "
+    "fixture mock integration regression benchmark profile bottleneck memory cpu disk "
+    "network storage encryption key certificate compliance policy requirement stakeholder "
+    "scope milestone estimate risk assumption constraint dependency module component"
+).split()
+
+VARIABLE_NAMES = [
+    "project_name", "system_name", "tech_stack", "team_size", "target_platform",
+    "compliance_requirements", "traffic_profile", "data_volume", "budget", "timeline",
+    "architecture_type", "language", "framework", "cloud_provider", "sla_targets",
+]
+
+SECTION_TITLES = [
+    "Context", "Objectives", "Constraints", "Approach", "Deliverables", "Risks",
+    "Validation", "Output Format", "Edge Cases", "Checklist",
+]
+
+
+@dataclass
+class GeneratedCatalog:
+    """Summary of a generated catalog."""
+
+    root: Path
+    prompts: int = 0
+    instructions: int = 0
+    kits: int = 0
+    bytes_written: int = 0
+    prompt_files: list[str] = field(default_factory=list, repr=False)
+
+
+def _letters(n: int, width: int) -> str:
+    """Fixed-width base-26 encoding, so IDs satisfy ``^[A-Z]+-[A-Z]+-[0-9]{3}$``."""
+    out = []
+    for _ in range(width):
+        n, rem = divmod(n, 26)
+        out.append(chr(ord("A") + rem))
+    return "".join(reversed(out))
+
+
+def _quote(value) -> str:
+    # JSON strings and arrays are valid YAML flow scalars/sequences.
+    return json.dumps(value, ensure_ascii=False)
+
+
+class _Generator:
+    def __init__(self, seed: int, n_prompts: int):
+        self.rng = random.Random(seed)
+        vocab_size = max(len(BASE_TAGS) * 2, n_prompts // 20)
+        self.tags = list(BASE_TAGS)
+        while len(self.tags) < vocab_size:
+            self.tags.append(f"{self.rng.choice(WORDS)}-{self.rng.choice(WORDS)}-{len(self.tags)}")
+        # Zipf(1.1) popularity over the tag vocabulary.
+        weights = [1 / (rank ** 1.1) for rank in range(1, len(self.tags) + 1)]
+        self.tag_cum = []
+        total = 0.0
+        for w in weights:
+            total += w
+            self.tag_cum.append(total)
+
+    def words(self, n: int) -> str:
+        return " ".join(self.rng.choices(WORDS, k=n))
+
+    def sentence(self, lo: int = 6, hi: int = 16) -> str:
+        text = self.words(self.rng.randint(lo, hi))
+        return text[0].upper() + text[1:] + "."
+
+    def pick_tags(self) -> list[str]:
+        k = self.rng.randint(4, 12)
+        chosen = dict.fromkeys(self.rng.choices(self.tags, cum_weights=self.tag_cum, k=k * 2))
+        return list(chosen)[:k]
+
+    def pick_platforms(self) -> list[str]:
+        if self.rng.random() < 0.45:
+            return ["all"]
+        k = self.rng.choice([1, 1, 2, 2, 3, 4, 5, 6])
+        return list(dict.fromkeys(self.rng.choices(PLATFORMS, weights=PLATFORM_WEIGHTS, k=k)))
+
+    def prompt_body(self, variables: list[str]) -> str:
+        # Log-normal around the real catalog's median of ~3.5k chars.
+        target = min(60_000, max(300, int(self.rng.lognormvariate(8.24, 0.45))))
+        lines = ["You are an experienced engineer helping with the task below.", ""]
+        lines += [f"- {name.replace('_', ' ').title()}: {{{{{name}}}}}" for name in variables]
+        size = sum(len(line) + 1 for line in lines)
+        while size < target:
+            section = [f"### {self.rng.choice(SECTION_TITLES)}"]
+            section += [f"- {self.sentence()}" for _ in range(self.rng.randint(3, 8))]
+            section.append(" ".join(self.sentence() for _ in range(self.rng.randint(2, 5))))
+            section.append("")
+            lines += [""] + section
+            size += sum(len(line) + 1 for line in section) + 1
+        return "\n".join(lines).rstrip() + "\n"
+
+
+def _prompt_yaml(p: dict) -> str:
+    out = [
+        f"id: {_quote(p['id'])}",
+        'version: "1.0.0"',
+        f"title: {_quote(p['title'])}",
+        f"description: {_quote(p['description'])}",
+        f"category: {_quote(p['category'])}",
+        f"subcategory: {_quote(p['subcategory'])}",
+        f"skill_level: {_quote(p['skill_level'])}",
+        f"platforms: {_quote(p['platforms'])}",
+        f"tags: {_quote(p['tags'])}",
+        'author: "synthetic"',
+        'last_reviewed: "2026-01-01"',
+        "",
+        "prompt: |",
+    ]
+    out += [f"  {line}" if line else "" for line in p["prompt"].splitlines()]
+    out += ["", "variables:"]
+    for v in p["variables"]:
+        out += [
+            f"  - name: {_quote(v['name'])}",
+            f"    description: {_quote(v['description'])}",
+            f"    required: {'true' if v['required'] else 'false'}",
+            f"    examples: {_quote(v['examples'])}",
+        ]
+    out += ["", f"expected_output: {_quote(p['expected_output'])}", "", "quality_criteria:"]
+    out += [f"  - {_quote(c)}" for c in p["quality_criteria"]]
+    out += ["", "anti_patterns:"]
+    out += [f"  - {_quote(a)}" for a in p["anti_patterns"]]
+    if p["adversarial_tests"]:
+        out += ["", "adversarial_tests:"]
+        for t in p["adversarial_tests"]:
+            out += [
+                f"  - scenario: {_quote(t['scenario'])}",
+                f"    expected_behavior: {_quote(t['expected_behavior'])}",
+                f"    severity: {_quote(t['severity'])}",
+            ]
+    out += [
+        "",
+        f"related_prompts: {_quote(p['related_prompts'])}",
+        "",
+        "chain_position:",
+        f"  previous: {_quote(p['chain_position']['previous'])}",
+        f"  next: {_quote(p['chain_position']['next'])}",
+    ]
+    return "\n".join(out) + "\n"
+
+
+def generate_catalog(
+    output: str | Path,
+    *,
+    prompts: int,
+    kits: int,
+    instructions: int = 18,
+    seed: int = 0,
+    schema_dir: Path | None = None,
+) -> GeneratedCatalog:
+    """Write a synthetic catalog under ``output`` and return a summary."""
+    root = Path(output).resolve()
+    gen = _Generator(seed, prompts)
+    rng = gen.rng
+    summary = GeneratedCatalog(root=root)
+
+    if schema_dir and schema_dir.is_dir():
+        (root / "schema").mkdir(parents=True, exist_ok=True)
+        for schema in sorted(schema_dir.glob("*.schema.json")):
+            shutil.copyfile(schema, root / "schema" / schema.name)
+
+    # ── Prompt metadata (IDs first, so links can point forward) ──────
+    categories = rng.choices(list(CATEGORY_WEIGHTS), weights=list(CATEGORY_WEIGHTS.values()), k=prompts)
+    ids = []
+    for i, category in enumerate(categories):
+        block, num = divmod(i, 1000)
+        ids.append(f"{CATEGORY_PREFIX[category]}-SYN{_letters(block, 3)}-{num:03d}")
+
+    # Chains: consecutive runs of 2–8 prompts; about 60% of prompts are in one.
+    previous: dict[str, list[str]] = {pid: [] for pid in ids}
+    following: dict[str, list[str]] = {pid: [] for pid in ids}
+    i = 0
+    while i < prompts:
+        length = rng.randint(2, 8)
+        if rng.random() < 0.6:
+            run = ids[i:i + length]
+            for a, b in zip(run, run[1:]):
+                following[a].append(b)
+                previous[b].append(a)
+        i += length
+
+    # ── Prompts ──────────────────────────────────────────────────────
+    for d in PROMPT_DIRS:
+        (root / "prompts" / d).mkdir(parents=True, exist_ok=True)
+
+    rows = []
+    stats_categories = dict.fromkeys(PROMPT_DIRS, 0)
+    stats_skills = dict.fromkeys(SKILL_ORDER, 0)
+    platforms_covered: dict[str, None] = {}
+    for i, (pid, category) in enumerate(zip(ids, categories)):
+        var_names = rng.sample(VARIABLE_NAMES, rng.randint(3, 6))
+        related = sorted({ids[rng.randrange(prompts)] for _ in range(rng.randint(2, 5))} - {pid})
+        p = {
+            "id": pid,
+            "title": f"{gen.words(rng.randint(2, 5)).title()} {i}",
+            "description": gen.sentence(10, 30),
+            "category": category,
+            "subcategory": rng.choice(SUBCATEGORIES[category]),
+            "skill_level": rng.choices(SKILL_ORDER, weights=SKILL_WEIGHTS)[0],
+            "platforms": gen.pick_platforms(),
+            "tags": gen.pick_tags(),
+            "prompt": gen.prompt_body(var_names),
+            "variables": [
+                {
+                    "name": name,
+                    "description": gen.sentence(4, 10),
+                    "required": rng.random() < 0.8,
+                    "examples": [gen.words(2) for _ in range(rng.randint(1, 3))],
+                }
+                for name in var_names
+            ],
+            "expected_output": gen.sentence(10, 25),
+            "quality_criteria": [gen.sentence() for _ in range(rng.randint(5, 7))],
+            "anti_patterns": [gen.sentence() for _ in range(rng.randint(4, 7))],
+            "adversarial_tests": [
+                {
+                    "scenario": gen.sentence(),
+                    "expected_behavior": gen.sentence(),
+                    "severity": rng.choice(["critical", "high", "medium", "low"]),
+                }
+                for _ in range(rng.randint(3, 4) if rng.random() < 0.2 else 0)
+            ],
+            "related_prompts": related,
+            "chain_position": {"previous": previous[pid], "next": following[pid]},
+        }
+        rel = f"prompts/{category}/{pid.lower()}.yaml"
+        data = _prompt_yaml(p).encode("utf-8")
+        (root / rel).write_bytes(data)
+        summary.bytes_written += len(data)
+        summary.prompt_files.append(rel)
+
+        stats_categories[category] += 1
+        stats_skills[p["skill_level"]] += 1
+        platforms_covered.update(dict.fromkeys(p["platforms"]))
+        rows.append({
+            "id": pid,
+            "title": p["title"],
+            "category": category,
+            "subcategory": p["subcategory"],
+            "skill_level": p["skill_level"],
+            "platforms": p["platforms"],
+            "tags": p["tags"],
+            "file": rel,
+            "chain_next": following[pid],
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "size": len(data),
+        })
+    summary.prompts = prompts
+
+    # ── Instructions ─────────────────────────────────────────────────
+    inst_rows = []
+    inst_refs = []
+    for i in range(instructions):
+        scope = INSTRUCTION_SCOPES[i % len(INSTRUCTION_SCOPES)]
+        stem = f"synthetic-{i:03d}"
+        inst_id = f"INST-SYN-{i:03d}"
+        title = gen.words(3).title()
+        body = "\n\n".join(
+            f"## {rng.choice(SECTION_TITLES)}\n" + "\n".join(f"- {gen.sentence()}" for _ in range(6))
+            for _ in range(rng.randint(4, 12))
+        )
+        load_with = ", ".join(f"INST-SYN-{j:03d}" for j in range(min(i, 2)))
+        text = (
+            f"---\nname: {_quote(title)}\ndescription: {_quote(gen.sentence())}\n---\n\n"
+            f"<!-- Catalog Metadata\nid: {inst_id}\nversion: 1.0.0\nscope: {scope.rstrip('s')}\n"
+            f"applies_to: all\npriority: {rng.choice(['critical', 'high'])}\n"
+            + (f"load_with: {load_with}\n" if load_with else "")
+            + f"author: synthetic\nlast_reviewed: 2026-01-01\n-->\n\n# {title}\n\n{body}\n"
+        )
+        rel = f"instructions/{scope}/{stem}.instructions.md"
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text(text, encoding="utf-8")
+        summary.bytes_written += len(text.encode("utf-8"))
+        inst_refs.append(f"{scope}/{stem}")
+        inst_rows.append({"id": inst_id, "title": title, "scope": scope.rstrip("s"), "file": rel})
+    summary.instructions = instructions
+
+    # ── Starter kits ─────────────────────────────────────────────────
+    kit_rows = []
+    (root / "starter-kits").mkdir(parents=True, exist_ok=True)
+    for i in range(kits):
+        kit_id = f"synthetic-kit-{i:03d}"
+        kit_prompts = rng.sample(ids, min(prompts, rng.randint(5, 15)))
+        kit_insts = rng.sample(inst_refs, min(instructions, rng.randint(2, 5)))
+        kit_tags = gen.pick_tags()[:4]
+        text = "\n".join([
+            f"id: {kit_id}",
+            f"name: {_quote(gen.words(3).title() + ' Kit')}",
+            f"description: {_quote(gen.sentence(10, 20))}",
+            f"target_audience: {_quote(gen.sentence(5, 10))}",
+            "",
+            "prompts:",
+            *[f"  - {pid}" for pid in kit_prompts],
+            "",
+            "instructions:",
+            *[f"  - {ref}" for ref in kit_insts],
+            "",
+            f"tags: {_quote(kit_tags)}",
+            "",
+        ])
+        rel = f"starter-kits/{kit_id}.yaml"
+        (root / rel).write_text(text, encoding="utf-8")
+        summary.bytes_written += len(text.encode("utf-8"))
+        kit_rows.append({
+            "id": kit_id,
+            "file": rel,
+            "prompt_count": len(kit_prompts),
+            "tags": kit_tags,
+        })
+    summary.kits = kits
+
+    # ── index.json ───────────────────────────────────────────────────
+    index = {
+        "version": "1.0.0",
+        "generated": f"synthetic (seed={seed})",
+        "description": f"Synthetic catalog: {prompts} prompts, {kits} starter kits",
+        "statistics": {
+            "total_prompts": prompts,
+            "total_starter_kits": kits,
+            "categories": stats_categories,
+            "skill_levels": stats_skills,
+            "platforms_covered": sorted(platforms_covered),
+        },
+        "prompts": rows,
+        "instructions": inst_rows,
+        "chains": {},
+        "starter_kits": kit_rows,
+    }
+    index_text = json.dumps(index, indent=2, ensure_ascii=False) + "\n"
+    (root / "prompts" / "index.json").write_text(index_text, encoding="utf-8")
+    summary.bytes_written += len(index_text.encode("utf-8"))
+    return summary
@@ -0,0 +1,210 @@
+"""
+index.json builder — regenerates ``prompts/index.json`` from the sources.
+
+Usage:
+    prompt-catalog index build [--check]
+
+Rows for prompts, instructions and starter kits are derived from their
+source files and carry a ``sha256``/``size``/``mtime_ns`` fingerprint. An
+existing row is reused without parsing when its fingerprint still matches,
+so rebuilding after an edit only parses the files that changed. Keys that
+are not derived from sources (hand-curated instruction IDs, ``chains``,
+``case_studies``, …) are kept as they are.
+
+The output is deterministic: rows follow catalog load order and the JSON is
+written with a fixed layout, so rebuilding an unchanged catalog produces an
+identical file. ``source_dirs`` records each source directory's mtime, which
+lets ``Catalog.load(trust_index=True)`` skip globbing and per-file stats.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from .catalog import PROMPT_DIRS, SKILL_ORDER, iter_sources, parse_source, source_dirs
+from .manifest import INDEX_PATH, MANIFEST_NAME_FIELDS, SECTIONS
+from .snapshot import file_digest
+
+
+@dataclass
+class IndexBuild:
+    """Result of ``build_index``."""
+
+    index: dict
+    reused: int = 0
+    parsed: int = 0
+    errors: list[str] | None = None
+
+
+def _prompt_row(entry, rel: str, old: dict | None) -> dict:
+    row = {
+        "id": entry.id,
+        "title": entry.title,
+        "category": entry.category,
+        "subcategory": entry.subcategory,
+        "skill_level": entry.skill_level,
+        "platforms": entry.platforms,
+        "tags": entry.tags,
+        "file": rel,
+        "chain_next": entry.chain_position.get("next", []),
+    }
+    for name in MANIFEST_NAME_FIELDS:
+        if getattr(entry, name):
+            row[name] = getattr(entry, name)
+    return row
+
+
+def _instruction_row(entry, rel: str, old: dict | None) -> dict:
+    row = {
+        "title": entry.name,
+        "scope": entry.metadata.get("scope") or entry.scope.rstrip("s"),
+        "file": rel,
+    }
+    # Index IDs for instructions are curated by hand; only new files get one.
+    if not (old and old.get("id")):
+        row = {"id": entry.id or entry.stem.removesuffix(".instructions"), **row}
+    return row
+
+
+def _kit_row(entry, rel: str, old: dict | None) -> dict:
+    return {
+        "id": entry.id,
+        "name": entry.name,
+        "description": entry.description,
+        "file": rel,
+        "prompt_count": len(entry.prompts),
+        "tags": entry.tags,
+    }
+
+
+_ROW_BUILDERS = {"prompt": _prompt_row, "instruction": _instruction_row, "starter_kit": _kit_row}
+
+
+def _statistics(old: dict, prompts: list[dict], kits: list[dict]) -> dict:
+    categories = dict.fromkeys(PROMPT_DIRS, 0)
+    skills = dict.fromkeys(SKILL_ORDER, 0)
+    platforms = set()
+    for row in prompts:
+        if row["category"] in categories:
+            categories[row["category"]] += 1
+        if row["skill_level"] in skills:
+            skills[row["skill_level"]] += 1
+        platforms.update(p for p in row["platforms"] if p != "all")
+    return {
+        **old,
+        "total_prompts": len(prompts),
+        "total_starter_kits": len(kits),
+        "categories": categories,
+        "skill_levels": skills,
+        "platforms_covered": sorted(platforms),
+    }
+
+
+def read_index(root: Path) -> dict:
+    try:
+        return json.loads((root / INDEX_PATH).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+
+
+def build_index(root: str | Path) -> IndexBuild:
+    """Regenerate the index for ``root``, reusing rows whose file is unchanged."""
+    root = Path(root).resolve()
+    old_index = read_index(root)
+    old_rows = {
+        kind: {row["file"]: row for row in old_index.get(section, []) if isinstance(row, dict) and "file" in row}
+        for kind, section in SECTIONS.items()
+    }
+
+    build = IndexBuild(index={}, errors=[])
+    rows: dict[str, list[dict]] = {kind: [] for kind in SECTIONS}
+    for kind, scope, path in iter_sources(root):
+        rel = path.relative_to(root).as_posix()
+        old = old_rows[kind].get(rel)
+        st = path.stat()
+        fingerprint = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+        data = None
+        if old and old.get("sha256") and old.get("size") == st.st_size:
+            if old.get("mtime_ns") == st.st_mtime_ns:
+                rows[kind].append(old)
+                build.reused += 1
+                continue
+            data = path.read_bytes()
+            if file_digest(data) == old["sha256"]:
+                rows[kind].append({**old, **fingerprint})
+                build.reused += 1
+                continue
+
+        if data is None:
+            data = path.read_bytes()
+        try:
+            entry = parse_source(kind, scope, path)
+        except Exception as exc:
+            build.errors.append(f"{rel}: {exc}")
+            continue
+        build.parsed += 1
+        generated = _ROW_BUILDERS[kind](entry, rel, old)
+        # Name fields are written only when non-empty, so a stale value must
+        # not survive from the old row.
+        kept = {k: v for k, v in (old or {}).items() if k not in MANIFEST_NAME_FIELDS}
+        rows[kind].append({**kept, **generated, "sha256": file_digest(data), **fingerprint})
+
+    index = dict(old_index)
+    index.setdefault("version", "1.0.0")
+    index["statistics"] = _statistics(
+        old_index.get("statistics", {}), rows["prompt"], rows["starter_kit"]
+    )
+    for kind, section in SECTIONS.items():
+        index[section] = rows[kind]
+    index["source_dirs"] = {
+        d.relative_to(root).as_posix(): d.stat().st_mtime_ns if d.is_dir() else None
+        for d in source_dirs(root)
+    }
+    build.index = index
+    return build
+
+
+def render_index(index: dict) -> str:
+    return json.dumps(index, indent=2, ensure_ascii=False) + "\n"
+
+
+def index_content(index: dict) -> dict:
+    """``index`` without file and directory mtimes, which a checkout or ``touch`` changes.
+
+    Two indexes with the same content describe the same sources: rows are
+    still fingerprinted by ``sha256`` and ``size``.
+    """
+    content = {key: value for key, value in index.items() if key != "source_dirs"}
+    for section in SECTIONS.values():
+        if isinstance(index.get(section), list):
+            content[section] = [
+                {k: v for k, v in row.items() if k != "mtime_ns"} if isinstance(row, dict) else row
+                for row in index[section]
+            ]
+    return content
+
+
+def write_index(root: str | Path, index: dict) -> bool:
+    """Write ``index`` if it differs from the file on disk; True if written."""
+    path = Path(root) / INDEX_PATH
+    text = render_index(index)
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return False
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return True
@@ -0,0 +1,119 @@
+"""
+index.json manifest — per-prompt metadata that lets the catalog skip YAML.
+
+A manifest row can stand in for its prompt file only when it carries a
+content fingerprint (``sha256``, ``size``, ``mtime_ns``) that still matches
+the file on disk. Hand-written rows without a fingerprint are never trusted.
+
+An index written by ``prompt-catalog index build`` also lists every source
+file and records each source directory's mtime. While no directory changed,
+that list can replace globbing and per-file stats (``trusted_sources``).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+
+from .snapshot import file_digest
+
+logger = logging.getLogger(__name__)
+
+INDEX_PATH = Path("prompts") / "index.json"
+
+# index.json section for each kind of catalog source.
+SECTIONS = {"prompt": "prompts", "instruction": "instructions", "starter_kit": "starter_kits"}
+
+FINGERPRINT_FIELDS = ("sha256", "size", "mtime_ns")
+
+# Prompt fields a manifest row must provide to build a metadata-only entry.
+MANIFEST_FIELDS = (
+    "id",
+    "title",
+    "category",
+    "subcategory",
+    "skill_level",
+    "platforms",
+    "tags",
+)
+
+# Prompt name lists a row carries only when the prompt declares any.
+MANIFEST_NAME_FIELDS = ("aliases", "deprecated_ids")
+
+
+class Manifest:
+    """Prompt rows from ``prompts/index.json``, keyed by relative file path."""
+
+    def __init__(self, root: Path, rows: dict[str, dict], index: dict | None = None):
+        self.root = root
+        self.rows = rows
+        self.index = index or {}
+
+    @classmethod
+    def open(cls, root: Path) -> "Manifest | None":
+        path = root / INDEX_PATH
+        try:
+            index = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable manifest %s: %s", path, exc)
+            return None
+
+        rows = {
+            row["file"]: row
+            for row in index.get("prompts", [])
+            if isinstance(row, dict) and row.get("file")
+        }
+        return cls(root, rows, index)
+
+    def fresh_row(self, path: Path) -> dict | None:
+        """Return the row for ``path`` if it still describes the file, else None.
+
+        Size and mtime are checked first; if the mtime moved (a fresh clone,
+        a ``touch``) the file is hashed and compared against ``sha256``.
+        """
+        row = self.rows.get(path.relative_to(self.root).as_posix())
+        if row is None or "sha256" not in row:
+            return None
+        if any(name not in row for name in MANIFEST_FIELDS):
+            return None
+
+        st = path.stat()
+        if row.get("size") != st.st_size:
+            return None
+        if row.get("mtime_ns") == st.st_mtime_ns:
+            return row
+        return row if file_digest(path.read_bytes()) == row["sha256"] else None
+
+    def trusted_sources(self) -> dict[Path, tuple[str, dict]] | None:
+        """Every source file the index lists, if it can be trusted without stats.
+
+        Returns ``{path: (kind, row)}`` in index order, or None unless the
+        index records ``source_dirs`` (written by ``index build``), no source
+        directory was created, removed or changed since, and every row has a
+        fingerprint. Adding, deleting or renaming a file (including editors'
+        save-by-rename) changes its directory's mtime; an in-place write does
+        not, so rebuild the index after editing when relying on this.
+        """
+        dirs = self.index.get("source_dirs")
+        if not isinstance(dirs, dict) or not dirs:
+            return None
+        for rel, mtime_ns in dirs.items():
+            try:
+                current = (self.root / rel).stat().st_mtime_ns
+            except FileNotFoundError:
+                current = None
+            if current != mtime_ns:
+                return None
+
+        sources: dict[Path, tuple[str, dict]] = {}
+        for kind, section in SECTIONS.items():
+            for row in self.index.get(section, []):
+                if not isinstance(row, dict) or "file" not in row:
+                    return None
+                if any(name not in row for name in FINGERPRINT_FIELDS):
+                    return None
+                sources[self.root / row["file"]] = (kind, row)
+        return sources
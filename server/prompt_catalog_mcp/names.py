@@ -0,0 +1,75 @@
+"""
+Name resolution — every name a prompt or starter kit answers to, in one dict.
+
+A prompt answers to its canonical ID in any case (including the lowercase
+name ``list_prompts`` advertises over MCP), to the ``aliases`` it declares
+and to its ``deprecated_ids``. A kit answers to its ID in any case and to
+the ``aliases`` in its YAML. Names are folded (stripped, lowercased) into
+one table per kind, built once per catalog generation, so a lookup is a
+single hash probe however large the catalog is.
+
+When two entries claim one name, a canonical ID beats an alias and an alias
+beats a deprecated ID; between equals the entry loaded first keeps the name.
+``prompt-catalog validate`` reports such clashes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+from .catalog import PromptEntry, StarterKit
+
+# How a name reaches its entry, strongest claim first.
+VIAS = ("id", "alias", "deprecated")
+
+
+def fold(name: str) -> str:
+    return name.strip().lower()
+
+
+@dataclass(frozen=True)
+class Resolution:
+    """The entry a name resolves to."""
+
+    key: str  # canonical prompt or kit ID
+    via: str  # "id", "alias" or "deprecated"
+
+
+def entry_names(entry: PromptEntry | StarterKit) -> Iterator[tuple[str, str]]:
+    """``(via, name)`` for every name ``entry`` declares."""
+    yield "id", entry.id
+    if isinstance(entry, StarterKit):
+        aliases, deprecated = entry.raw.get("aliases") or [], entry.raw.get("deprecated_ids") or []
+    else:
+        aliases, deprecated = entry.aliases, entry.deprecated_ids
+    for name in aliases:
+        yield "alias", name
+    for name in deprecated:
+        yield "deprecated", name
+
+
+def fold_names(entries: Iterable[PromptEntry | StarterKit]) -> dict[str, Resolution]:
+    """Folded name → resolution for ``entries``, applying the claim order above."""
+    table: dict[str, Resolution] = {}
+    for entry in entries:
+        for via, name in entry_names(entry):
+            key = fold(name)
+            held = table.get(key)
+            if held is None or VIAS.index(via) < VIAS.index(held.via):
+                table[key] = Resolution(entry.id, via)
+    return table
+
+
+class NameIndex:
+    """Folded prompt and kit names of one catalog generation."""
+
+    def __init__(self, prompts: Iterable[PromptEntry], kits: Iterable[StarterKit] = ()):
+        self.prompts = fold_names(prompts)
+        self.kits = fold_names(kits)
+
+    def prompt(self, name: str) -> Resolution | None:
+        return self.prompts.get(fold(name))
+
+    def kit(self, name: str) -> Resolution | None:
+        return self.kits.get(fold(name))
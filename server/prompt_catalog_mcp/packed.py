@@ -0,0 +1,306 @@
+"""
+Packed catalog file — one read-only, memory-mapped file per catalog.
+
+Layout (little-endian)::
+
+    header          magic "PCPK", format, prompt count, instruction count,
+                    index offset/length, prompt table offset,
+                    instruction table offset
+    index           UTF-8 JSON: prompt paths and order, instruction metadata,
+                    starter kits and the source file map
+    prompt table    fixed-width records sorted by prompt ID
+    instr. table    fixed-width records sorted by instruction stem
+    keys, blobs     UTF-8 keys; per prompt its body, YAML source and
+                    metadata JSON; full instruction files
+
+A prompt record is ``(key offset, key length)`` followed by an
+``(offset, length)`` pair for each of its three blobs; an instruction record
+has a single blob. ``Catalog.open_packed`` maps the file and reads only the
+index; a prompt's metadata is decoded the first time one of its fields is
+read and its body and source on every read, so several server processes on
+one host share a single page-cached copy and never touch the source tree.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+from bisect import bisect_left
+from pathlib import Path
+
+from . import __version__
+from .catalog import Catalog, InstructionEntry, PromptEntry, StarterKit
+from .parsing import load_yaml
+from .snapshot import SNAPSHOT_DIR
+
+PACK_FILE = "catalog.pack"
+PACK_MAGIC = b"PCPK"
+PACK_FORMAT = 2
+
+_HEADER = struct.Struct("<4sIIIQQQQ")
+_RECORD = struct.Struct("<QIQQ")  # key offset, key length, blob offset, blob length
+# key offset, key length, then offset and length of body, source and metadata
+_PROMPT_RECORD = struct.Struct("<QIQQQQQQ")
+_BODY, _SOURCE, _META = range(3)
+
+# Prompt fields stored in each prompt's metadata blob (the body has its own).
+_PROMPT_META = (
+    "version", "title", "description", "category", "subcategory", "skill_level",
+    "platforms", "tags", "variables", "expected_output", "quality_criteria",
+    "anti_patterns", "adversarial_tests", "related_prompts", "chain_position",
+    "aliases", "deprecated_ids",
+)
+_INSTRUCTION_META = (
+    "stem", "scope", "name", "description", "id", "version", "priority",
+    "load_with", "metadata", "body_offset",
+)
+
+
+def default_pack_path(root: Path) -> Path:
+    return root / SNAPSHOT_DIR / PACK_FILE
+
+
+# ── Writing ──────────────────────────────────────────────────────────
+
+
+def write_pack(catalog: Catalog, path: str | Path | None = None) -> Path:
+    """Pack ``catalog`` into a single file at ``path`` and return the path.
+
+    The file is written next to ``path`` and renamed into place; processes
+    that already mapped the previous file keep reading it unchanged.
+    """
+    root = catalog.root
+    path = Path(path) if path else default_pack_path(root)
+
+    prompts = sorted(catalog.prompts.values(), key=lambda p: p.id.encode("utf-8"))
+    instructions = sorted(catalog.instructions.values(), key=lambda i: i.stem.encode("utf-8"))
+    position = {p.id: i for i, p in enumerate(prompts)}
+    index = {
+        "version": __version__,
+        "root": str(root),
+        "prompts": [p.file_path.relative_to(root).as_posix() for p in prompts],
+        "instructions": [
+            {**{name: getattr(i, name) for name in _INSTRUCTION_META},
+             "file_path": i.file_path.relative_to(root).as_posix()}
+            for i in instructions
+        ],
+        # Source order, so an opened pack iterates like a loaded catalog.
+        "prompt_order": [position[pid] for pid in catalog.prompts],
+        "instruction_order": list(catalog.instructions),
+        "files": [
+            [src.relative_to(root).as_posix(), kind, key]
+            for src, (kind, key) in catalog.files.items()
+        ],
+        "starter_kits": [
+            {
+                "id": k.id, "name": k.name, "description": k.description,
+                "target_audience": k.target_audience, "prompts": k.prompts,
+                "instructions": k.instructions, "tags": k.tags, "raw": k.raw,
+            }
+            for k in catalog.starter_kits.values()
+        ],
+    }
+    index_bytes = json.dumps(index, ensure_ascii=False, default=str).encode("utf-8")
+
+    index_off = _HEADER.size
+    prompt_table_off = index_off + len(index_bytes)
+    instruction_table_off = prompt_table_off + _PROMPT_RECORD.size * len(prompts)
+    data_off = instruction_table_off + _RECORD.size * len(instructions)
+
+    records = bytearray()
+    data = bytearray()
+
+    def add(record: struct.Struct, key: str, *blobs: bytes) -> None:
+        fields = []
+        for chunk in (key.encode("utf-8"), *blobs):
+            fields += (data_off + len(data), len(chunk))
+            data.extend(chunk)
+        records.extend(record.pack(*fields))
+
+    for p in prompts:
+        meta = {name: getattr(p, name) for name in _PROMPT_META}
+        add(
+            _PROMPT_RECORD, p.id,
+            (p.prompt_text or "").encode("utf-8"),
+            p.read_text().encode("utf-8"),
+            json.dumps(meta, ensure_ascii=False, default=str).encode("utf-8"),
+        )
+    for i in instructions:
+        add(_RECORD, i.stem, i.file_path.read_bytes())
+
+    header = _HEADER.pack(
+        PACK_MAGIC, PACK_FORMAT, len(prompts), len(instructions),
+        index_off, len(index_bytes), prompt_table_off, instruction_table_off,
+    )
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(header)
+            fh.write(index_bytes)
+            fh.write(records)
+            fh.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return path
+
+
+# ── Reading ──────────────────────────────────────────────────────────
+
+
+class PackedCatalogFile:
+    """A memory-mapped pack; bodies are decoded straight from the mapping."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        with self.path.open("rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) < _HEADER.size or self._mm[:4] != PACK_MAGIC:
+            self._mm.close()
+            raise ValueError(f"{self.path} is not a packed catalog")
+        (_, fmt, self.n_prompts, self.n_instructions, self._index_off, self._index_len,
+         self._prompt_table, self._instruction_table) = _HEADER.unpack_from(self._mm, 0)
+        if fmt != PACK_FORMAT:
+            self._mm.close()
+            raise ValueError(f"{self.path} uses packed catalog format {fmt}, not {PACK_FORMAT}")
+        # Slices of the view decode without an intermediate bytes copy.
+        self._view = memoryview(self._mm)
+
+    def index(self) -> dict:
+        """The catalog-level index; prompt metadata is not part of it."""
+        return json.loads(self._mm[self._index_off:self._index_off + self._index_len])
+
+    def _record(self, record: struct.Struct, table: int, index: int) -> tuple[int, ...]:
+        return record.unpack_from(self._mm, table + index * record.size)
+
+    def _prompt_blob(self, index: int, blob: int) -> str:
+        record = self._record(_PROMPT_RECORD, self._prompt_table, index)
+        off, length = record[2 + 2 * blob], record[3 + 2 * blob]
+        return str(self._view[off:off + length], "utf-8")
+
+    def prompt_id(self, index: int) -> str:
+        key_off, key_len = self._record(_PROMPT_RECORD, self._prompt_table, index)[:2]
+        return str(self._view[key_off:key_off + key_len], "utf-8")
+
+    def prompt_text(self, index: int) -> str:
+        return self._prompt_blob(index, _BODY)
+
+    def prompt_source(self, index: int) -> str:
+        """The prompt's YAML file as it was when the pack was written."""
+        return self._prompt_blob(index, _SOURCE)
+
+    def prompt_meta(self, index: int) -> dict:
+        return json.loads(self._prompt_blob(index, _META))
+
+    def instruction_text(self, index: int, skip: int = 0) -> str:
+        _, _, off, length = self._record(_RECORD, self._instruction_table, index)
+        return str(self._view[off + skip:off + length], "utf-8")
+
+    def _find(self, record: struct.Struct, table: int, count: int, key: str) -> int | None:
+        """Binary-search a record table for ``key``."""
+        target = key.encode("utf-8")
+        keys = _RecordKeys(self, record, table, count)
+        i = bisect_left(keys, target)
+        return i if i < count and keys[i] == target else None
+
+    def find_prompt(self, prompt_id: str) -> str | None:
+        """Prompt body by ID, without touching the index."""
+        i = self._find(_PROMPT_RECORD, self._prompt_table, self.n_prompts, prompt_id)
+        return None if i is None else self.prompt_text(i)
+
+    def close(self) -> None:
+        self._view.release()
+        self._mm.close()
+
+
+class _RecordKeys:
+    """Sequence view of a record table's keys, for ``bisect``."""
+
+    def __init__(self, pack: PackedCatalogFile, record: struct.Struct, table: int, count: int):
+        self._pack, self._record, self._table, self._count = pack, record, table, count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> bytes:
+        key_off, key_len = self._pack._record(self._record, self._table, index)[:2]
+        return self._pack._mm[key_off:key_off + key_len]
+
+
+class PackedPromptEntry(PromptEntry):
+    """A prompt served from the packed file.
+
+    Only ``id`` and ``file_path`` are set when the pack is opened; the other
+    fields are decoded from the prompt's metadata blob the first time one of
+    them is read, like ``LazyPromptEntry`` does with the YAML file.
+    """
+
+    __slots__ = ("_pack", "_index")
+
+    def __getattr__(self, name: str):
+        # Only called for attributes that are not set yet. ``prompt_text``
+        # and ``raw`` are never stored on the entry.
+        if name == "prompt_text":
+            return self._pack.prompt_text(self._index)
+        if name == "raw":
+            return load_yaml(self.read_text())
+        if name not in _PROMPT_META:
+            return PromptEntry.__getattr__(self, name)
+        for field_name, value in self._pack.prompt_meta(self._index).items():
+            setattr(self, field_name, value)
+        return object.__getattribute__(self, name)
+
+    def read_text(self) -> str:
+        return self._pack.prompt_source(self._index)
+
+
+class PackedInstructionEntry(InstructionEntry):
+    """An instruction whose file contents are served from the packed file."""
+
+    __slots__ = ("_pack", "_index")
+
+    def read_text(self) -> str:
+        return self._pack.instruction_text(self._index)
+
+    def read_body(self) -> str:
+        return self._pack.instruction_text(self._index, self.body_offset)
+
+
+def open_packed(path: str | Path) -> Catalog:
+    """Build a ``Catalog`` over a packed file (see ``Catalog.open_packed``)."""
+    pack = PackedCatalogFile(path)
+    meta = pack.index()
+    root = Path(meta["root"])
+
+    prompts = []
+    for index, rel in enumerate(meta["prompts"]):
+        entry = PackedPromptEntry.__new__(PackedPromptEntry)
+        entry.id = pack.prompt_id(index)
+        entry.file_path = root / rel
+        entry._pack = pack
+        entry._index = index
+        prompts.append(entry)
+
+    instructions = {}
+    for index, row in enumerate(meta["instructions"]):
+        entry = PackedInstructionEntry(
+            file_path=root / row["file_path"], **{name: row[name] for name in _INSTRUCTION_META}
+        )
+        entry._pack = pack
+        entry._index = index
+        instructions[entry.stem] = entry
+
+    kits = {row["id"]: StarterKit(**row) for row in meta["starter_kits"]}
+    return Catalog(
+        root=root,
+        prompts={prompts[i].id: prompts[i] for i in meta["prompt_order"]},
+        instructions={stem: instructions[stem] for stem in meta["instruction_order"]},
+        starter_kits=kits,
+        files={root / rel: (kind, key) for rel, kind, key in meta["files"]},
+    )
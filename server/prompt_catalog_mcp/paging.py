@@ -0,0 +1,86 @@
+"""
+Paging — sort orders and resumable cursors for streamed prompt listings.
+
+A cursor records where a page ended: the sort key of the last prompt shown
+(or, for ranked search, its score and ID), not a position. Resuming from it
+skips everything up to that key, so pages neither repeat nor drop prompts
+when earlier ones are added or removed between requests, for example by a
+hot reload.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from typing import TYPE_CHECKING, Callable, Sequence
+
+if TYPE_CHECKING:
+    from .catalog import PromptEntry
+    from .search import SearchHit
+
+# Listing order → sort key. Every key ends with the (unique) prompt ID.
+ORDERS: dict[str, Callable[["PromptEntry"], tuple]] = {
+    "id": lambda p: (p.id,),
+    "title": lambda p: (p.title.lower(), p.id),
+}
+
+# Order → types of the sort key fields a cursor must carry.
+_KEY_TYPES: dict[str, tuple[type | tuple[type, ...], ...]] = {
+    "id": (str,),
+    "title": (str, str),
+    "relevance": ((int, float), str),
+}
+
+
+def sort_key(order: str) -> Callable[["PromptEntry"], tuple]:
+    try:
+        return ORDERS[order]
+    except KeyError:
+        raise ValueError(f"Unknown order {order!r}; expected one of {', '.join(ORDERS)}") from None
+
+
+def encode_cursor(order: str, key: Sequence) -> str:
+    payload = json.dumps([order, *key], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, order: str) -> tuple:
+    """The sort key stored in ``cursor``; it must come from the same ``order``."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        stored, *key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, TypeError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from exc
+    if stored != order:
+        raise ValueError(f"Cursor was issued for order {stored!r}, not {order!r}")
+    types = _KEY_TYPES.get(order)
+    if types is not None and (
+        len(key) != len(types)
+        or not all(isinstance(v, t) and not isinstance(v, bool) for v, t in zip(key, types))
+    ):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return tuple(key)
+
+
+def prompt_cursor(entry: "PromptEntry", order: str = "id") -> str:
+    """Cursor resuming a listing in ``order`` right after ``entry``."""
+    return encode_cursor(order, sort_key(order)(entry))
+
+
+def hit_cursor(hit: "SearchHit") -> str:
+    """Cursor resuming a ranked search right after ``hit``."""
+    return encode_cursor("relevance", (hit.score, hit.prompt.id))
+
+
+def resume_hits(hits: Sequence["SearchHit"], cursor: str) -> int:
+    """Position in best-first ``hits`` just after the hit ``cursor`` names.
+
+    If that prompt no longer matches, resume at the first lower score.
+    """
+    score, prompt_id = decode_cursor(cursor, "relevance")
+    for n, hit in enumerate(hits):
+        if hit.prompt.id == prompt_id:
+            return n + 1
+        if hit.score < score:
+            return n
+    return len(hits)
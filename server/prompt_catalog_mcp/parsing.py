@@ -0,0 +1,141 @@
+"""
+YAML parsing shared by the catalog loader and the validator.
+
+Uses PyYAML's libyaml-backed ``CSafeLoader`` when PyYAML was built with it
+and falls back to the pure-Python ``SafeLoader`` otherwise. Both accept the
+same documents and build the same Python objects; libyaml is just faster.
+
+PyYAML itself is imported on first use, so loads served entirely from the
+snapshot or manifest never pay for it.
+
+Also reads the frontmatter of ``.instructions.md`` files without loading
+their (much larger) bodies.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_YAML_NAMES = ("SafeLoader", "YAML_BACKEND", "YAMLError")
+
+
+def _import_yaml() -> None:
+    """Bind ``SafeLoader``, ``YAML_BACKEND`` and ``YAMLError`` at module level."""
+    global _yaml, SafeLoader, YAML_BACKEND, YAMLError
+    import yaml
+
+    _yaml = yaml
+    try:
+        SafeLoader = yaml.CSafeLoader
+        YAML_BACKEND = "libyaml"
+    except AttributeError:  # PyYAML built without libyaml
+        SafeLoader = yaml.SafeLoader
+        YAML_BACKEND = "python"
+    YAMLError = yaml.YAMLError
+    logger.debug("YAML backend: %s", YAML_BACKEND)
+
+
+def __getattr__(name: str):
+    if name in _YAML_NAMES:
+        _import_yaml()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def load_yaml(text: str | bytes, loader: type | None = None):
+    """Parse a single YAML document with the fastest available safe loader."""
+    if "SafeLoader" not in globals():
+        _import_yaml()
+    return _yaml.load(text, Loader=loader or SafeLoader)
+
+
+# ── Markdown frontmatter ─────────────────────────────────────────────
+
+METADATA_OPEN = b"<!-- Catalog Metadata"
+METADATA_CLOSE = b"-->"
+
+
+@dataclass
+class MarkdownHead:
+    """Frontmatter and catalog metadata read from the top of a markdown file."""
+
+    frontmatter: dict | None  # None when the file has no ``---`` block
+    metadata: dict[str, str]  # ``<!-- Catalog Metadata`` key/value pairs
+    body_offset: int  # byte offset of the first body line
+
+
+def read_markdown_head(path: Path) -> MarkdownHead:
+    """Read only the YAML frontmatter and metadata comment at the top of ``path``.
+
+    The file is consumed line by line up to the closing ``---`` and, if it
+    follows, the end of the ``<!-- Catalog Metadata ... -->`` block; the body
+    is left unread. Raises ``ValueError`` for unterminated frontmatter and
+    ``YAMLError`` for frontmatter that is not valid YAML.
+    """
+    with path.open("rb") as fh:
+        first = fh.readline()
+        if not first.startswith(b"---"):
+            return MarkdownHead(None, {}, 0)
+
+        lines = [first[3:]]
+        while True:
+            line = fh.readline()
+            if not line:
+                raise ValueError("frontmatter is not closed with ---")
+            if line.strip() == b"---":
+                break
+            lines.append(line)
+        frontmatter = load_yaml(b"".join(lines).decode("utf-8"))
+        if frontmatter is None:
+            frontmatter = {}
+        body_offset = fh.tell()
+
+        line = fh.readline()
+        while line and not line.strip():
+            line = fh.readline()
+        if not line.strip().startswith(METADATA_OPEN):
+            return MarkdownHead(frontmatter, {}, body_offset)
+
+        metadata: dict[str, str] = {}
+        while True:
+            line = fh.readline()
+            if not line:
+                # Unterminated comment: treat it as body text.
+                return MarkdownHead(frontmatter, {}, body_offset)
+            stripped = line.strip()
+            closed = stripped.endswith(METADATA_CLOSE)
+            if closed:
+                stripped = stripped[: -len(METADATA_CLOSE)]
+            key, sep, value = stripped.decode("utf-8").partition(":")
+            if sep and key.strip():
+                metadata[key.strip()] = value.strip()
+            if closed:
+                break
+        return MarkdownHead(frontmatter, metadata, fh.tell())
+
+
+def read_body(path: Path, offset: int, limit: int = -1) -> str:
+    """Read the body of a markdown file from ``offset`` (up to ``limit`` chars)."""
+    with path.open(encoding="utf-8") as fh:
+        fh.seek(offset)
+        return fh.read(limit)
+
+
+def body_has_content(path: Path, offset: int, min_chars: int) -> bool:
+    """True if the stripped body from ``offset`` has at least ``min_chars`` chars.
+
+    Reads in small chunks and stops as soon as the answer is known.
+    """
+    with path.open(encoding="utf-8") as fh:
+        fh.seek(offset)
+        body = ""
+        while len(body.strip()) < min_chars:
+            chunk = fh.read(4096)
+            if not chunk:
+                return False
+            body += chunk
+        return True
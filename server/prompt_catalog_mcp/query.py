@@ -0,0 +1,471 @@
+"""
+Query language — boolean prompt queries compiled to index operations.
+
+    category:testing AND (platform:web OR platform:cloud) AND NOT tag:legacy
+        AND skill<=advanced "load test"
+
+* ``field:value`` matches a facet: ``category``, ``subcategory``,
+  ``platform`` (prompts for ``all`` platforms match any) or ``tag``.
+  ``skill`` compares against the skill order with ``:``/``=``, ``<``,
+  ``<=``, ``>`` or ``>=``.
+* Bare words must appear in the prompt text, as for ``Catalog.search``; the
+  query's last word also matches as a prefix. A ``"quoted phrase"`` must
+  appear with its words in that order.
+* ``AND`` (or nothing), ``OR``, ``NOT`` and parentheses combine terms;
+  ``NOT`` binds tightest, then ``AND``, then ``OR``. Operators are
+  upper-case, so a lowercase "and" or "or" is an ordinary word.
+
+A query is parsed into an AST, then optimized against one catalog
+generation's indexes: nested ANDs/ORs are flattened, each node gets a
+cardinality estimate from its posting lists, AND operands run smallest
+first with negations subtracted last, and evaluation stops as soon as an
+intersection comes up empty. Facet terms read ``facets.FacetIndex``
+postings and words read ``search.SearchIndex`` postings; matches are ranked
+by the BM25 score of the words they contain. ``QueryPlan.explain()`` lists
+every step with its estimate and actual result size. A catalog opened from a
+SQLite store runs the same AST as one SQL statement instead (see
+``CatalogStore.query_plan``), and its plan shows that statement.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Iterator, Union
+
+from .catalog import SKILL_ORDER
+from .facets import FacetIndex
+from .search import FIELD_BOOSTS, SearchHit, SearchIndex, _field_text, tokenize
+
+FACET_FIELDS = ("category", "subcategory", "platform", "tag")
+SKILL_FIELDS = ("skill", "skill_level")
+
+
+class QuerySyntaxError(ValueError):
+    """The query could not be parsed; the message says where."""
+
+
+# ── AST ──────────────────────────────────────────────────────────────
+
+
+def _quote(value: str) -> str:
+    return f'"{value}"' if re.search(r'[\s()"]', value) or not value else value
+
+
+@dataclass(frozen=True)
+class Facet:
+    field: str
+    value: str
+
+    def __str__(self) -> str:
+        return f"{self.field}:{_quote(self.value)}"
+
+
+@dataclass(frozen=True)
+class Skill:
+    op: str
+    level: str
+
+    def __str__(self) -> str:
+        return f"skill{'=' if self.op == ':' else self.op}{self.level}"
+
+
+@dataclass(frozen=True)
+class Text:
+    """Words that must all appear; a phrase also needs them adjacent and in order."""
+
+    terms: tuple[str, ...]
+    phrase: bool = False
+    prefix: bool = False
+
+    def __str__(self) -> str:
+        text = " ".join(self.terms) + ("*" if self.prefix else "")
+        return f'"{text}"' if self.phrase else text
+
+
+@dataclass(frozen=True)
+class Not:
+    child: "Node"
+
+    def __str__(self) -> str:
+        return f"NOT {_group(self.child)}"
+
+
+@dataclass(frozen=True)
+class And:
+    children: tuple["Node", ...]
+
+    def __str__(self) -> str:
+        return " AND ".join(_group(c) for c in self.children)
+
+
+@dataclass(frozen=True)
+class Or:
+    children: tuple["Node", ...]
+
+    def __str__(self) -> str:
+        return " OR ".join(_group(c) for c in self.children)
+
+
+Node = Union[Facet, Skill, Text, Not, And, Or]
+
+
+def _group(node: Node) -> str:
+    return f"({node})" if isinstance(node, (And, Or)) else str(node)
+
+
+# ── Parser ───────────────────────────────────────────────────────────
+
+_LEXER = re.compile(
+    r"""
+    \s*(?:
+        (?P<lparen>\() | (?P<rparen>\)) |
+        "(?P<phrase>[^"]*)" |
+        (?P<field>[A-Za-z_]+)(?P<op><=|>=|<|>|=|:)(?:"(?P<qvalue>[^"]*)"|(?P<value>[^\s()"]+)) |
+        (?P<word>[^\s()"]+)
+    )
+    """,
+    re.VERBOSE,
+)
+
+
+def _lex(text: str) -> list[tuple[str, object, int]]:
+    tokens: list[tuple[str, object, int]] = []
+    pos = 0
+    while pos < len(text):
+        if text[pos:].strip() == "":
+            break
+        m = _LEXER.match(text, pos)
+        if m is None or m.end() == pos:
+            column = pos + len(text[pos:]) - len(text[pos:].lstrip())
+            raise QuerySyntaxError(f"Unterminated quote at column {column + 1}")
+        start = m.start(m.lastgroup) if m.lastgroup else pos
+        if m.group("lparen"):
+            tokens.append(("(", None, start))
+        elif m.group("rparen"):
+            tokens.append((")", None, start))
+        elif m.group("phrase") is not None:
+            tokens.append(("phrase", m.group("phrase"), start))
+        elif m.group("field"):
+            value = m.group("qvalue") if m.group("qvalue") is not None else m.group("value")
+            tokens.append(("field", (m.group("field").lower(), m.group("op"), value), m.start("field")))
+        elif m.group("word") in ("AND", "OR", "NOT"):
+            tokens.append((m.group("word"), None, start))
+        else:
+            tokens.append(("word", m.group("word"), start))
+        pos = m.end()
+    return tokens
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.tokens = _lex(text)
+        self.i = 0
+        # The query's final bare word matches as a prefix, as in Catalog.search.
+        last = self.tokens[-1] if self.tokens else None
+        self.prefix_at = len(self.tokens) - 1 if last and last[0] == "word" else -1
+
+    def peek(self) -> str | None:
+        return self.tokens[self.i][0] if self.i < len(self.tokens) else None
+
+    def error(self, message: str) -> QuerySyntaxError:
+        if self.i < len(self.tokens):
+            return QuerySyntaxError(f"{message} at column {self.tokens[self.i][2] + 1}")
+        return QuerySyntaxError(f"{message} at end of query")
+
+    def parse(self) -> Node | None:
+        if not self.tokens:
+            return None
+        node = self.or_expr()
+        if self.peek() is not None:
+            raise self.error("Unexpected ')'" if self.peek() == ")" else "Unexpected token")
+        return node
+
+    def or_expr(self) -> Node | None:
+        children = [self.and_expr()]
+        while self.peek() == "OR":
+            self.i += 1
+            children.append(self.and_expr())
+        children = [c for c in children if c is not None]
+        if not children:
+            return None
+        return children[0] if len(children) == 1 else Or(tuple(children))
+
+    def and_expr(self) -> Node | None:
+        children = [self.not_expr()]
+        while self.peek() not in (None, ")", "OR"):
+            if self.peek() == "AND":
+                self.i += 1
+            children.append(self.not_expr())
+        children = [c for c in children if c is not None]
+        if not children:
+            return None
+        return children[0] if len(children) == 1 else And(tuple(children))
+
+    def not_expr(self) -> Node | None:
+        if self.peek() == "NOT":
+            self.i += 1
+            child = self.not_expr()
+            if child is None:
+                raise self.error("NOT needs a term")
+            return Not(child)
+        return self.atom()
+
+    def atom(self) -> Node | None:
+        kind = self.peek()
+        if kind is None:
+            raise self.error("Expected a term")
+        _, value, _ = self.tokens[self.i]
+        if kind == "(":
+            self.i += 1
+            node = self.or_expr()
+            if self.peek() != ")":
+                raise self.error("Expected ')'")
+            self.i += 1
+            return node
+        if kind in (")", "AND", "OR"):
+            raise self.error(f"Unexpected {kind!r}")
+        index = self.i
+        self.i += 1
+        if kind == "field":
+            return self.field_term(*value)
+        terms = tuple(tokenize(value))
+        if not terms:
+            return None  # punctuation only
+        if kind == "phrase":
+            return Text(terms, phrase=len(terms) > 1)
+        return Text(terms, prefix=index == self.prefix_at)
+
+    def field_term(self, name: str, op: str, value: str) -> Node:
+        if name in SKILL_FIELDS:
+            if value not in SKILL_ORDER:
+                self.i -= 1
+                raise self.error(f"Unknown skill level {value!r} (expected {', '.join(SKILL_ORDER)})")
+            return Skill(op, value)
+        if name not in FACET_FIELDS:
+            self.i -= 1
+            fields = ", ".join((*FACET_FIELDS, "skill"))
+            raise self.error(f"Unknown field {name!r} (expected one of {fields})")
+        if op != ":":
+            self.i -= 1
+            raise self.error(f"Only skill supports {op!r}; use {name}:{value}")
+        return Facet(name, value)
+
+
+def parse(text: str) -> Node | None:
+    """The AST for ``text``, or None for a query with no terms."""
+    return _Parser(text).parse()
+
+
+# ── Planning and execution ───────────────────────────────────────────
+
+
+@dataclass
+class Step:
+    """One node of an executed plan."""
+
+    node: Node
+    estimate: int
+    depth: int
+    result: int | None = None  # None when short-circuited
+
+
+@dataclass
+class QueryPlan:
+    """An optimized query with the cardinalities seen while running it."""
+
+    text: str
+    root: Node | None
+    steps: list[Step] = field(default_factory=list)
+    hits: list[SearchHit] = field(default_factory=list)
+    total: int = 0
+    sql: str | None = None  # the statement a store ran, in place of steps
+
+    def explain(self) -> str:
+        lines = [f"query: {self.root if self.root is not None else '(empty)'}"]
+        if self.sql:
+            lines.append(f"sql: {self.sql}")
+        for step in self.steps:
+            label = _label(step.node)
+            result = "skipped" if step.result is None else str(step.result)
+            lines.append(f"{'  ' * step.depth}{label}  est={step.estimate}  actual={result}")
+        lines.append(f"{self.total} match(es)")
+        return "\n".join(lines)
+
+
+def _label(node: Node) -> str:
+    if isinstance(node, And):
+        return f"AND ({len(node.children)} operands)"
+    if isinstance(node, Or):
+        return f"OR ({len(node.children)} operands)"
+    if isinstance(node, Not):
+        return "NOT"
+    return str(node)
+
+
+class QueryEngine:
+    """Runs queries against one catalog generation's facet and text indexes."""
+
+    def __init__(self, facets: FacetIndex, search: SearchIndex):
+        self.facets = facets
+        self.search = search
+        self.size = len(facets)
+        self._term_cache: dict[tuple[str, bool], dict[int, float]] = {}
+
+    # -- leaves --
+
+    def _term(self, term: str, prefix: bool) -> dict[int, float]:
+        key = (term, prefix)
+        scores = self._term_cache.get(key)
+        if scores is None:
+            scores = self._term_cache[key] = self.search.term_scores(term, prefix)
+        return scores
+
+    def _facet(self, node: Facet) -> set[int]:
+        postings = getattr(self.facets, node.field)
+        if node.field == "platform":
+            return postings.get(node.value, self.facets.wildcard)
+        return postings.get(node.value, set())
+
+    def _text(self, node: Text) -> set[int]:
+        lists = sorted(
+            (self._term(t, node.prefix and i == len(node.terms) - 1) for i, t in enumerate(node.terms)),
+            key=len,
+        )
+        docs = set(lists[0])
+        for scores in lists[1:]:
+            docs.intersection_update(scores)
+            if not docs:
+                break
+        if node.phrase and docs:
+            docs = {n for n in docs if self._has_phrase(n, node.terms)}
+        return docs
+
+    def _has_phrase(self, n: int, terms: tuple[str, ...]) -> bool:
+        entry = self.search.entries[n]
+        needle = f" {' '.join(terms)} "
+        return any(
+            needle in f" {' '.join(tokenize(_field_text(entry, name)))} " for name in FIELD_BOOSTS
+        )
+
+    # -- planning --
+
+    def estimate(self, node: Node) -> int:
+        if isinstance(node, Facet):
+            return len(self._facet(node))
+        if isinstance(node, Skill):
+            return len(self.facets.skill(node.op, node.level))
+        if isinstance(node, Text):
+            return min(len(self._term(t, node.prefix and i == len(node.terms) - 1))
+                       for i, t in enumerate(node.terms))
+        if isinstance(node, Not):
+            return self.size - self.estimate(node.child)
+        if isinstance(node, And):
+            return min(self.estimate(c) for c in node.children)
+        return min(self.size, sum(self.estimate(c) for c in node.children))
+
+    def optimize(self, node: Node) -> Node:
+        """Flatten nested operators and order AND operands most selective first."""
+        if isinstance(node, Not):
+            child = self.optimize(node.child)
+            return child.child if isinstance(child, Not) else Not(child)
+        if isinstance(node, (And, Or)):
+            kind = type(node)
+            flat: list[Node] = []
+            for child in (self.optimize(c) for c in node.children):
+                flat.extend(child.children if isinstance(child, kind) else (child,))
+            flat = list(dict.fromkeys(flat))  # drop repeated operands
+            if len(flat) == 1:
+                return flat[0]
+            if kind is And:
+                # Positive operands by size, then negations (applied as set differences).
+                flat.sort(key=lambda c: (isinstance(c, Not), self.estimate(c)))
+            else:
+                flat.sort(key=self.estimate, reverse=True)
+            return kind(tuple(flat))
+        return node
+
+    # -- execution --
+
+    def _run(self, node: Node, depth: int, steps: list[Step]) -> set[int]:
+        step = Step(node, self.estimate(node), depth)
+        steps.append(step)
+        if isinstance(node, Facet):
+            result = self._facet(node)
+        elif isinstance(node, Skill):
+            result = self.facets.skill(node.op, node.level)
+        elif isinstance(node, Text):
+            result = self._text(node)
+        elif isinstance(node, Not):
+            result = set(range(self.size)) - self._run(node.child, depth + 1, steps)
+        elif isinstance(node, Or):
+            result = set()
+            for child in node.children:
+                result |= self._run(child, depth + 1, steps)
+        else:
+            result = self._run_and(node, depth, steps)
+        step.result = len(result)
+        return result
+
+    def _run_and(self, node: And, depth: int, steps: list[Step]) -> set[int]:
+        result: set[int] | None = None
+        for child in node.children:
+            if result is not None and not result:
+                self._skip(child, depth + 1, steps)
+                continue
+            if isinstance(child, Not):
+                # Subtract instead of building the complement.
+                negated = Step(child, self.estimate(child), depth + 1)
+                steps.append(negated)
+                excluded = self._run(child.child, depth + 2, steps)
+                result = (set(range(self.size)) if result is None else result) - excluded
+                negated.result = len(result)
+            else:
+                members = self._run(child, depth + 1, steps)
+                result = set(members) if result is None else result & members
+        return result or set()
+
+    def _skip(self, node: Node, depth: int, steps: list[Step]) -> None:
+        steps.append(Step(node, self.estimate(node), depth))
+        for child in _children(node):
+            self._skip(child, depth + 1, steps)
+
+    def run(self, text: str, limit: int | None = None) -> QueryPlan:
+        """Parse, optimize and run ``text``; hits are best first."""
+        root = parse(text)
+        plan = QueryPlan(text, root)
+        if root is None:
+            return plan
+        plan.root = root = self.optimize(root)
+        docs = self._run(root, 0, plan.steps)
+        plan.total = len(docs)
+
+        # Each word counts once (as a prefix if it is one anywhere), like search().
+        words: dict[str, bool] = {}
+        for leaf in scoring_terms(root):
+            for i, term in enumerate(leaf.terms):
+                words[term] = words.get(term, False) or (leaf.prefix and i == len(leaf.terms) - 1)
+        scores = dict.fromkeys(docs, 0.0)
+        for term, prefix in words.items():
+            for doc, score in self._term(term, prefix).items():
+                if doc in scores:
+                    scores[doc] += score
+        plan.hits = self.search.top(scores, limit)
+        return plan
+
+
+def _children(node: Node) -> tuple[Node, ...]:
+    if isinstance(node, (And, Or)):
+        return node.children
+    if isinstance(node, Not):
+        return (node.child,)
+    return ()
+
+
+def scoring_terms(node: Node) -> Iterator[Text]:
+    """Word and phrase leaves outside any NOT."""
+    if isinstance(node, Text):
+        yield node
+    elif isinstance(node, (And, Or)):
+        for child in node.children:
+            yield from scoring_terms(child)
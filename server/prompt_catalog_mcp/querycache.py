@@ -0,0 +1,124 @@
+"""
+Query result cache — an LRU over filter, facet, search and suggest results.
+
+``Catalog.enable_query_cache()`` attaches a ``QueryCache`` that later catalog
+generations inherit through ``Catalog.reload``. Entries are keyed by the
+catalog generation plus the normalized query parameters, so equivalent calls
+(``tag=["b", "a"]`` and ``tag=["a", "b"]``, different spacing or case in a
+search) share an entry. The first lookup from a newer generation drops every
+entry cached for the older one; lookups still running against an older
+generation bypass the cache rather than evicting current results.
+
+The cache is bounded by an entry count and by an approximate byte budget.
+Sizes count the containers a result keeps alive; prompt entries and their
+strings belong to the catalog and are not charged.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+from typing import Callable, Hashable, TypeVar
+
+from .catalog import PromptEntry
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+def approx_size(value: object) -> int:
+    """Bytes held by ``value`` beyond the catalog's own entries and strings."""
+    if value is None or isinstance(value, (str, PromptEntry)):
+        return 0
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(approx_size(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(approx_size(item) for item in value.values())
+    if is_dataclass(value):
+        return sys.getsizeof(value) + sum(approx_size(getattr(value, f.name)) for f in fields(value))
+    return sys.getsizeof(value)
+
+
+class QueryCache:
+    """Generation-aware LRU cache with entry and byte budgets."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        sizeof: Callable[[object], int] = approx_size,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.generation = 0
+        self._entries: OrderedDict[Hashable, tuple[object, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(self, generation: int, key: Hashable, compute: Callable[[], T]) -> T:
+        """Return the cached result for ``key``, computing and storing it on a miss."""
+        with self._lock:
+            if generation > self.generation:
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+                self.bytes = 0
+                self.generation = generation
+            current = generation == self.generation
+            if current and key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+
+        value = compute()
+        if not current:
+            return value
+
+        size = self.sizeof(value)
+        with self._lock:
+            if generation != self.generation or size > self.max_bytes:
+                return value
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._entries[key] = (value, size)
+            self.bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries or self.bytes > self.max_bytes
+            ):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "generation": self.generation,
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,72 @@
+"""
+Rendered-output cache — an LRU over rendered prompts and the results built from them.
+
+``Catalog.enable_render_cache()`` attaches a ``RenderCache`` that, like the
+query cache, later catalog generations inherit through ``Catalog.reload`` and
+that the first lookup from a newer generation empties. Entries are keyed by
+prompt ID, ``version``, the sha256 of the prompt body and the arguments the body
+actually uses, sorted: argument order and unused arguments do not split
+entries, and an edited body never matches an older rendering.
+
+Next to the plain text from ``Catalog.render``, callers can cache an object
+built from it (the MCP server keeps its ``GetPromptResult``) under their own
+``kind``. Unlike query results, rendered text is new memory, so sizes count
+every string a value holds.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING, Callable, Mapping, TypeVar
+
+from .querycache import QueryCache
+
+if TYPE_CHECKING:
+    from .catalog import PromptEntry
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def rendered_size(value: object) -> int:
+    """Bytes held by ``value``, strings included."""
+    if isinstance(value, (str, bytes, int, float, bool)) or value is None:
+        return sys.getsizeof(value)
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(rendered_size(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(rendered_size(item) for item in value.values())
+    attributes = getattr(value, "__dict__", None)
+    if attributes is not None:  # dataclasses, pydantic models
+        return sys.getsizeof(value) + rendered_size(attributes)
+    return sys.getsizeof(value)
+
+
+def render_key(kind: str, entry: "PromptEntry", arguments: Mapping[str, str] | None) -> tuple:
+    """The cache key for rendering ``entry`` with ``arguments`` into ``kind``."""
+    template = entry.template
+    used = template.placeholders
+    # The body's sha256 is computed once per compiled template; unlike hash(),
+    # it is the same in every process.
+    canonical = tuple(sorted((k, v) for k, v in arguments.items() if k in used)) if arguments else ()
+    return (kind, entry.id, entry.version, template.sha256, canonical)
+
+
+class RenderCache(QueryCache):
+    """Generation-aware LRU of rendered prompts with entry and byte budgets."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        super().__init__(max_entries, max_bytes, sizeof=rendered_size)
+
+    def get_or_render(
+        self,
+        generation: int,
+        kind: str,
+        entry: "PromptEntry",
+        arguments: Mapping[str, str] | None,
+        build: Callable[[], T],
+    ) -> T:
+        """Return the cached ``kind`` rendering of ``entry``, calling ``build`` on a miss."""
+        return self.get_or_compute(generation, render_key(kind, entry, arguments), build)
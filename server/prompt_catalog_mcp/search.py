@@ -0,0 +1,159 @@
+"""
+Full-text search — a BM25F inverted index over prompt fields.
+
+Every prompt's ID, title, description, tags, body, quality criteria and
+anti-patterns are tokenized once when the index is built. For each term the
+index keeps the prompts containing it with a pre-computed, field-boosted and
+length-normalized term frequency, so a query only touches the posting lists
+of its own terms:
+
+* every query term must match (like the SQLite store's FTS5 search);
+* the last term also matches longer terms it is a prefix of, so results
+  keep up with a query that is still being typed;
+* prompts are scored with BM25 over the boosted frequencies and the top
+  ``limit`` are taken with a heap instead of sorting every match.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Iterable
+
+from .catalog import PromptEntry
+
+# Field → boost. A term in the title counts four times one in the body. The
+# body comes first: it is the largest field and seeds each prompt's weights.
+FIELD_BOOSTS = {
+    "prompt_text": 1.0,
+    "id": 3.0,
+    "title": 4.0,
+    "tags": 3.0,
+    "description": 2.0,
+    "quality_criteria": 1.0,
+    "anti_patterns": 0.5,
+}
+K1 = 1.2
+B = 0.75
+# Query prefixes shorter than this only match whole terms.
+MIN_PREFIX = 3
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN.findall(text.lower())
+
+
+def _field_text(entry: PromptEntry, name: str) -> str:
+    value = getattr(entry, name)
+    if isinstance(value, str):
+        return value
+    return " ".join(str(item) for item in value or ())
+
+
+@dataclass
+class SearchHit:
+    """A search result and its BM25 score (higher is better)."""
+
+    prompt: PromptEntry
+    score: float
+
+
+class SearchIndex:
+    """BM25F posting lists over one catalog generation's prompts."""
+
+    def __init__(self, prompts: Iterable[PromptEntry]):
+        self.entries: list[PromptEntry] = list(prompts)
+        n = len(self.entries)
+
+        field_counts: dict[str, list[Counter]] = {}
+        avg_length: dict[str, float] = {}
+        for name in FIELD_BOOSTS:
+            counts = [Counter(tokenize(_field_text(p, name))) for p in self.entries]
+            field_counts[name] = counts
+            total = sum(c.total() for c in counts)
+            avg_length[name] = total / n if total else 1.0
+
+        # term → {prompt number: boosted, length-normalized frequency}
+        postings: dict[str, dict[int, float]] = defaultdict(dict)
+        for doc in range(n):
+            weights: dict[str, float] = {}
+            for name, boost in FIELD_BOOSTS.items():
+                counts = field_counts[name][doc]
+                if not counts:
+                    continue
+                norm = boost / (1 - B + B * counts.total() / avg_length[name])
+                if not weights:
+                    weights = {term: tf * norm for term, tf in counts.items()}
+                    continue
+                for term, tf in counts.items():
+                    weights[term] = weights.get(term, 0.0) + tf * norm
+            for term, w in weights.items():
+                postings[term][doc] = w
+
+        self.postings = dict(postings)
+        self.terms = sorted(postings)
+        self.idf = {
+            term: math.log(1 + (n - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, docs in postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _expand(self, prefix: str) -> list[str]:
+        """Indexed terms starting with ``prefix``."""
+        i = bisect_left(self.terms, prefix)
+        out = []
+        while i < len(self.terms) and self.terms[i].startswith(prefix):
+            out.append(self.terms[i])
+            i += 1
+        return out
+
+    def term_scores(self, term: str, prefix: bool = False) -> dict[int, float]:
+        """BM25 contribution of one query term for each prompt containing it."""
+        terms = self._expand(term) if prefix and len(term) >= MIN_PREFIX else [term]
+        scores: dict[int, float] = {}
+        for candidate in terms:
+            weights = self.postings.get(candidate)
+            if not weights:
+                continue
+            idf = self.idf[candidate]
+            for doc, w in weights.items():
+                score = idf * w * (K1 + 1) / (w + K1)
+                if score > scores.get(doc, 0.0):
+                    scores[doc] = score
+        return scores
+
+    def search(self, query: str, limit: int | None = None) -> list[SearchHit]:
+        """Prompts containing every query term, best first."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        per_term = [
+            self.term_scores(term, prefix=i == len(terms) - 1) for i, term in enumerate(terms)
+        ]
+        per_term.sort(key=len)
+        totals = dict(per_term[0])
+        for scores in per_term[1:]:
+            totals = {doc: s + scores[doc] for doc, s in totals.items() if doc in scores}
+            if not totals:
+                return []
+        return self.top(totals, limit)
+
+    def top(self, scores: dict[int, float], limit: int | None = None) -> list[SearchHit]:
+        """Hits for prompt number → score, best first; ties keep catalog order."""
+
+        def rank(item: tuple[int, float]) -> tuple[float, int]:
+            return item[1], -item[0]
+
+        if limit is None:
+            best = sorted(scores.items(), key=rank, reverse=True)
+        else:
+            best = heapq.nlargest(limit, scores.items(), key=rank)
+        return [SearchHit(self.entries[doc], score) for doc, score in best]
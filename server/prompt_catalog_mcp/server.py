@@ -9,23 +9,52 @@ Run with:
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import logging
 import os
+import sys
+from pathlib import Path
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from pydantic import AnyUrl
 from mcp.types import (
+    Completion,
+    CompletionArgument,
+    CompletionContext,
     GetPromptResult,
     Prompt,
     PromptArgument,
     PromptMessage,
+    PromptReference,
     Resource,
+    ResourceTemplate,
+    ResourceTemplateReference,
     TextContent,
+    Tool,
 )
 
 from .catalog import Catalog
 
 CATALOG_ROOT = os.environ.get("CATALOG_ROOT", os.getcwd())
+CATALOG_WORKERS = os.environ.get("PROMPT_CATALOG_WORKERS")
+CATALOG_STORE = os.environ.get("PROMPT_CATALOG_STORE")
+CATALOG_PACK = os.environ.get("PROMPT_CATALOG_PACK")
+CATALOG_TRUST_INDEX = os.environ.get("PROMPT_CATALOG_TRUST_INDEX", "").lower() in ("1", "true", "yes")
+CATALOG_WATCH = os.environ.get("PROMPT_CATALOG_WATCH", "").lower() in ("1", "true", "yes")
+WATCH_INTERVAL = float(os.environ.get("PROMPT_CATALOG_WATCH_INTERVAL", "1.0"))
+# Query result cache budgets; 0 entries turns the cache off.
+QUERY_CACHE_ENTRIES = int(os.environ.get("PROMPT_CATALOG_QUERY_CACHE", "1024"))
+QUERY_CACHE_BYTES = int(os.environ.get("PROMPT_CATALOG_QUERY_CACHE_BYTES", str(16 * 1024 * 1024)))
+# Rendered prompt cache budgets; 0 entries turns the cache off.
+RENDER_CACHE_ENTRIES = int(os.environ.get("PROMPT_CATALOG_RENDER_CACHE", "256"))
+RENDER_CACHE_BYTES = int(os.environ.get("PROMPT_CATALOG_RENDER_CACHE_BYTES", str(32 * 1024 * 1024)))
+# The protocol caps a completion response at 100 values.
+COMPLETION_LIMIT = 100
+PROMPT_TEMPLATE = "prompt-catalog://prompts/{category}/{id}"
+
+logger = logging.getLogger(__name__)
 
 app = Server("prompt-catalog")
 _catalog: Catalog | None = None
@@ -34,10 +63,49 @@ _catalog: Catalog | None = None
 def _get_catalog() -> Catalog:
     global _catalog
     if _catalog is None:
-        _catalog = Catalog.load(CATALOG_ROOT)
+        if CATALOG_STORE:
+            _catalog = Catalog.open_store(CATALOG_STORE)
+        elif CATALOG_PACK:
+            _catalog = Catalog.open_packed(CATALOG_PACK)
+        else:
+            workers = int(CATALOG_WORKERS) if CATALOG_WORKERS else None
+            _catalog = Catalog.load(CATALOG_ROOT, workers=workers, trust_index=CATALOG_TRUST_INDEX)
+        if QUERY_CACHE_ENTRIES > 0:
+            _catalog.enable_query_cache(QUERY_CACHE_ENTRIES, QUERY_CACHE_BYTES)
+        if RENDER_CACHE_ENTRIES > 0:
+            _catalog.enable_render_cache(RENDER_CACHE_ENTRIES, RENDER_CACHE_BYTES)
     return _catalog
 
 
+def _reload_catalog(changed: set[Path]) -> Catalog:
+    """Re-read ``changed`` files and swap in the next catalog generation.
+
+    Handlers fetch the catalog once per request, so calls already running
+    finish against the generation they started with.
+    """
+    global _catalog
+    _catalog = _get_catalog().reload(changed)
+    logger.info(
+        "Reloaded %d catalog file(s); now at generation %d", len(changed), _catalog.generation
+    )
+    return _catalog
+
+
+async def _watch_catalog(interval: float = WATCH_INTERVAL) -> None:
+    """Poll the catalog sources for changes and reload them in the background."""
+    from .watcher import open_watcher
+
+    watcher = open_watcher(Path(CATALOG_ROOT).resolve())
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            changed = await asyncio.to_thread(watcher.poll)
+            if changed:
+                await asyncio.to_thread(_reload_catalog, changed)
+    finally:
+        watcher.close()
+
+
 # ── Resources ────────────────────────────────────────────────────────
 
 
@@ -69,6 +137,18 @@ async def list_resources() -> list[Resource]:
     return resources
 
 
+@app.list_resource_templates()
+async def list_resource_templates() -> list[ResourceTemplate]:
+    return [
+        ResourceTemplate(
+            name="prompt",
+            uriTemplate=PROMPT_TEMPLATE,
+            description="A prompt's YAML source, by category and prompt ID",
+            mimeType="text/yaml",
+        )
+    ]
+
+
 @app.read_resource()
 async def read_resource(uri: AnyUrl) -> str:
     catalog = _get_catalog()
@@ -79,7 +159,7 @@ async def read_resource(uri: AnyUrl) -> str:
         prompt_id = parts[-1] if parts else ""
         entry = catalog.prompts.get(prompt_id)
         if entry:
-            return entry.file_path.read_text(encoding="utf-8")
+            return entry.read_text()
         raise ValueError(f"Prompt not found: {prompt_id}")
 
     if uri_str.startswith("prompt-catalog://instructions/"):
@@ -87,7 +167,7 @@ async def read_resource(uri: AnyUrl) -> str:
         stem = parts[-1] if parts else ""
         entry = catalog.instructions.get(stem)
         if entry:
-            return entry.file_path.read_text(encoding="utf-8")
+            return entry.read_text()
         raise ValueError(f"Instruction not found: {stem}")
 
     raise ValueError(f"Unknown URI: {uri}")
@@ -127,44 +207,235 @@ async def get_prompt(
 ) -> GetPromptResult:
     catalog = _get_catalog()
 
-    # Match by lowercase ID
-    entry = None
-    for p in catalog.prompts.values():
-        if p.id.lower() == name.lower():
-            entry = p
-            break
-
+    # The advertised lowercase ID, any other casing, an alias or a deprecated ID
+    entry = catalog.find_prompt(name)
     if not entry:
-        raise ValueError(f"Prompt not found: {name}")
+        suggestions = [m.key.lower() for m in catalog.suggest(name, kinds=("id", "title"), limit=3)]
+        hint = f" (did you mean: {', '.join(dict.fromkeys(suggestions))}?)" if suggestions else ""
+        raise ValueError(f"Prompt not found: {name}{hint}")
+
+    # Repeated calls with the same arguments reuse the whole result.
+    return catalog.rendered(
+        entry,
+        arguments,
+        "get_prompt",
+        lambda: GetPromptResult(
+            description=entry.description or entry.title,
+            messages=[
+                PromptMessage(
+                    role="user",
+                    content=TextContent(type="text", text=entry.render(arguments)),
+                )
+            ],
+        ),
+    )
 
-    rendered = entry.render(arguments)
 
-    return GetPromptResult(
-        description=entry.description or entry.title,
-        messages=[
-            PromptMessage(
-                role="user",
-                content=TextContent(type="text", text=rendered),
-            )
+# ── Completion ──────────────────────────────────────────────────────
+
+
+# ResourceTemplateReference (and so this handler's signature) needs mcp 1.10+.
+@app.completion()
+async def complete(
+    ref: PromptReference | ResourceTemplateReference,
+    argument: CompletionArgument,
+    context: CompletionContext | None,
+) -> Completion | None:
+    catalog = _get_catalog()
+
+    if isinstance(ref, PromptReference):
+        found = catalog.complete_argument(ref.name, argument.name, argument.value, COMPLETION_LIMIT)
+    elif ref.uri == PROMPT_TEMPLATE and argument.name in ("category", "id"):
+        found = catalog.complete(argument.name, argument.value, COMPLETION_LIMIT)
+    else:
+        return None
+    return Completion(values=found.values, total=found.total, hasMore=found.has_more)
+
+
+# ── Tools ────────────────────────────────────────────────────────────
+
+
+def _suggest_tool(catalog: Catalog, arguments: dict) -> dict:
+    matches = catalog.suggest(
+        arguments["name"], kinds=arguments.get("kinds"), limit=arguments.get("limit", 5)
+    )
+    return {
+        "matches": [
+            {"kind": m.kind, "name": m.text, "key": m.key, "distance": m.distance} for m in matches
+        ]
+    }
+
+
+def _search_tool(catalog: Catalog, arguments: dict) -> dict:
+    plan = catalog.query_plan(arguments["query"], arguments.get("limit", 10))
+    result = {
+        "total": plan.total,
+        "prompts": [
+            {
+                "id": h.prompt.id,
+                "title": h.prompt.title,
+                "category": h.prompt.category,
+                "score": round(h.score, 4),
+            }
+            for h in plan.hits
         ],
+    }
+    if arguments.get("explain"):
+        result["plan"] = plan.explain()
+    return result
+
+
+def _similar_tool(catalog: Catalog, arguments: dict) -> dict:
+    hits = catalog.similar(arguments["query"], arguments.get("limit", 5))
+    return {
+        "prompts": [
+            {"id": h.prompt.id, "title": h.prompt.title, "score": round(h.score, 4)} for h in hits
+        ]
+    }
+
+
+def _stats_tool(catalog: Catalog, arguments: dict) -> dict:
+    caches = {"query_cache": catalog.query_cache, "render_cache": catalog.render_cache}
+    return {
+        "generation": catalog.generation,
+        "prompts": len(catalog.prompts),
+        **{name: cache.stats() if cache is not None else None for name, cache in caches.items()},
+    }
+
+
+# Tool name → (definition, handler). Handlers take the catalog generation
+# current when the call started and return structured content (a dict result
+# needs mcp 1.10+, which serialises it as both text and structuredContent).
+_TOOLS = {
+    "search": (
+        Tool(
+            name="search",
+            description=(
+                "Search prompts with a boolean query, best match first. Words must appear in "
+                "the prompt (the last one also as a prefix); \"quoted phrases\" must appear "
+                "in order. Facet terms: category:X, subcategory:X, platform:X, tag:X, "
+                "skill<=LEVEL (also <, >=, >, =; levels beginner, intermediate, advanced, "
+                "expert). Combine with AND (default), OR, NOT and parentheses, e.g. "
+                "'category:testing AND (platform:web OR platform:cloud) NOT tag:legacy "
+                "\"load test\"'."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "Boolean query"},
+                    "limit": {"type": "integer", "minimum": 1, "maximum": 100, "default": 10},
+                    "explain": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": "Include the query plan with per-step result sizes",
+                    },
+                },
+                "required": ["query"],
+                "additionalProperties": False,
+            },
+        ),
+        _search_tool,
+    ),
+    "suggest": (
+        Tool(
+            name="suggest",
+            description=(
+                "Did-you-mean lookup: prompt IDs, prompt titles, tags and starter kit IDs "
+                "within a few typos of a name. 'key' is the prompt ID for id/title matches."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string", "description": "Possibly misspelled name"},
+                    "kinds": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": ["id", "title", "tag", "kit"]},
+                        "description": "Only match these kinds of name",
+                    },
+                    "limit": {"type": "integer", "minimum": 1, "maximum": 50, "default": 5},
+                },
+                "required": ["name"],
+                "additionalProperties": False,
+            },
+        ),
+        _suggest_tool,
+    ),
+    "catalog_stats": (
+        Tool(
+            name="catalog_stats",
+            description=(
+                "Catalog generation and prompt count, plus entries, bytes, hits, misses, "
+                "evictions and hit rate for the query and rendered-prompt caches."
+            ),
+            inputSchema={"type": "object", "properties": {}, "additionalProperties": False},
+        ),
+        _stats_tool,
+    ),
+}
+
+
+# Similarity search needs the optional NumPy dependency.
+if importlib.util.find_spec("numpy") is not None:
+    _TOOLS["similar"] = (
+        Tool(
+            name="similar",
+            description=(
+                "Prompts most similar to a prompt ID or a free-text description, compared "
+                "as TF-IDF vectors so they need not share exact words. Scores are cosine "
+                "similarities between 0 and 1."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "Prompt ID or description"},
+                    "limit": {"type": "integer", "minimum": 1, "maximum": 50, "default": 5},
+                },
+                "required": ["query"],
+                "additionalProperties": False,
+            },
+        ),
+        _similar_tool,
     )
 
 
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    return [tool for tool, _ in _TOOLS.values()]
+
+
+@app.call_tool()
+async def call_tool(name: str, arguments: dict) -> dict:
+    if name not in _TOOLS:
+        raise ValueError(f"Unknown tool: {name}")
+    _, handler = _TOOLS[name]
+    return handler(_get_catalog(), arguments)
+
+
 # ── Entry point ──────────────────────────────────────────────────────
 
 
 async def run():
     async with stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options(),
-        )
+        watch_task = asyncio.create_task(_watch_catalog()) if CATALOG_WATCH else None
+        try:
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options(),
+            )
+        finally:
+            if watch_task:
+                watch_task.cancel()
 
 
 def main():
-    import asyncio
-
+    if CATALOG_WATCH and (CATALOG_STORE or CATALOG_PACK):
+        # Stores and packs are snapshots of the sources; reloading one
+        # would silently fall back to an unindexed in-memory catalog.
+        sys.exit(
+            "PROMPT_CATALOG_WATCH cannot be combined with PROMPT_CATALOG_STORE or "
+            "PROMPT_CATALOG_PACK; rebuild the store or pack after editing the sources"
+        )
     asyncio.run(run())
 
 
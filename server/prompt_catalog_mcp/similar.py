@@ -0,0 +1,153 @@
+"""
+Similar prompts — offline nearest neighbours over hashed TF-IDF vectors.
+
+Each prompt's title, description, tags and body are split into words plus
+the character trigrams of every word of four or more letters, so "testing",
+"tests" and "test" still overlap. Terms are weighted by sublinear term
+frequency times inverse document frequency and hashed (with a sign bit, to
+cancel collisions on average) into a fixed number of columns. The rows form
+one contiguous float32 matrix of unit vectors, so a query is a single
+matrix-vector product followed by ``argpartition`` for the top ``k``.
+
+Requires NumPy: ``pip install 'prompt-catalog[similar]'``.
+"""
+
+from __future__ import annotations
+
+import math
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - exercised without the extra
+    raise ImportError(
+        "numpy is required for similarity search. "
+        "Install with: pip install 'prompt-catalog[similar]'"
+    ) from exc
+
+from .catalog import PromptEntry
+from .search import tokenize
+
+DIM = 1024
+# Relative weight of each field's terms; titles and tags say the most.
+FIELD_WEIGHTS = (("title", 2.0), ("description", 1.0), ("tags", 2.0), ("prompt_text", 1.0))
+# Character trigrams count for less than the whole word they come from.
+SUBWORD_WEIGHT = 0.5
+MIN_SUBWORD_LEN = 4
+
+
+@lru_cache(maxsize=65536)
+def _subwords(word: str) -> tuple[str, ...]:
+    if len(word) < MIN_SUBWORD_LEN:
+        return ()
+    padded = f"<{word}>"
+    return tuple("#" + padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def _count(words: Iterable[str], weight: float, counts: dict[str, float]) -> None:
+    for word, n in Counter(words).items():
+        w = n * weight
+        counts[word] = counts.get(word, 0.0) + w
+        for gram in _subwords(word):
+            counts[gram] = counts.get(gram, 0.0) + w * SUBWORD_WEIGHT
+
+
+def features(prompt: PromptEntry) -> dict[str, float]:
+    """Weighted term counts for one prompt."""
+    counts: dict[str, float] = {}
+    for name, weight in FIELD_WEIGHTS:
+        value = getattr(prompt, name)
+        text = " ".join(value) if isinstance(value, list) else value or ""
+        _count(tokenize(text), weight, counts)
+    return counts
+
+
+def _slot(term: str, dim: int) -> tuple[int, float]:
+    # crc32 rather than hash(): string hashes change between processes.
+    h = zlib.crc32(term.encode("utf-8"))
+    return h % dim, 1.0 if h & 0x80000000 else -1.0
+
+
+@dataclass
+class SimilarHit:
+    """A neighbouring prompt and its cosine similarity (higher is closer)."""
+
+    prompt: PromptEntry
+    score: float
+
+
+class SimilarityIndex:
+    """Unit-length hashed TF-IDF rows for one catalog generation's prompts."""
+
+    def __init__(self, prompts: Iterable[PromptEntry], dim: int = DIM):
+        self.prompts = list(prompts)
+        self.dim = dim
+        self.rows = {p.id.lower(): n for n, p in enumerate(self.prompts)}
+
+        docs = [features(p) for p in self.prompts]
+        df: Counter[str] = Counter()
+        for doc in docs:
+            df.update(doc.keys())
+        n = len(docs)
+        self.idf = {term: math.log((1 + n) / (1 + count)) + 1 for term, count in df.items()}
+
+        # One (row, term, tf) triple per distinct term in each prompt, weighted
+        # and summed into the hashed columns with NumPy.
+        terms = {term: t for t, term in enumerate(df)}
+        idf = np.array([self.idf[term] for term in df], dtype=np.float64)
+        slots = [_slot(term, dim) for term in df]
+        cols = np.array([col for col, _ in slots], dtype=np.intp)
+        signs = np.array([sign for _, sign in slots], dtype=np.float64)
+
+        sizes = np.array([len(doc) for doc in docs], dtype=np.intp)
+        rows = np.repeat(np.arange(n, dtype=np.intp), sizes)
+        term_ids = np.fromiter(
+            (terms[term] for doc in docs for term in doc), dtype=np.intp, count=int(sizes.sum())
+        )
+        tf = np.fromiter((v for doc in docs for v in doc.values()), dtype=np.float64, count=len(term_ids))
+        weights = np.where(tf > 1, 1.0 + np.log(np.maximum(tf, 1.0)), tf) * idf[term_ids] * signs[term_ids]
+        matrix = np.bincount(rows * dim + cols[term_ids], weights=weights, minlength=n * dim)
+        matrix = matrix.reshape(n, dim).astype(np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+        self.matrix = np.ascontiguousarray(matrix)
+
+    def __len__(self) -> int:
+        return len(self.prompts)
+
+    def _weight(self, term: str, tf: float) -> float:
+        # Sublinear above one occurrence; fractional (subword) counts stay as is.
+        sublinear = 1.0 + math.log(tf) if tf > 1 else tf
+        return sublinear * self.idf[term]
+
+    def vector(self, text: str) -> np.ndarray:
+        """Unit query vector for free text; terms no prompt uses are ignored."""
+        counts: dict[str, float] = {}
+        _count(tokenize(text), 1.0, counts)
+        vec = np.zeros(self.dim, dtype=np.float32)
+        for term, tf in counts.items():
+            if term in self.idf:
+                col, sign = _slot(term, self.dim)
+                vec[col] += sign * self._weight(term, tf)
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+    def similar(self, query: str, limit: int = 5) -> list[SimilarHit]:
+        """Prompts closest to a prompt ID (excluding that prompt) or to free text."""
+        if limit <= 0 or not self.prompts:
+            return []
+        row = self.rows.get(query.strip().lower())
+        vec = self.matrix[row] if row is not None else self.vector(query)
+        scores = self.matrix @ vec
+        if row is not None:
+            scores[row] = -np.inf
+        k = min(limit, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        # Best first; ties keep catalog order.
+        top = top[np.lexsort((top, -scores[top]))]
+        return [SimilarHit(self.prompts[i], float(scores[i])) for i in top if scores[i] > 0]
@@ -0,0 +1,179 @@
+"""
+Compiled catalog snapshot — persists parsed entries between loads.
+
+``Catalog.load`` stores every successfully parsed prompt, instruction and
+starter kit in a pickle in the user's cache directory, one per resolved
+catalog root (see ``snapshot_dir``). Each entry is keyed by its source file's
+relative path, size, mtime and SHA-256, so a later load only re-parses files
+whose key changed.
+
+Unpickling runs code, so the snapshot never lives in the catalog checkout,
+where anyone able to commit to the catalog could plant one: it sits in a
+directory only the user can write, and a file owned by someone else is
+ignored. The snapshot is a cache of the catalog's own content: it is rebuilt
+from the sources whenever it is missing, unreadable, or written by another
+version.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from . import __version__
+
+logger = logging.getLogger(__name__)
+
+# Build artifacts under a catalog root; the snapshot itself never goes here.
+SNAPSHOT_DIR = ".prompt-catalog-cache"
+SNAPSHOT_FILE = "catalog.pickle"
+SNAPSHOT_FORMAT = 4
+
+
+@dataclass(frozen=True)
+class SourceKey:
+    """Identity of a source file at the time it was parsed."""
+
+    size: int
+    mtime_ns: int
+    sha256: str
+
+
+def file_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def user_cache_dir() -> Path:
+    """``$PROMPT_CATALOG_CACHE_DIR``, else the platform's per-user cache directory."""
+    override = os.environ.get("PROMPT_CATALOG_CACHE_DIR")
+    if override:
+        return Path(override)
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        return Path(os.environ["LOCALAPPDATA"]) / "prompt-catalog" / "cache"
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "prompt-catalog"
+
+
+def snapshot_dir(root: Path) -> Path:
+    """The snapshot directory for the catalog at (resolved) ``root``."""
+    digest = hashlib.sha256(str(root).encode("utf-8")).hexdigest()[:16]
+    return user_cache_dir() / f"{root.name or 'root'}-{digest}"
+
+
+class CatalogSnapshot:
+    """Per-file cache of parsed catalog entries for one catalog root."""
+
+    def __init__(self, root: Path, entries: dict[str, tuple[SourceKey, object]] | None = None):
+        self.root = root
+        self.path = snapshot_dir(root) / SNAPSHOT_FILE
+        self._entries: dict[str, tuple[SourceKey, object]] = entries or {}
+        self._seen: set[str] = set()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def open(cls, root: Path) -> "CatalogSnapshot":
+        """Read the snapshot for ``root``, or start an empty one."""
+        snap = cls(root)
+        try:
+            with snap.path.open("rb") as fh:
+                if hasattr(os, "getuid") and os.fstat(fh.fileno()).st_uid != os.getuid():
+                    logger.warning("Ignoring catalog snapshot %s owned by another user", snap.path)
+                    return snap
+                header, entries = pickle.load(fh)
+        except FileNotFoundError:
+            return snap
+        except Exception as exc:
+            logger.debug("Ignoring unreadable catalog snapshot %s: %s", snap.path, exc)
+            return snap
+
+        if header != snap._header():
+            logger.debug("Ignoring catalog snapshot %s from another version", snap.path)
+            return snap
+        snap._entries = entries
+        return snap
+
+    def _header(self) -> tuple:
+        return (SNAPSHOT_FORMAT, __version__, str(self.root))
+
+    def lookup(self, path: Path) -> tuple[object | None, SourceKey]:
+        """Return ``(entry, key)`` for ``path``; ``entry`` is None on a miss.
+
+        A matching size and mtime is trusted without reading the file. When
+        only the mtime moved (e.g. a checkout touched the file), the content
+        hash decides and the stored key is refreshed.
+        """
+        rel = path.relative_to(self.root).as_posix()
+        self._seen.add(rel)
+        st = path.stat()
+        cached = self._entries.get(rel)
+
+        if cached:
+            key, entry = cached
+            if key.size == st.st_size and key.mtime_ns == st.st_mtime_ns:
+                self.hits += 1
+                return entry, key
+
+        new_key = SourceKey(st.st_size, st.st_mtime_ns, file_digest(path.read_bytes()))
+        if cached and cached[0].sha256 == new_key.sha256:
+            self._entries[rel] = (new_key, cached[1])
+            self._dirty = True
+            self.hits += 1
+            return cached[1], new_key
+
+        self.misses += 1
+        return None, new_key
+
+    def lookup_trusted(self, path: Path, key: SourceKey) -> object | None:
+        """Return the entry for ``path`` if it was parsed from content ``key``.
+
+        Used with a trusted index: the file is neither stat-ed nor read.
+        """
+        rel = path.relative_to(self.root).as_posix()
+        self._seen.add(rel)
+        cached = self._entries.get(rel)
+        if not cached or cached[0].sha256 != key.sha256 or cached[0].size != key.size:
+            return None
+        if cached[0] != key:
+            self._entries[rel] = (key, cached[1])
+            self._dirty = True
+        self.hits += 1
+        return cached[1]
+
+    def retain(self, path: Path) -> None:
+        """Keep the entry for ``path`` on save without checking it."""
+        self._seen.add(path.relative_to(self.root).as_posix())
+
+    def store(self, path: Path, key: SourceKey, entry: object) -> None:
+        rel = path.relative_to(self.root).as_posix()
+        self._entries[rel] = (key, entry)
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the snapshot if anything changed, dropping files no longer seen."""
+        stale = self._entries.keys() - self._seen
+        for rel in stale:
+            del self._entries[rel]
+        if not (self._dirty or stale):
+            return
+
+        import tempfile
+
+        tmp = None
+        try:
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump((self._header(), self._entries), fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.path)
+        except OSError as exc:
+            logger.debug("Could not write catalog snapshot %s: %s", self.path, exc)
+            if tmp:
+                Path(tmp).unlink(missing_ok=True)
+            return
+        self._dirty = False
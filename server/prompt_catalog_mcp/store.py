@@ -0,0 +1,658 @@
+"""
+SQLite catalog store — the catalog compiled into a local database.
+
+``CatalogStore.build`` writes a loaded ``Catalog`` into normalized tables
+(prompts, names, tags, platforms, variables, chain edges, kit membership)
+plus an FTS5 index over title, description, tags and prompt body. A catalog
+opened with ``Catalog.open_store`` reads prompts from the database on demand
+and answers ``filter_prompts``, ``search``, boolean ``query_plan`` queries,
+``lookup_prompt``, ``resolve_kit`` and ``get_chain`` with indexed queries
+instead of holding every prompt in memory.
+
+The store is a build artifact: rebuild it (``prompt-catalog store build``)
+after editing the catalog sources. Only the stdlib ``sqlite3`` is used; when
+SQLite lacks FTS5, ``search`` falls back to substring matching.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Iterator
+
+from . import __version__
+from .catalog import SKILL_ORDER, Catalog, InstructionEntry, PromptEntry, StarterKit
+from .names import Resolution, fold, fold_names
+from .query import And, Facet, Node, Not, Or, QueryPlan, Skill, Text, parse, scoring_terms
+from .search import MIN_PREFIX, SearchHit
+from .snapshot import SNAPSHOT_DIR
+
+logger = logging.getLogger(__name__)
+
+STORE_FILE = "catalog.sqlite3"
+STORE_FORMAT = 2
+
+# bm25() column weights for prompts_fts(title, description, tags, body).
+FTS_WEIGHTS = (10.0, 4.0, 6.0, 1.0)
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+
+CREATE TABLE prompts (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    version TEXT NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    category TEXT NOT NULL,
+    subcategory TEXT NOT NULL,
+    skill_level TEXT NOT NULL,
+    skill_rank INTEGER NOT NULL,
+    prompt_text TEXT NOT NULL,
+    expected_output TEXT NOT NULL,
+    extra TEXT NOT NULL,        -- JSON: criteria, anti-patterns, tests, related, chain, names
+    file_path TEXT NOT NULL,    -- relative to the catalog root
+    searchable TEXT NOT NULL    -- lowercased title, description and tags
+);
+CREATE INDEX prompts_category ON prompts (category, skill_rank);
+CREATE INDEX prompts_subcategory ON prompts (subcategory);
+CREATE INDEX prompts_skill ON prompts (skill_rank);
+
+CREATE TABLE prompt_names (
+    name TEXT PRIMARY KEY,      -- folded ID, alias or deprecated ID (see names.py)
+    id TEXT NOT NULL,
+    via TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE prompt_tags (
+    tag TEXT NOT NULL,
+    prompt INTEGER NOT NULL REFERENCES prompts (rowid),
+    position INTEGER NOT NULL,
+    PRIMARY KEY (tag, prompt)
+) WITHOUT ROWID;
+CREATE INDEX prompt_tags_prompt ON prompt_tags (prompt, position);
+
+CREATE TABLE prompt_platforms (
+    platform TEXT NOT NULL,
+    prompt INTEGER NOT NULL REFERENCES prompts (rowid),
+    position INTEGER NOT NULL,
+    PRIMARY KEY (platform, prompt)
+) WITHOUT ROWID;
+CREATE INDEX prompt_platforms_prompt ON prompt_platforms (prompt, position);
+
+CREATE TABLE variables (
+    prompt INTEGER NOT NULL REFERENCES prompts (rowid),
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    required INTEGER NOT NULL,
+    data TEXT NOT NULL,         -- JSON: the full variable mapping
+    PRIMARY KEY (prompt, position)
+) WITHOUT ROWID;
+
+CREATE TABLE chain_edges (
+    src TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    dst TEXT NOT NULL,
+    PRIMARY KEY (src, position)
+) WITHOUT ROWID;
+
+CREATE TABLE instructions (
+    stem TEXT PRIMARY KEY,
+    scope TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    id TEXT NOT NULL,
+    version TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    load_with TEXT NOT NULL,    -- JSON list
+    metadata TEXT NOT NULL,     -- JSON object
+    body_offset INTEGER NOT NULL
+);
+
+CREATE TABLE kits (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    target_audience TEXT NOT NULL,
+    tags TEXT NOT NULL,         -- JSON list
+    raw TEXT NOT NULL           -- JSON object
+);
+
+CREATE TABLE kit_members (
+    kit TEXT NOT NULL REFERENCES kits (id),
+    kind TEXT NOT NULL,         -- prompt | instruction
+    position INTEGER NOT NULL,
+    ref TEXT NOT NULL,
+    PRIMARY KEY (kit, kind, position)
+) WITHOUT ROWID;
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE prompts_fts USING fts5 (
+    title, description, tags, body,
+    content = '',
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+_PROMPT_COLUMNS = (
+    "p.rowid, p.id, p.version, p.title, p.description, p.category, p.subcategory, "
+    "p.skill_level, p.prompt_text, p.expected_output, p.extra, p.file_path"
+)
+
+
+def default_store_path(root: Path) -> Path:
+    return root / SNAPSHOT_DIR / STORE_FILE
+
+
+def fts5_available() -> bool:
+    """True if this Python's SQLite was compiled with FTS5."""
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute("CREATE VIRTUAL TABLE t USING fts5 (x)")
+        return True
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        conn.close()
+
+
+def _skill_rank(level: str) -> int:
+    # Unknown levels sort past "expert" so no skill filter includes them.
+    return SKILL_ORDER.index(level) if level in SKILL_ORDER else len(SKILL_ORDER)
+
+
+def _fts_query(query: str) -> str:
+    """Quote each whitespace-separated term so user input is never FTS syntax."""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in query.split())
+
+
+def _fts_text(node: Text) -> str:
+    """An FTS5 expression for a query-language word group or phrase."""
+    quoted = ['"' + term.replace('"', '""') + '"' for term in node.terms]
+    if node.phrase:
+        return " + ".join(quoted)  # FTS5 phrase: adjacent, in order
+    if node.prefix and len(node.terms[-1]) >= MIN_PREFIX:
+        quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+# Query-language skill comparisons; unknown levels (rank past "expert") never match.
+_SKILL_OPS = {":": "=", "=": "=", "<": "<", "<=": "<=", ">": ">", ">=": ">="}
+
+
+class StoredPrompts(Mapping):
+    """Read-only ``id → PromptEntry`` mapping backed by the prompts table."""
+
+    def __init__(self, store: "CatalogStore"):
+        self._store = store
+
+    def __getitem__(self, prompt_id: str) -> PromptEntry:
+        entry = self._store.get_prompt(prompt_id)
+        if entry is None:
+            raise KeyError(prompt_id)
+        return entry
+
+    def __contains__(self, prompt_id: object) -> bool:
+        row = self._store.conn.execute(
+            "SELECT 1 FROM prompts WHERE id = ?", (prompt_id,)
+        ).fetchone()
+        return row is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for (prompt_id,) in self._store.conn.execute("SELECT id FROM prompts ORDER BY rowid"):
+            yield prompt_id
+
+    def __len__(self) -> int:
+        return self._store.conn.execute("SELECT count(*) FROM prompts").fetchone()[0]
+
+    def values(self) -> list[PromptEntry]:  # one query instead of one per key
+        return self._store._query_prompts("", ())
+
+    def items(self) -> list[tuple[str, PromptEntry]]:
+        return [(p.id, p) for p in self.values()]
+
+
+class CatalogStore:
+    """A catalog compiled into SQLite, opened read-only."""
+
+    def __init__(self, path: Path, conn: sqlite3.Connection):
+        self.path = path
+        self.conn = conn
+        meta = dict(conn.execute("SELECT key, value FROM meta"))
+        if int(meta.get("format", 0)) != STORE_FORMAT:
+            conn.close()
+            raise ValueError(f"{path} is not a catalog store (format {STORE_FORMAT})")
+        self.root = Path(meta["root"])
+        self.fts = meta.get("fts") == "1"
+        self.prompts = StoredPrompts(self)
+
+    # ── Building ─────────────────────────────────────────────────────
+
+    @classmethod
+    def build(cls, catalog: Catalog, path: str | Path | None = None) -> Path:
+        """Compile ``catalog`` into a database at ``path`` and return the path.
+
+        The database is written to a temporary file next to ``path`` and
+        moved into place, so readers never see a half-built store.
+        """
+        path = Path(path) if path else default_store_path(catalog.root)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        os.close(fd)
+        try:
+            conn = sqlite3.connect(tmp)
+            try:
+                _write(conn, catalog)
+            finally:
+                conn.close()
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return path
+
+    @classmethod
+    def open(cls, path: str | Path) -> "CatalogStore":
+        path = Path(path)
+        if not path.is_file():
+            raise FileNotFoundError(f"Catalog store not found: {path}")
+        conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False)
+        return cls(path, conn)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # ── Entries ──────────────────────────────────────────────────────
+
+    def _query_prompts(self, where: str, params: tuple, order: str = "p.rowid") -> list[PromptEntry]:
+        rows = self.conn.execute(
+            f"SELECT {_PROMPT_COLUMNS} FROM prompts p {where} ORDER BY {order}", params
+        ).fetchall()
+        return self._hydrate(rows)
+
+    def _hydrate(self, rows: list[tuple]) -> list[PromptEntry]:
+        """Build entries from prompt rows, fetching their lists in bulk."""
+        if not rows:
+            return []
+        rowids = [row[0] for row in rows]
+        tags = self._grouped("SELECT prompt, tag FROM prompt_tags", rowids)
+        platforms = self._grouped("SELECT prompt, platform FROM prompt_platforms", rowids)
+        variables = self._grouped("SELECT prompt, data FROM variables", rowids)
+        return [
+            _prompt_from_row(
+                row,
+                self.root,
+                tags.get(row[0], []),
+                platforms.get(row[0], []),
+                [json.loads(v) for v in variables.get(row[0], [])],
+            )
+            for row in rows
+        ]
+
+    def _grouped(self, select: str, rowids: list[int]) -> dict[int, list]:
+        out: dict[int, list] = {}
+        # Stay under SQLite's bound-parameter limit.
+        for start in range(0, len(rowids), 500):
+            chunk = rowids[start:start + 500]
+            marks = ",".join("?" * len(chunk))
+            query = f"{select} WHERE prompt IN ({marks}) ORDER BY prompt, position"
+            for prompt, value in self.conn.execute(query, chunk):
+                out.setdefault(prompt, []).append(value)
+        return out
+
+    def get_prompt(self, prompt_id: str) -> PromptEntry | None:
+        found = self._query_prompts("WHERE p.id = ?", (prompt_id,))
+        return found[0] if found else None
+
+    def lookup_prompt(self, name: str) -> Resolution | None:
+        row = self.conn.execute(
+            "SELECT id, via FROM prompt_names WHERE name = ?", (fold(name),)
+        ).fetchone()
+        return Resolution(*row) if row else None
+
+    def load_instructions(self) -> dict[str, InstructionEntry]:
+        out = {}
+        for row in self.conn.execute("SELECT * FROM instructions ORDER BY rowid"):
+            stem, scope, file_path, name, desc, iid, version, priority, load_with, meta, offset = row
+            out[stem] = InstructionEntry(
+                stem=stem,
+                scope=scope,
+                file_path=self.root / file_path,
+                name=name,
+                description=desc,
+                id=iid,
+                version=version,
+                priority=priority,
+                load_with=json.loads(load_with),
+                metadata=json.loads(meta),
+                body_offset=offset,
+            )
+        return out
+
+    def load_kits(self) -> dict[str, StarterKit]:
+        members: dict[tuple[str, str], list[str]] = {}
+        for kit, kind, ref in self.conn.execute(
+            "SELECT kit, kind, ref FROM kit_members ORDER BY kit, kind, position"
+        ):
+            members.setdefault((kit, kind), []).append(ref)
+
+        out = {}
+        for kid, name, desc, audience, tags, raw in self.conn.execute(
+            "SELECT * FROM kits ORDER BY rowid"
+        ):
+            out[kid] = StarterKit(
+                id=kid,
+                name=name,
+                description=desc,
+                target_audience=audience,
+                prompts=members.get((kid, "prompt"), []),
+                instructions=members.get((kid, "instruction"), []),
+                tags=json.loads(tags),
+                raw=json.loads(raw),
+            )
+        return out
+
+    # ── Queries ──────────────────────────────────────────────────────
+
+    def filter_prompts(
+        self,
+        *,
+        category: str | None = None,
+        subcategory: str | None = None,
+        skill_level: str | None = None,
+        platform: str | None = None,
+        tag: str | None = None,
+        query: str | None = None,
+    ) -> list[PromptEntry]:
+        """Same semantics as ``Catalog.filter_prompts``, as one SQL query."""
+        clauses: list[str] = []
+        params: list = []
+        if category:
+            clauses.append("p.category = ?")
+            params.append(category)
+        if subcategory:
+            clauses.append("p.subcategory = ?")
+            params.append(subcategory)
+        if skill_level:
+            clauses.append("p.skill_rank <= ?")
+            params.append(SKILL_ORDER.index(skill_level))
+        if platform:
+            clauses.append(
+                "EXISTS (SELECT 1 FROM prompt_platforms pp"
+                " WHERE pp.prompt = p.rowid AND pp.platform IN (?, 'all'))"
+            )
+            params.append(platform)
+        if tag:
+            clauses.append(
+                "EXISTS (SELECT 1 FROM prompt_tags pt WHERE pt.tag = ? AND pt.prompt = p.rowid)"
+            )
+            params.append(tag)
+        if query:
+            clauses.append("instr(p.searchable, ?) > 0")
+            params.append(query.lower())
+        where = "WHERE " + " AND ".join(clauses) if clauses else ""
+        return self._query_prompts(where, tuple(params))
+
+    def search(self, query: str, limit: int | None = None) -> list[PromptEntry]:
+        """Full-text search over title, description, tags and body, best first."""
+        return [hit.prompt for hit in self.search_hits(query, limit)]
+
+    def search_hits(self, query: str, limit: int | None = None) -> list[SearchHit]:
+        """``search`` with each prompt's BM25 score (higher is better)."""
+        if not self.fts:
+            return [SearchHit(p, 0.0) for p in self.filter_prompts(query=query)[:limit]]
+        match = _fts_query(query)
+        if not match:
+            return []
+        weights = ", ".join(str(w) for w in FTS_WEIGHTS)
+        rows = self.conn.execute(
+            f"SELECT {_PROMPT_COLUMNS}, bm25(prompts_fts, {weights}) AS rank"
+            " FROM prompts_fts f JOIN prompts p ON p.rowid = f.rowid"
+            " WHERE prompts_fts MATCH ? ORDER BY rank, p.rowid LIMIT ?",
+            (match, -1 if limit is None else limit),
+        ).fetchall()
+        entries = self._hydrate([row[:-1] for row in rows])
+        # FTS5's bm25() is negative, lower meaning more relevant.
+        return [SearchHit(entry, -row[-1]) for entry, row in zip(entries, rows)]
+
+    def query_plan(self, text: str, limit: int | None = None) -> QueryPlan:
+        """Run a boolean query (see ``prompt_catalog_mcp.query``) in SQLite.
+
+        The AST becomes one ``WHERE`` clause: facet terms test columns and
+        the tag and platform tables, words and phrases are FTS5 matches, and
+        hits are ranked by ``bm25()`` over the words outside any ``NOT``.
+        Queries of plain words go straight to ``search_hits``. Nothing is
+        loaded beyond the hits themselves.
+        """
+        root = parse(text)
+        plan = QueryPlan(text, root)
+        if root is None:
+            return plan
+        where, params = self._where(root)
+        plan.total = self.conn.execute(
+            f"SELECT count(*) FROM prompts p WHERE {where}", params
+        ).fetchone()[0]
+
+        words = root.children if isinstance(root, And) else (root,)
+        if self.fts and all(isinstance(w, Text) and not w.phrase and not w.prefix for w in words):
+            plan.sql = "prompts_fts MATCH ? ORDER BY bm25(prompts_fts)"
+            plan.hits = self.search_hits(" ".join(t for w in words for t in w.terms), limit)
+            return plan
+
+        scoring = [_fts_text(leaf) for leaf in scoring_terms(root)] if self.fts else []
+        if scoring:
+            weights = ", ".join(str(w) for w in FTS_WEIGHTS)
+            rank = "coalesce(s.rank, 0)"
+            join = (
+                f" LEFT JOIN (SELECT rowid, bm25(prompts_fts, {weights}) AS rank FROM prompts_fts"
+                " WHERE prompts_fts MATCH ?) s ON s.rowid = p.rowid"
+            )
+            params = (" OR ".join(f"({m})" for m in scoring), *params)
+            order = f"{rank}, p.rowid"
+        else:
+            rank, join, order = "0.0", "", "p.rowid"
+        plan.sql = f"SELECT … FROM prompts p{join} WHERE {where} ORDER BY {order}"
+        rows = self.conn.execute(
+            f"SELECT {_PROMPT_COLUMNS}, {rank} FROM prompts p{join}"
+            f" WHERE {where} ORDER BY {order} LIMIT ?",
+            (*params, -1 if limit is None else limit),
+        ).fetchall()
+        entries = self._hydrate([row[:-1] for row in rows])
+        # FTS5's bm25() is negative, lower meaning more relevant.
+        plan.hits = [SearchHit(entry, -row[-1]) for entry, row in zip(entries, rows)]
+        return plan
+
+    def _where(self, node: Node) -> tuple[str, tuple]:
+        """A ``WHERE`` expression over ``prompts p`` for a query AST node."""
+        if isinstance(node, (And, Or)):
+            parts = [self._where(child) for child in node.children]
+            joiner = " AND " if isinstance(node, And) else " OR "
+            return "(" + joiner.join(sql for sql, _ in parts) + ")", tuple(p for _, ps in parts for p in ps)
+        if isinstance(node, Not):
+            sql, params = self._where(node.child)
+            return f"NOT {sql}", params
+        if isinstance(node, Skill):
+            sql = f"p.skill_rank {_SKILL_OPS[node.op]} ?"
+            if node.op in (">", ">="):
+                sql = f"({sql} AND p.skill_rank < {len(SKILL_ORDER)})"
+            return sql, (SKILL_ORDER.index(node.level),)
+        if isinstance(node, Facet):
+            if node.field == "tag":
+                return "EXISTS (SELECT 1 FROM prompt_tags pt WHERE pt.tag = ? AND pt.prompt = p.rowid)", (node.value,)
+            if node.field == "platform":
+                return (
+                    "EXISTS (SELECT 1 FROM prompt_platforms pp"
+                    " WHERE pp.prompt = p.rowid AND pp.platform IN (?, 'all'))"
+                ), (node.value,)
+            return f"p.{node.field} = ?", (node.value,)
+        if self.fts:
+            return "p.rowid IN (SELECT rowid FROM prompts_fts WHERE prompts_fts MATCH ?)", (_fts_text(node),)
+        # Without FTS5, words are substrings of the title, description and tags.
+        needles = [" ".join(node.terms)] if node.phrase else list(node.terms)
+        return "(" + " AND ".join(["instr(p.searchable, ?) > 0"] * len(needles)) + ")", tuple(needles)
+
+    def get_chain(self, start_id: str) -> list[PromptEntry]:
+        """Walk a prompt chain forward along each prompt's first ``next`` edge."""
+        chain = []
+        visited = set()
+        current_id = start_id
+        while current_id and current_id not in visited:
+            visited.add(current_id)
+            prompt = self.get_prompt(current_id)
+            if prompt is None:
+                break
+            chain.append(prompt)
+            row = self.conn.execute(
+                "SELECT dst FROM chain_edges WHERE src = ? AND position = 0", (current_id,)
+            ).fetchone()
+            current_id = row[0] if row else None
+        return chain
+
+    def resolve_kit(self, kit_id: str) -> tuple[list[PromptEntry], list[InstructionEntry]]:
+        if self.conn.execute("SELECT 1 FROM kits WHERE id = ?", (kit_id,)).fetchone() is None:
+            raise ValueError(f"Starter kit not found: {kit_id}")
+        prompts = self._query_prompts(
+            "JOIN kit_members m ON m.ref = p.id AND m.kit = ? AND m.kind = 'prompt'",
+            (kit_id,),
+            order="m.position",
+        )
+        refs = [
+            ref
+            for (ref,) in self.conn.execute(
+                "SELECT ref FROM kit_members WHERE kit = ? AND kind = 'instruction'"
+                " ORDER BY position",
+                (kit_id,),
+            )
+        ]
+        instructions = self.load_instructions()
+        return prompts, [instructions[ref] for ref in refs if ref in instructions]
+
+
+def _prompt_from_row(row: tuple, root: Path, tags, platforms, variables) -> PromptEntry:
+    (_, pid, version, title, desc, category, subcategory, skill,
+     text, expected, extra, file_path) = row
+    extra = json.loads(extra)
+    # ``raw`` is left unset; PromptEntry re-reads it from the YAML on access.
+    entry = PromptEntry.__new__(PromptEntry)
+    entry.id = pid
+    entry.version = version
+    entry.title = title
+    entry.description = desc
+    entry.category = category
+    entry.subcategory = subcategory
+    entry.skill_level = skill
+    entry.platforms = platforms
+    entry.tags = tags
+    entry.prompt_text = text
+    entry.variables = variables
+    entry.expected_output = expected
+    entry.quality_criteria = extra["quality_criteria"]
+    entry.anti_patterns = extra["anti_patterns"]
+    entry.adversarial_tests = extra["adversarial_tests"]
+    entry.related_prompts = extra["related_prompts"]
+    entry.chain_position = extra["chain_position"]
+    entry.aliases = extra["aliases"]
+    entry.deprecated_ids = extra["deprecated_ids"]
+    entry.file_path = root / file_path
+    return entry
+
+
+def _write(conn: sqlite3.Connection, catalog: Catalog) -> None:
+    root = catalog.root
+    fts = fts5_available()
+    conn.executescript(_SCHEMA + (_FTS_SCHEMA if fts else ""))
+    with conn:
+        conn.executemany(
+            "INSERT INTO meta VALUES (?, ?)",
+            [
+                ("format", str(STORE_FORMAT)),
+                ("version", __version__),
+                ("root", str(root)),
+                ("fts", "1" if fts else "0"),
+            ],
+        )
+
+        for p in catalog.prompts.values():
+            extra = {
+                "quality_criteria": p.quality_criteria,
+                "anti_patterns": p.anti_patterns,
+                "adversarial_tests": p.adversarial_tests,
+                "related_prompts": p.related_prompts,
+                "chain_position": p.chain_position,
+                "aliases": p.aliases,
+                "deprecated_ids": p.deprecated_ids,
+            }
+            searchable = f"{p.title} {p.description} {' '.join(p.tags)}".lower()
+            rowid = conn.execute(
+                "INSERT INTO prompts (id, version, title, description, category, subcategory,"
+                " skill_level, skill_rank, prompt_text, expected_output, extra, file_path,"
+                " searchable) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    p.id, p.version, p.title, p.description or "", p.category,
+                    p.subcategory or "", p.skill_level, _skill_rank(p.skill_level),
+                    p.prompt_text or "", p.expected_output or "", json.dumps(extra, default=str),
+                    p.file_path.relative_to(root).as_posix(), searchable,
+                ),
+            ).lastrowid
+            conn.executemany(
+                "INSERT OR IGNORE INTO prompt_tags VALUES (?, ?, ?)",
+                [(t, rowid, i) for i, t in enumerate(p.tags)],
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO prompt_platforms VALUES (?, ?, ?)",
+                [(pl, rowid, i) for i, pl in enumerate(p.platforms)],
+            )
+            conn.executemany(
+                "INSERT INTO variables VALUES (?, ?, ?, ?, ?)",
+                [
+                    (rowid, i, v.get("name", ""), int(bool(v.get("required"))), json.dumps(v, default=str))
+                    for i, v in enumerate(p.variables)
+                ],
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO chain_edges VALUES (?, ?, ?)",
+                [(p.id, i, dst) for i, dst in enumerate(p.chain_position.get("next", []))],
+            )
+            if fts:
+                conn.execute(
+                    "INSERT INTO prompts_fts (rowid, title, description, tags, body)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (rowid, p.title, p.description, " ".join(p.tags), p.prompt_text),
+                )
+
+        conn.executemany(
+            "INSERT INTO prompt_names VALUES (?, ?, ?)",
+            [(name, r.key, r.via) for name, r in fold_names(catalog.prompts.values()).items()],
+        )
+
+        for i in catalog.instructions.values():
+            conn.execute(
+                "INSERT INTO instructions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    i.stem, i.scope, i.file_path.relative_to(root).as_posix(), i.name,
+                    i.description or "", i.id, i.version, i.priority, json.dumps(i.load_with),
+                    json.dumps(i.metadata), i.body_offset,
+                ),
+            )
+
+        for k in catalog.starter_kits.values():
+            conn.execute(
+                "INSERT INTO kits VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    k.id, k.name, k.description or "", k.target_audience or "",
+                    json.dumps(k.tags), json.dumps(k.raw, default=str),
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO kit_members VALUES (?, ?, ?, ?)",
+                [(k.id, "prompt", n, ref) for n, ref in enumerate(k.prompts)]
+                + [(k.id, "instruction", n, ref) for n, ref in enumerate(k.instructions)],
+            )
+    conn.execute("ANALYZE")
@@ -0,0 +1,64 @@
+"""
+Prompt templates — ``{{variable}}`` text compiled into literal and slot parts.
+
+``Template.compile`` splits a prompt body once into a part list where every
+``{{name}}`` placeholder has its own slot. Rendering copies that list, fills
+every slot in one extended-slice assignment and joins once: the cost is one
+pass over the output however many arguments there are, and a value
+containing ``{{other}}`` is inserted as-is rather than substituted again.
+Placeholders without a value are left in the output unchanged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Mapping
+
+VARIABLE = re.compile(r"\{\{(\w+)\}\}")
+
+
+class MissingArgumentsError(ValueError):
+    """Required prompt variables were given no value."""
+
+    def __init__(self, prompt_id: str, names: list[str]):
+        super().__init__(f"Missing required argument(s) for {prompt_id}: {', '.join(names)}")
+        self.prompt_id = prompt_id
+        self.names = names
+
+
+@dataclass(frozen=True, slots=True)
+class Template:
+    """A prompt body split into literal text and variable slots."""
+
+    text: str
+    # Literals at even positions; odd positions are slots holding their
+    # ``{{name}}`` placeholder.
+    parts: tuple[str, ...]
+    slots: tuple[str, ...]  # variable name of each slot
+    placeholders: dict[str, str]  # name → "{{name}}", in order of first use
+    sha256: str  # hex digest of ``text``, stable across processes
+
+    @classmethod
+    def compile(cls, text: str) -> "Template":
+        # re.split with one group alternates literal, name, literal, …
+        parts = VARIABLE.split(text)
+        slots = tuple(parts[1::2])
+        placeholders = {name: f"{{{{{name}}}}}" for name in slots}
+        parts[1::2] = map(placeholders.__getitem__, slots)
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return cls(text, tuple(parts), slots, placeholders, digest)
+
+    @property
+    def variables(self) -> tuple[str, ...]:
+        """Unique variable names in order of first use."""
+        return tuple(self.placeholders)
+
+    def render(self, arguments: Mapping[str, str] | None = None) -> str:
+        if not arguments or not self.slots:
+            return self.text
+        values = {**self.placeholders, **arguments}
+        parts = list(self.parts)
+        parts[1::2] = map(values.__getitem__, self.slots)
+        return "".join(parts)
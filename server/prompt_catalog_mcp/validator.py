@@ -17,10 +17,10 @@ import json
 from dataclasses import dataclass, field
 from pathlib import Path
 
-import yaml
 from jsonschema import Draft7Validator
 
 from .catalog import PROMPT_DIRS, INSTRUCTION_SCOPES
+from .parsing import YAMLError, body_has_content, load_yaml, read_markdown_head
 
 
 @dataclass
@@ -75,6 +75,8 @@ def validate_prompts(root: Path) -> ValidationResult:
         return result
 
     validator = Draft7Validator(schema)
+    # Folded name → (file, prompt ID) of the first prompt claiming it.
+    claims: dict[str, tuple[str, str]] = {}
 
     for dir_name in PROMPT_DIRS:
         dir_path = root / "prompts" / dir_name
@@ -86,8 +88,8 @@ def validate_prompts(root: Path) -> ValidationResult:
             rel_path = str(yaml_file.relative_to(root))
 
             try:
-                data = yaml.safe_load(yaml_file.read_text(encoding="utf-8"))
-            except yaml.YAMLError as e:
+                data = load_yaml(yaml_file.read_text(encoding="utf-8"))
+            except YAMLError as e:
                 result.issues.append(Issue(rel_path, f"YAML parse error: {e}"))
                 continue
 
@@ -105,10 +107,28 @@ def validate_prompts(root: Path) -> ValidationResult:
 
             # Additional checks beyond JSON schema
             _check_prompt_extras(data, rel_path, result)
+            _check_prompt_names(data, rel_path, claims, result)
 
     return result
 
 
+def _check_prompt_names(
+    data: dict, rel_path: str, claims: dict[str, tuple[str, str]], result: ValidationResult
+) -> None:
+    """Report IDs, aliases and deprecated IDs that another prompt already answers to."""
+    prompt_id = data.get("id")
+    if not isinstance(prompt_id, str):
+        return
+    names = [prompt_id, *(data.get("aliases") or []), *(data.get("deprecated_ids") or [])]
+    for name in dict.fromkeys(str(n).strip().lower() for n in names):
+        owner = claims.setdefault(name, (rel_path, prompt_id))
+        if owner[1] != prompt_id:
+            result.issues.append(Issue(
+                rel_path,
+                f"Name '{name}' already refers to {owner[1]} ({owner[0]})",
+            ))
+
+
 def _check_prompt_extras(data: dict, rel_path: str, result: ValidationResult) -> None:
     """Run additional validation checks beyond what the JSON schema covers."""
     prompt_text = data.get("prompt", "")
@@ -267,10 +287,10 @@ def validate_kits(root: Path) -> ValidationResult:
             continue
         for yaml_file in dir_path.glob("*.yaml"):
             try:
-                data = yaml.safe_load(yaml_file.read_text(encoding="utf-8"))
+                data = load_yaml(yaml_file.read_text(encoding="utf-8"))
                 if data and "id" in data:
                     available_prompts.add(data["id"])
-            except yaml.YAMLError as e:
+            except YAMLError as e:
                 rel_prompt_path = str(yaml_file.relative_to(root))
                 result.issues.append(Issue(rel_prompt_path, f"YAML parse error while scanning prompts: {e}"))
 
@@ -294,8 +314,8 @@ def validate_kits(root: Path) -> ValidationResult:
         rel_path = str(kit_file.relative_to(root))
 
         try:
-            data = yaml.safe_load(kit_file.read_text(encoding="utf-8"))
-        except yaml.YAMLError as e:
+            data = load_yaml(kit_file.read_text(encoding="utf-8"))
+        except YAMLError as e:
             result.issues.append(Issue(rel_path, f"YAML parse error: {e}"))
             continue
 
@@ -348,23 +368,21 @@ def validate_instructions(root: Path) -> ValidationResult:
             result.files_checked += 1
             rel_path = str(md_file.relative_to(root))
 
-            text = md_file.read_text(encoding="utf-8")
+            try:
+                head = read_markdown_head(md_file)
+            except (ValueError, YAMLError) as e:
+                result.issues.append(Issue(rel_path, f"Invalid frontmatter: {e}"))
+                continue
+            fm = head.frontmatter
 
             # Must start with YAML frontmatter
-            if not text.startswith("---"):
+            if fm is None:
                 result.issues.append(Issue(
                     rel_path,
                     "Missing YAML frontmatter (must start with ---)",
                 ))
                 continue
 
-            try:
-                end = text.index("---", 3)
-                fm = yaml.safe_load(text[3:end])
-            except (ValueError, yaml.YAMLError) as e:
-                result.issues.append(Issue(rel_path, f"Invalid frontmatter: {e}"))
-                continue
-
             if not fm or not isinstance(fm, dict):
                 result.issues.append(Issue(rel_path, "Frontmatter is empty or not a mapping"))
                 continue
@@ -380,9 +398,8 @@ def validate_instructions(root: Path) -> ValidationResult:
                     severity="warning",
                 ))
 
-            # Check body has actual content
-            body = text[end + 3:].strip()
-            if len(body) < 50:
+            # Check body has actual content (read only as far as needed)
+            if not body_has_content(md_file, head.body_offset, 50):
                 result.issues.append(Issue(
                     rel_path,
                     "Instruction body is too short (< 50 chars)",
@@ -0,0 +1,171 @@
+"""
+Catalog file watchers — report which source files changed since the last poll.
+
+``open_watcher`` prefers Linux inotify (via ctypes, no extra dependency) and
+falls back to periodically stat-ing every source file elsewhere. Both expose
+the same ``poll() -> set[Path]`` / ``close()`` interface; the paths returned
+can be passed straight to ``Catalog.reload``.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import struct
+import sys
+from pathlib import Path
+
+from .catalog import classify_source, iter_sources, source_dirs
+
+logger = logging.getLogger(__name__)
+
+# <sys/inotify.h>
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+_WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_ATTRIB
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+class PollingWatcher:
+    """Detects changes by comparing size and mtime of every source file."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._state = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        state = {}
+        for _, _, path in iter_sources(self.root):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            state[path] = (st.st_size, st.st_mtime_ns)
+        return state
+
+    def poll(self) -> set[Path]:
+        old, self._state = self._state, self._scan()
+        return {p for p in old.keys() | self._state.keys() if old.get(p) != self._state.get(p)}
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Collects inotify events for the catalog source directories.
+
+    A source directory that does not exist yet is covered by a watch on its
+    nearest existing ancestor; once it is created it gets its own watch and
+    the files already in it are reported.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+        self._dirs: dict[int, Path] = {}
+        try:
+            self._sync_watches()
+        except OSError:
+            os.close(self._fd)
+            raise
+        # Used to resynchronise after an event queue overflow.
+        self._fallback = PollingWatcher(root)
+
+    def _add_watch(self, d: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(d), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), str(d))
+        self._dirs[wd] = d
+
+    def _sync_watches(self) -> set[Path]:
+        """Watch every source directory, or its nearest existing ancestor.
+
+        Returns the source files in directories that only now got a watch.
+        """
+        watched = set(self._dirs.values())
+        found: set[Path] = set()
+        for d in source_dirs(self.root):
+            if d in watched:
+                continue
+            if d.is_dir():
+                self._add_watch(d)
+                watched.add(d)
+                found |= {p for p in d.iterdir() if classify_source(self.root, p) is not None}
+                continue
+            parent = d.parent
+            while parent != self.root and not parent.is_dir():
+                parent = parent.parent
+            if parent not in watched:
+                self._add_watch(parent)
+                watched.add(parent)
+        return found
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def poll(self) -> set[Path]:
+        changed: set[Path] = set()
+        overflow = new_dirs = False
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _, length = _EVENT.unpack_from(buf, offset)
+                offset += _EVENT.size
+                name = buf[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    overflow = True
+                elif mask & IN_IGNORED:
+                    # The directory went away; it is re-watched if recreated.
+                    self._dirs.pop(wd, None)
+                    new_dirs = True
+                elif mask & IN_ISDIR:
+                    new_dirs = new_dirs or bool(mask & (IN_CREATE | IN_MOVED_TO))
+                elif wd in self._dirs and name:
+                    path = self._dirs[wd] / os.fsdecode(name)
+                    if classify_source(self.root, path) is not None:
+                        changed.add(path)
+
+        if new_dirs:
+            changed |= self._sync_watches()
+        if overflow:
+            logger.warning("inotify queue overflowed; rescanning catalog sources")
+            changed |= self._fallback.poll()
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def open_watcher(root: Path) -> InotifyWatcher | PollingWatcher:
+    """Return an inotify watcher on Linux, or a polling watcher otherwise."""
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError) as exc:
+            logger.info("inotify unavailable (%s); polling catalog sources", exc)
+    return PollingWatcher(root)
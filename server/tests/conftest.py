@@ -9,6 +9,34 @@ from pathlib import Path
 import pytest
 import yaml
 
+from prompt_catalog_mcp.catalog import Catalog, PromptEntry
+from prompt_catalog_mcp.generator import generate_catalog
+
+REPO_SCHEMA = Path(__file__).resolve().parents[2] / "schema"
+
+# ``generate_catalog`` arguments; a module overrides them with
+# ``pytestmark = pytest.mark.synthetic(prompts=..., seed=...)``.
+SYNTHETIC_DEFAULTS = {"prompts": 300, "kits": 2, "instructions": 2, "seed": 11}
+
+
+def pytest_configure(config) -> None:
+    config.addinivalue_line(
+        "markers", "synthetic(**kwargs): generate_catalog() arguments for the synthetic fixtures"
+    )
+
+
+def prompt_ids(entries) -> list[str]:
+    """IDs of prompt entries or of search/similarity hits, in order."""
+    return [e.id if isinstance(e, PromptEntry) else e.prompt.id for e in entries]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _user_cache_dir(tmp_path_factory):
+    """Keep catalog snapshots out of the real per-user cache directory."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("PROMPT_CATALOG_CACHE_DIR", str(tmp_path_factory.mktemp("user-cache")))
+        yield
+
 
 @pytest.fixture
 def catalog_root(tmp_path: Path) -> Path:
@@ -171,3 +199,22 @@ def catalog_root(tmp_path: Path) -> Path:
     (tmp_path / "prompts" / "index.json").write_text(json.dumps(index, indent=2))
 
     return tmp_path
+
+
+def _generate(request, root: Path) -> Path:
+    marker = request.node.get_closest_marker("synthetic")
+    kwargs = {**SYNTHETIC_DEFAULTS, **(marker.kwargs if marker else {})}
+    generate_catalog(root, schema_dir=REPO_SCHEMA, **kwargs)
+    return root
+
+
+@pytest.fixture
+def synthetic_root(request, tmp_path: Path) -> Path:
+    """A freshly generated catalog the test may modify."""
+    return _generate(request, tmp_path / "synthetic")
+
+
+@pytest.fixture(scope="module")
+def synthetic(request, tmp_path_factory) -> Catalog:
+    """A generated catalog, loaded once and shared by a module's tests."""
+    return Catalog.load(_generate(request, tmp_path_factory.mktemp("synthetic")), cache=False)
@@ -0,0 +1,125 @@
+"""Tests for batch rendering."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from prompt_catalog_mcp.batch import render_jsonl
+from prompt_catalog_mcp.catalog import Catalog, PromptEntry
+from prompt_catalog_mcp.cli import main
+from prompt_catalog_mcp.template import MissingArgumentsError
+
+
+@pytest.fixture
+def entry(catalog_root: Path) -> PromptEntry:
+    entry = PromptEntry.from_yaml(catalog_root / "prompts" / "planning" / "test-prompt-1.yaml")
+    entry.variables = [{"name": "project_name", "required": True}, {"name": "methodology"}]
+    return entry
+
+
+class TestRenderMany:
+    def test_lazy_and_in_order(self, entry: PromptEntry) -> None:
+        rendered = entry.render_many({"project_name": name} for name in ["A", "B"])
+        assert next(rendered) == "Generate a plan for A using {{methodology}}."
+        assert list(rendered) == ["Generate a plan for B using {{methodology}}."]
+
+    def test_check_required(self, entry: PromptEntry) -> None:
+        rendered = entry.render_many([{"project_name": "A"}, None], check_required=True)
+        assert next(rendered).startswith("Generate a plan for A")
+        with pytest.raises(MissingArgumentsError):
+            next(rendered)
+
+
+class TestRenderJsonl:
+    LINES = [
+        '{"project_name": "Acme", "methodology": "scrum"}\n',
+        "\n",
+        "not json\n",
+        '["a list"]\n',
+        '{"methodology": 3}\n',
+    ]
+
+    def test_records(self, entry: PromptEntry) -> None:
+        results = list(render_jsonl(entry, self.LINES, check_required=True))
+        assert [ok for ok, _ in results] == [True, False, False, False]
+        records = [json.loads(line) for _, line in results]
+        assert records[0] == {
+            "line": 1,
+            "arguments": {"project_name": "Acme", "methodology": "scrum"},
+            "text": "Generate a plan for Acme using scrum.",
+        }
+        assert [r["line"] for r in records] == [1, 3, 4, 5]
+        assert records[2]["error"] == "Expected a JSON object of argument values"
+        assert records[3] == {
+            "line": 5,
+            "arguments": {"methodology": 3},
+            "error": "Missing required argument(s) for test-prompt-1: project_name",
+        }
+
+    def test_process_pool_keeps_order(self, entry: PromptEntry, monkeypatch) -> None:
+        import prompt_catalog_mcp.batch as batch
+
+        monkeypatch.setattr(batch, "CHUNK_LINES", 7)
+        lines = [json.dumps({"project_name": f"p{n}"}) for n in range(200)]
+        serial = list(render_jsonl(entry, lines))
+        assert list(render_jsonl(entry, lines, jobs=2)) == serial
+        assert json.loads(serial[-1][1])["text"].startswith("Generate a plan for p199 ")
+
+
+class TestRenderCli:
+    def test_single(self, catalog_root: Path, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(catalog_root))
+        result = CliRunner().invoke(main, ["render", "TEST-PROMPT-2", "-a", "project_name=Atlas"])
+        assert result.exit_code == 0, result.output
+        assert result.output == "Review the architecture for Atlas.\n"
+        result = CliRunner().invoke(main, ["render", "test-prompt-2", "-a", "project_name"])
+        assert result.exit_code == 2
+        assert "expected NAME=VALUE" in result.output
+
+    def test_batch_file(self, catalog_root: Path, tmp_path: Path, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(catalog_root))
+        source = tmp_path / "args.jsonl"
+        source.write_text("".join(json.dumps({"project_name": f"p{n}"}) + "\n" for n in range(5)) + "{\n")
+        out = tmp_path / "rendered.jsonl"
+        result = CliRunner().invoke(main, ["render", "test-prompt-2", "--batch", str(source), "--out", str(out)])
+        assert result.exit_code == 1
+        assert result.stderr == "Rendered 5 of 6 argument sets (1 errors)\n"
+        records = [json.loads(line) for line in out.read_text().splitlines()]
+        assert [r.get("text") for r in records[:2]] == [
+            "Review the architecture for p0.",
+            "Review the architecture for p1.",
+        ]
+        assert "error" in records[5]
+
+    def test_batch_reports_undecodable_lines(self, catalog_root: Path, tmp_path: Path, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(catalog_root))
+        source = tmp_path / "args.jsonl"
+        source.write_bytes(b'{"project_name": "\xff"}\n{"project_name": "ok"}\n')
+        out = tmp_path / "rendered.jsonl"
+        result = CliRunner().invoke(main, ["render", "test-prompt-2", "--batch", str(source), "--out", str(out)])
+        assert result.exit_code == 1
+        assert result.stderr == "Rendered 1 of 2 argument sets (1 errors)\n"
+        records = [json.loads(line) for line in out.read_text().splitlines()]
+        assert records[0] == {"line": 1, "arguments": None, "error": "Line is not valid UTF-8"}
+        assert records[1]["text"] == "Review the architecture for ok."
+
+    def test_batch_stdin(self, catalog_root: Path, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(catalog_root))
+        result = CliRunner().invoke(main, ["render", "test-prompt-2", "--batch", "-"], input='{"project_name": "X"}\n')
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.stdout)["text"] == "Review the architecture for X."
+
+
+def test_store_entry_batch(catalog_root: Path, tmp_path: Path) -> None:
+    from prompt_catalog_mcp.store import CatalogStore
+
+    catalog = Catalog.load(catalog_root, cache=False)
+    store = Catalog.open_store(CatalogStore.build(catalog, tmp_path / "c.sqlite3"))
+    lines = ['{"project_name": "Atlas"}']
+    assert [json.loads(line)["text"] for _, line in render_jsonl(store.prompts["test-prompt-2"], lines, jobs=2)] == [
+        "Review the architecture for Atlas."
+    ]
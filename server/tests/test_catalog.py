@@ -2,9 +2,26 @@
 
 from __future__ import annotations
 
+import gc
+import hashlib
+import itertools
+import json
+import os
+import tracemalloc
 from pathlib import Path
 
-from prompt_catalog_mcp.catalog import Catalog, PromptEntry, InstructionEntry
+import pytest
+
+from prompt_catalog_mcp.catalog import (
+    SKILL_ORDER,
+    Catalog,
+    InstructionEntry,
+    LazyPromptEntry,
+    PromptEntry,
+)
+from prompt_catalog_mcp.snapshot import SNAPSHOT_DIR, CatalogSnapshot, snapshot_dir
+
+pytestmark = pytest.mark.synthetic(prompts=400, seed=11)
 
 
 class TestPromptEntry:
@@ -38,6 +55,16 @@ class TestInstructionEntry:
         entry = InstructionEntry.from_path("guardrails", path)
         assert entry.name == "Test Guardrail"
 
+    def test_catalog_metadata(self) -> None:
+        path = Path(__file__).resolve().parents[2] / "instructions" / "guardrails" / "security.instructions.md"
+        entry = InstructionEntry.from_path("guardrails", path)
+        assert entry.id == "INST-GUARD-002"
+        assert entry.version == "1.0.0"
+        assert entry.metadata["scope"] == "guardrail"
+        assert entry.priority
+        assert entry.read_text().startswith("---")
+        assert entry.read_body().lstrip().startswith("#")
+
 
 class TestCatalogLoad:
     def test_load(self, catalog_root: Path) -> None:
@@ -76,3 +103,328 @@ class TestCatalogFilter:
         catalog = Catalog.load(catalog_root)
         results = catalog.filter_prompts(category="security")
         assert len(results) == 0
+
+    def test_filter_platform_wildcard(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root)
+        assert [p.id for p in catalog.filter_prompts(platform="web")] == ["test-prompt-1", "test-prompt-2"]
+        # Unknown platforms still match prompts that target "all".
+        assert [p.id for p in catalog.filter_prompts(platform="ios")] == ["test-prompt-1"]
+
+    def test_filter_skill_is_upper_bound(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root)
+        assert [p.id for p in catalog.filter_prompts(skill_level="beginner")] == ["test-prompt-1"]
+        assert len(catalog.filter_prompts(skill_level="expert")) == 2
+        with pytest.raises(ValueError):
+            catalog.filter_prompts(skill_level="guru")
+
+    def test_filter_index_follows_reload(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root)
+        assert len(catalog.filter_prompts(category="planning")) == 2
+        path = catalog_root / "prompts" / "planning" / "test-prompt-2.yaml"
+        path.unlink()
+        new = catalog.reload([path])
+        assert [p.id for p in new.filter_prompts(category="planning")] == ["test-prompt-1"]
+        assert len(catalog.filter_prompts(category="planning")) == 2
+
+
+def _scan(catalog: Catalog, *, category=None, subcategory=None, skill_level=None,
+          platform=None, tag=None, query=None) -> list[str]:
+    """Reference linear-scan filter."""
+    out = []
+    for p in catalog.prompts.values():
+        if category and p.category != category:
+            continue
+        if subcategory and p.subcategory != subcategory:
+            continue
+        if skill_level and SKILL_ORDER.index(p.skill_level) > SKILL_ORDER.index(skill_level):
+            continue
+        if platform and platform not in p.platforms and "all" not in p.platforms:
+            continue
+        if tag and tag not in p.tags:
+            continue
+        if query and query.lower() not in f"{p.title} {p.description} {' '.join(p.tags)}".lower():
+            continue
+        out.append(p.id)
+    return out
+
+
+class TestFacetIndex:
+    def test_matches_linear_scan(self, synthetic: Catalog) -> None:
+        prompts = list(synthetic.prompts.values())
+        options = {
+            "category": [None, prompts[0].category, "nope"],
+            "subcategory": [None, prompts[1].subcategory],
+            "skill_level": [None, *SKILL_ORDER],
+            "platform": [None, "web", "linux", "cloud-gcp"],
+            "tag": [None, prompts[2].tags[0], prompts[3].tags[-1]],
+            "query": [None, "design", "REVIEW"],
+        }
+        for combo in itertools.product(*options.values()):
+            filters = dict(zip(options, combo))
+            assert [p.id for p in synthetic.filter_prompts(**filters)] == _scan(synthetic, **filters), filters
+
+    def test_facets_match_filter(self, synthetic: Catalog) -> None:
+        for filters in ({}, {"platform": "web", "skill_level": "advanced"}, {"category": "security", "query": "review"}):
+            result = synthetic.facets(**filters)
+            assert result.ids == [p.id for p in synthetic.filter_prompts(**filters)]
+
+    def test_facets_multi_value(self, synthetic: Catalog) -> None:
+        web = set(synthetic.facets(platform="web").ids)
+        linux = set(synthetic.facets(platform="linux").ids)
+        assert set(synthetic.facets(platform=["web", "linux"]).ids) == web | linux
+
+        tags = list(synthetic.prompts.values())[0].tags[:2]
+        both = synthetic.facets(tag=tags).ids
+        assert both == [p.id for p in synthetic.prompts.values() if set(tags) <= set(p.tags)]
+
+    def test_facet_counts(self, synthetic: Catalog) -> None:
+        result = synthetic.facets(platform=["web", "cloud"], skill_level="advanced")
+        matched = [synthetic.prompts[pid] for pid in result.ids]
+        for tag, count in result.counts["tag"].items():
+            assert count == sum(tag in p.tags for p in matched)
+        assert sum(result.counts["category"].values()) == len(matched)
+
+        # A facet's own selection does not narrow its counts.
+        advanced = synthetic.facets(skill_level="advanced")
+        assert result.counts["platform"]["linux"] == len(
+            synthetic.facets(platform="linux", skill_level="advanced").ids
+        )
+        assert set(result.counts["skill_level"]) >= {"beginner", "advanced"}
+        assert sum(advanced.counts["skill_level"].values()) == len(synthetic.prompts)
+
+    def test_built_once(self, synthetic: Catalog) -> None:
+        index = synthetic.facet_index()
+        synthetic.filter_prompts(tag="security")
+        assert synthetic.facet_index() is index
+
+
+class TestCatalogSnapshot:
+    def test_load_writes_snapshot(self, catalog_root: Path) -> None:
+        Catalog.load(catalog_root)
+        assert CatalogSnapshot(catalog_root.resolve()).path.exists()
+        # Never inside the checkout, where anyone who can commit could plant one.
+        assert not (catalog_root / SNAPSHOT_DIR).exists()
+
+    def test_cache_disabled(self, catalog_root: Path) -> None:
+        Catalog.load(catalog_root, cache=False)
+        assert not snapshot_dir(catalog_root.resolve()).exists()
+
+    def test_one_snapshot_per_root(self, catalog_root: Path, tmp_path: Path) -> None:
+        assert snapshot_dir(catalog_root.resolve()) != snapshot_dir((tmp_path / "other").resolve())
+
+    @pytest.mark.skipif(not hasattr(os, "getuid") or os.getuid() != 0, reason="needs root to chown")
+    def test_foreign_snapshot_is_ignored(self, catalog_root: Path, monkeypatch) -> None:
+        Catalog.load(catalog_root)
+        os.chown(CatalogSnapshot(catalog_root.resolve()).path, 12345, -1)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("a snapshot owned by another user must not be unpickled")
+
+        monkeypatch.setattr("pickle.load", fail)
+        assert len(Catalog.load(catalog_root).prompts) == 2
+
+    def test_warm_load_skips_parsing(self, catalog_root: Path, monkeypatch) -> None:
+        Catalog.load(catalog_root)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("file should have come from the snapshot")
+
+        monkeypatch.setattr(PromptEntry, "from_yaml", fail)
+        catalog = Catalog.load(catalog_root)
+        assert set(catalog.prompts) == {"test-prompt-1", "test-prompt-2"}
+        assert catalog.prompts["test-prompt-1"].render({"project_name": "Acme"}).startswith(
+            "Generate a plan for Acme"
+        )
+
+    def test_changed_file_is_reparsed(self, catalog_root: Path) -> None:
+        Catalog.load(catalog_root)
+        path = catalog_root / "prompts" / "planning" / "test-prompt-2.yaml"
+        path.write_text(path.read_text().replace("Second Prompt", "Renamed Prompt"))
+
+        catalog = Catalog.load(catalog_root)
+        assert catalog.prompts["test-prompt-2"].title == "Renamed Prompt"
+
+    def test_deleted_file_is_dropped(self, catalog_root: Path) -> None:
+        Catalog.load(catalog_root)
+        (catalog_root / "prompts" / "planning" / "test-prompt-2.yaml").unlink()
+
+        catalog = Catalog.load(catalog_root)
+        assert set(catalog.prompts) == {"test-prompt-1"}
+
+    def test_corrupt_snapshot_is_ignored(self, catalog_root: Path) -> None:
+        Catalog.load(catalog_root)
+        CatalogSnapshot(catalog_root.resolve()).path.write_bytes(b"not a pickle")
+
+        catalog = Catalog.load(catalog_root)
+        assert len(catalog.prompts) == 2
+
+
+class TestParallelLoad:
+    def test_matches_serial_order(self, catalog_root: Path) -> None:
+        serial = Catalog.load(catalog_root, cache=False)
+        parallel = Catalog.load(catalog_root, cache=False, workers=2)
+        assert list(parallel.prompts) == list(serial.prompts)
+        assert list(parallel.instructions) == list(serial.instructions)
+        assert list(parallel.starter_kits) == list(serial.starter_kits)
+        assert parallel.prompts["test-prompt-2"] == serial.prompts["test-prompt-2"]
+
+    def test_malformed_file_is_skipped(self, catalog_root: Path, caplog) -> None:
+        (catalog_root / "prompts" / "planning" / "broken.yaml").write_text("title: [unclosed")
+        catalog = Catalog.load(catalog_root, cache=False, workers=2)
+        assert set(catalog.prompts) == {"test-prompt-1", "test-prompt-2"}
+        assert "Skipping malformed prompt" in caplog.text
+
+
+def _fingerprint_index(root: Path) -> None:
+    """Rewrite the fixture index.json with full, fingerprinted prompt rows."""
+    index_path = root / "prompts" / "index.json"
+    index = json.loads(index_path.read_text())
+    for row in index["prompts"]:
+        path = root / row["file"]
+        entry = PromptEntry.from_yaml(path)
+        st = path.stat()
+        row.update(
+            title=entry.title,
+            subcategory=entry.subcategory,
+            skill_level=entry.skill_level,
+            platforms=entry.platforms,
+            tags=entry.tags,
+            sha256=hashlib.sha256(path.read_bytes()).hexdigest(),
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+        )
+    index_path.write_text(json.dumps(index, indent=2))
+
+
+class TestLazyLoad:
+    def test_listing_does_not_parse(self, catalog_root: Path, monkeypatch) -> None:
+        _fingerprint_index(catalog_root)
+        parsed = []
+        original = PromptEntry.from_yaml.__func__
+        monkeypatch.setattr(
+            PromptEntry, "from_yaml", classmethod(lambda cls, p: parsed.append(p) or original(cls, p))
+        )
+
+        catalog = Catalog.load(catalog_root, lazy=True, cache=False)
+        entry = catalog.prompts["test-prompt-2"]
+        assert isinstance(entry, LazyPromptEntry)
+        assert entry.title == "Second Prompt"
+        assert catalog.filter_prompts(platform="web", tag="planning") == [entry]
+        assert parsed == []
+
+        assert entry.prompt_text == "Review the architecture for {{project_name}}."
+        assert parsed == [entry.file_path]
+        assert entry.raw["name"] == "Second Prompt"
+        assert len(parsed) == 1
+
+    def test_unfingerprinted_rows_are_parsed(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, lazy=True, cache=False)
+        assert not any(isinstance(p, LazyPromptEntry) for p in catalog.prompts.values())
+        assert len(catalog.prompts) == 2
+
+    def test_missing_index_parses_sources(self, catalog_root: Path) -> None:
+        (catalog_root / "prompts" / "index.json").unlink()
+        catalog = Catalog.load(catalog_root, lazy=True, cache=False)
+        assert not any(isinstance(p, LazyPromptEntry) for p in catalog.prompts.values())
+        assert len(catalog.prompts) == 2
+
+    def test_touched_file_revalidated_by_hash(self, catalog_root: Path) -> None:
+        _fingerprint_index(catalog_root)
+        path = catalog_root / "prompts" / "planning" / "test-prompt-1.yaml"
+        os.utime(path, ns=(1, 1))
+
+        catalog = Catalog.load(catalog_root, lazy=True, cache=False)
+        assert isinstance(catalog.prompts["test-prompt-1"], LazyPromptEntry)
+
+    def test_stale_row_is_parsed(self, catalog_root: Path) -> None:
+        _fingerprint_index(catalog_root)
+        path = catalog_root / "prompts" / "planning" / "test-prompt-1.yaml"
+        path.write_text(path.read_text().replace("title: Test Prompt", "title: Edited Prompt"))
+
+        catalog = Catalog.load(catalog_root, lazy=True, cache=False)
+        entry = catalog.prompts["test-prompt-1"]
+        assert not isinstance(entry, LazyPromptEntry)
+        assert entry.title == "Edited Prompt"
+
+
+class TestCatalogReload:
+    def test_modified_file(self, catalog_root: Path) -> None:
+        old = Catalog.load(catalog_root, cache=False)
+        path = catalog_root / "prompts" / "planning" / "test-prompt-1.yaml"
+        path.write_text(path.read_text().replace("title: Test Prompt", "title: Edited"))
+
+        new = old.reload([path])
+        assert new.generation == old.generation + 1
+        assert new.prompts["test-prompt-1"].title == "Edited"
+        assert list(new.prompts) == list(old.prompts)
+        assert old.prompts["test-prompt-1"].title == "Test Prompt"
+
+    def test_added_and_deleted_files(self, catalog_root: Path) -> None:
+        old = Catalog.load(catalog_root, cache=False)
+        planning = catalog_root / "prompts" / "planning"
+        added = planning / "test-prompt-3.yaml"
+        added.write_text(
+            (planning / "test-prompt-2.yaml").read_text().replace("test-prompt-2", "test-prompt-3")
+        )
+        deleted = planning / "test-prompt-1.yaml"
+        deleted.unlink()
+        kit = catalog_root / "starter-kits" / "test-kit.yaml"
+        kit.unlink()
+
+        new = old.reload([added, deleted, kit])
+        assert set(new.prompts) == {"test-prompt-2", "test-prompt-3"}
+        assert new.starter_kits == {}
+        assert set(old.prompts) == {"test-prompt-1", "test-prompt-2"}
+
+    def test_changed_id_replaces_old_key(self, catalog_root: Path) -> None:
+        old = Catalog.load(catalog_root, cache=False)
+        path = catalog_root / "prompts" / "planning" / "test-prompt-1.yaml"
+        path.write_text(path.read_text().replace("id: test-prompt-1", "id: renamed"))
+
+        new = old.reload([path])
+        assert set(new.prompts) == {"renamed", "test-prompt-2"}
+
+    def test_ignores_non_source_paths(self, catalog_root: Path) -> None:
+        old = Catalog.load(catalog_root, cache=False)
+        new = old.reload([catalog_root / "README.md", catalog_root / "prompts" / "index.json"])
+        assert new.prompts == old.prompts
+
+
+class TestCompactLoad:
+    def test_entries_are_slotted(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        assert not hasattr(catalog.prompts["test-prompt-1"], "__dict__")
+
+    def test_raw_rebuilt_on_demand(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False, compact=True)
+        entry = catalog.prompts["test-prompt-1"]
+        assert entry.raw["name"] == "Test Prompt"
+        with pytest.raises(AttributeError):
+            PromptEntry.raw.__get__(entry)
+
+    def test_shared_strings_are_interned(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False, compact=True)
+        one, two = catalog.prompts["test-prompt-1"], catalog.prompts["test-prompt-2"]
+        assert one.tags[0] is two.tags[0]
+        assert one.category is two.category
+
+    def test_uses_less_memory(self, catalog_root: Path) -> None:
+        def traced(**kwargs) -> int:
+            gc.collect()
+            tracemalloc.start()
+            catalog = Catalog.load(catalog_root, cache=False, **kwargs)
+            gc.collect()
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del catalog
+            return size
+
+        traced()  # warm imports
+        assert traced(compact=True) < traced()
+
+    def test_reload_keeps_compact(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False, compact=True)
+        path = catalog_root / "prompts" / "planning" / "test-prompt-1.yaml"
+        new = catalog.reload([path])
+        with pytest.raises(AttributeError):
+            PromptEntry.raw.__get__(new.prompts["test-prompt-1"])
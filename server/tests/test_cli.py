@@ -127,3 +127,11 @@ class TestCLIHelp:
         runner, env = cli_runner
         result = runner.invoke(main, ["validate", "--help"], env=env)
         assert result.exit_code == 0
+
+
+class TestCLIWorkers:
+    def test_list_with_workers(self, cli_runner) -> None:
+        runner, env = cli_runner
+        result = runner.invoke(main, ["--workers", "2", "list"], env=env)
+        assert result.exit_code == 0
+        assert "test-prompt-1" in result.output or "Test Prompt" in result.output
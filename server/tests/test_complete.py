@@ -0,0 +1,113 @@
+"""Tests for prefix autocomplete."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import importlib.util
+import timeit
+from collections import Counter
+from pathlib import Path
+
+import pytest
+from click.shell_completion import ShellComplete
+
+from prompt_catalog_mcp.catalog import Catalog
+from prompt_catalog_mcp.cli import main
+from prompt_catalog_mcp.complete import _Column
+
+HAS_MCP = importlib.util.find_spec("mcp") is not None
+pytestmark = pytest.mark.synthetic(prompts=400, kits=6, seed=21)
+
+
+def _expected(counts: Counter, prefix: str, limit: int) -> list[str]:
+    names = [n for n in counts if n.lower().startswith(prefix.lower())]
+    return sorted(names, key=lambda n: (-counts[n], n.lower(), n))[:limit]
+
+
+class TestColumn:
+    @pytest.mark.parametrize("prefix", ["", "a", "ab", "b", "zz"])
+    @pytest.mark.parametrize("limit", [1, 3, 50])
+    def test_matches_brute_force(self, prefix: str, limit: int) -> None:
+        words = ["a", "ab", "abc", "Abd", "b", "ba", "bb", "c", "ca", "cab", "z"]
+        counts = Counter({w: (i * 7) % 4 for i, w in enumerate(words)})
+        result = _Column(counts).complete(prefix, limit)
+        assert result.values == _expected(counts, prefix, limit)
+        assert result.total == len(_expected(counts, prefix, 100))
+
+
+class TestCompletionIndex:
+    def test_tags_ranked_by_use(self, synthetic: Catalog) -> None:
+        counts = Counter(tag for p in synthetic.prompts.values() for tag in p.tags)
+        for prefix in ["", "s", "Se", "c"]:
+            result = synthetic.complete("tag", prefix, 10)
+            assert result.values == _expected(counts, prefix, 10)
+
+    def test_ids_ranked_by_kit_membership(self, synthetic: Catalog) -> None:
+        counts = Counter({pid: 0 for pid in synthetic.prompts})
+        counts.update(pid for kit in synthetic.starter_kits.values() for pid in kit.prompts)
+        prefix = next(iter(synthetic.prompts))[:4].lower()
+        result = synthetic.complete("id", prefix, 15)
+        assert result.values == _expected(counts, prefix, 15)
+        assert result.has_more
+
+    def test_argument_values(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        assert catalog.complete_argument("TEST-PROMPT-1", "methodology", "AG").values == ["agile"]
+        # test-prompt-2 has no example of its own; test-prompt-1's is offered.
+        assert catalog.complete_argument("test-prompt-2", "project_name").values == ["MyApp"]
+        assert catalog.complete_argument("test-prompt-2", "methodology").total == 0
+        assert catalog.complete_argument("nope", "project_name").values == []
+
+    def test_unknown_kind(self, catalog_root: Path) -> None:
+        with pytest.raises(ValueError, match="Unknown completion kind"):
+            Catalog.load(catalog_root, cache=False).complete("title", "x")
+
+    def test_follows_reload(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        assert catalog.complete("id", "test-").total == 2
+        path = catalog_root / "prompts" / "planning" / "test-prompt-2.yaml"
+        path.unlink()
+        assert catalog.reload([path]).complete("id", "test-").values == ["test-prompt-1"]
+
+    def test_answers_in_microseconds(self, synthetic: Catalog) -> None:
+        synthetic.complete("id", "")
+        seconds = min(timeit.repeat(lambda: synthetic.complete("id", "", 20), number=200, repeat=3)) / 200
+        assert seconds < 1e-3
+
+
+class TestShellCompletion:
+    def _complete(self, args: list[str], incomplete: str) -> list[str]:
+        comp = ShellComplete(main, {}, "prompt-catalog", "_PROMPT_CATALOG_COMPLETE")
+        return [item.value for item in comp.get_completions(args, incomplete)]
+
+    def test_prompt_ids_and_tags(self, catalog_root: Path, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(catalog_root))
+        assert self._complete(["show"], "TEST-") == ["test-prompt-1", "test-prompt-2"]
+        assert self._complete(["list", "--tag"], "pl") == ["planning"]
+        assert self._complete(["list", "--tag"], "") == ["test", "planning"]
+
+    def test_broken_catalog_completes_nothing(self, tmp_path: Path, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(tmp_path / "missing"))
+        assert self._complete(["kit", "show"], "") == []
+
+
+@pytest.mark.skipif(not HAS_MCP, reason="mcp package not installed")
+class TestCompletionServer:
+    def test_prompt_argument_and_template(self, catalog_root: Path, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(catalog_root))
+        import prompt_catalog_mcp.server as srv
+        from mcp.types import CompletionArgument, PromptReference, ResourceTemplateReference
+
+        importlib.reload(srv)
+        srv._catalog = None
+        ref = PromptReference(type="ref/prompt", name="test-prompt-1")
+        result = asyncio.run(srv.complete(ref, CompletionArgument(name="project_name", value="my"), None))
+        assert result.values == ["MyApp"]
+        assert result.hasMore is False
+
+        ref = ResourceTemplateReference(type="ref/resource", uri=srv.PROMPT_TEMPLATE)
+        result = asyncio.run(srv.complete(ref, CompletionArgument(name="id", value="test"), None))
+        assert result.values == ["test-prompt-1", "test-prompt-2"]
+        templates = asyncio.run(srv.list_resource_templates())
+        assert [t.uriTemplate for t in templates] == [srv.PROMPT_TEMPLATE]
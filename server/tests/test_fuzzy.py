@@ -0,0 +1,134 @@
+"""Tests for fuzzy "did you mean" lookup."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import importlib.util
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from prompt_catalog_mcp.catalog import Catalog
+from prompt_catalog_mcp.cli import main
+from prompt_catalog_mcp.fuzzy import FuzzyIndex, default_distance, edit_distance
+
+HAS_MCP = importlib.util.find_spec("mcp") is not None
+pytestmark = pytest.mark.synthetic(prompts=400, kits=4, seed=9)
+
+
+def _full_distance(a: str, b: str) -> int:
+    """Unbounded optimal string alignment distance."""
+    d = [[i + j if i * j == 0 else 0 for j in range(len(b) + 1)] for i in range(len(a) + 1)]
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                d[i][j] = min(d[i][j], d[i - 2][j - 2] + 1)
+    return d[-1][-1]
+
+
+class TestEditDistance:
+    @pytest.mark.parametrize(
+        "a, b",
+        [("kitten", "sitting"), ("abcd", "acbd"), ("sec-threat-001", "sec-trheat-001"),
+         ("", "abc"), ("ca", "abc"), ("flaw", "lawn"), ("plan-req-001", "plan-req-010")],
+    )
+    def test_matches_full_table(self, a: str, b: str) -> None:
+        expected = _full_distance(a, b)
+        assert edit_distance(a, b, 5) == expected
+        assert edit_distance(a, b, expected) == expected
+        if expected:
+            assert edit_distance(a, b, expected - 1) == expected  # gives up at limit + 1
+
+    def test_default_distance_grows_with_length(self) -> None:
+        assert default_distance("ab") == 0
+        assert default_distance("fintch") == 1
+        assert default_distance("sec-trheat-001") == 2
+
+
+class TestFuzzyIndex:
+    def test_catalog_suggestions(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        match = catalog.suggest("test-promtp-2", kinds=["id"])[0]
+        assert (match.kind, match.key, match.distance) == ("id", "test-prompt-2", 1)
+        assert catalog.suggest("Secnod Prompt")[0].key == "test-prompt-2"
+        assert [m.key for m in catalog.suggest("planing", kinds=["tag"])] == ["planning"]
+        assert catalog.suggest("zzzzzzzz") == []
+
+    def test_one_match_per_prompt(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        # "test prompt" is close to prompt 1's title and to both IDs.
+        keys = [m.key for m in catalog.suggest("test prompt", kinds=["id", "title"], limit=10)]
+        assert len(keys) == len(set(keys))
+
+    def test_agrees_with_brute_force(self, synthetic: Catalog) -> None:
+        index = synthetic.fuzzy_index()
+        names = [p.id for p in list(synthetic.prompts.values())[::37]]
+        queries = [n[:4] + n[5:] for n in names] + [n[:-1] + "x" for n in names] + ["securty", "cachng"]
+        for query in queries:
+            q = query.lower()
+            k = default_distance(q)
+            got = index.lookup(query, kinds=["id", "tag"], limit=3)
+            distances = sorted(
+                d for kind, text, _ in index.names
+                if kind in ("id", "tag") and (d := _full_distance(q, text.lower())) <= k
+            )
+            assert [m.distance for m in got] == distances[:3], query
+
+    def test_kits_are_indexed(self, synthetic: Catalog) -> None:
+        kit_id = next(iter(synthetic.starter_kits))
+        typo = kit_id[:-2] + kit_id[-1] + kit_id[-2]
+        assert synthetic.suggest(typo, kinds=["kit"])[0].key == kit_id
+
+    def test_index_follows_reload(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        assert catalog.suggest("test-prompt-22", kinds=["id"])
+        path = catalog_root / "prompts" / "planning" / "test-prompt-2.yaml"
+        path.unlink()
+        new = catalog.reload([path])
+        assert [m.key for m in new.suggest("test-prompt-22", kinds=["id"])] == ["test-prompt-1"]
+
+    def test_empty_index(self) -> None:
+        assert FuzzyIndex([]).lookup("anything") == []
+
+
+class TestFuzzyCli:
+    def test_show_suggests(self, catalog_root: Path, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(catalog_root))
+        result = CliRunner().invoke(main, ["show", "test-promt-1"])
+        assert result.exit_code == 1
+        assert "Did you mean: test-prompt-1" in result.output
+
+    def test_suggest_command(self, catalog_root: Path, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(catalog_root))
+        result = CliRunner().invoke(main, ["suggest", "planing", "--kind", "tag"])
+        assert result.exit_code == 0, result.output
+        assert "planning" in result.output
+        result = CliRunner().invoke(main, ["suggest", "qqqqqqqq"])
+        assert "Nothing close" in result.output
+
+
+@pytest.mark.skipif(not HAS_MCP, reason="mcp package not installed")
+class TestFuzzyServer:
+    @pytest.fixture
+    def srv(self, catalog_root: Path, monkeypatch):
+        monkeypatch.setenv("CATALOG_ROOT", str(catalog_root))
+        import prompt_catalog_mcp.server as srv
+
+        importlib.reload(srv)
+        srv._catalog = None
+        return srv
+
+    def test_suggest_tool(self, srv) -> None:
+        tools = asyncio.run(srv.list_tools())
+        assert "suggest" in [t.name for t in tools]
+        result = asyncio.run(srv.call_tool("suggest", {"name": "test-promt-2", "kinds": ["id"]}))
+        assert result["matches"][0] == {
+            "kind": "id", "name": "test-prompt-2", "key": "test-prompt-2", "distance": 1,
+        }
+
+    def test_get_prompt_miss_suggests(self, srv) -> None:
+        with pytest.raises(ValueError, match="did you mean: test-prompt-1"):
+            asyncio.run(srv.get_prompt("test-promt-1"))
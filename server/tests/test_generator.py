@@ -0,0 +1,80 @@
+"""Tests for the synthetic catalog generator."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from prompt_catalog_mcp.catalog import Catalog, LazyPromptEntry
+from prompt_catalog_mcp.cli import main
+from prompt_catalog_mcp.generator import generate_catalog
+from prompt_catalog_mcp.validator import validate_all
+
+from .conftest import REPO_SCHEMA
+
+pytestmark = pytest.mark.synthetic(prompts=120, kits=4, instructions=6, seed=7)
+
+
+def _tree(root: Path) -> dict[str, bytes]:
+    return {p.relative_to(root).as_posix(): p.read_bytes() for p in sorted(root.rglob("*")) if p.is_file()}
+
+
+class TestGenerateCatalog:
+    def test_deterministic(self, tmp_path: Path, synthetic_root: Path) -> None:
+        again = tmp_path / "again"
+        generate_catalog(again, prompts=120, kits=4, instructions=6, seed=7, schema_dir=REPO_SCHEMA)
+        assert _tree(again) == _tree(synthetic_root)
+
+    def test_seed_changes_output(self, tmp_path: Path, synthetic_root: Path) -> None:
+        other = tmp_path / "other"
+        generate_catalog(other, prompts=120, kits=4, instructions=6, seed=8, schema_dir=REPO_SCHEMA)
+        assert _tree(other) != _tree(synthetic_root)
+
+    @pytest.mark.skipif(not REPO_SCHEMA.is_dir(), reason="catalog schemas not available")
+    def test_validates_cleanly(self, synthetic_root: Path) -> None:
+        results = validate_all(synthetic_root)
+        assert sum(r.error_count for r in results.values()) == 0
+        assert results["prompts"].files_passed == 120
+
+    def test_loads(self, synthetic_root: Path) -> None:
+        catalog = Catalog.load(synthetic_root, cache=False)
+        assert len(catalog.prompts) == 120
+        assert len(catalog.instructions) == 6
+        assert len(catalog.starter_kits) == 4
+        for kit in catalog.starter_kits.values():
+            prompts, _ = catalog.resolve_kit(kit.id)
+            assert len(prompts) == len(kit.prompts)
+            for ref in kit.instructions:
+                assert (synthetic_root / "instructions" / f"{ref}.instructions.md").is_file()
+
+    def test_index_matches_files(self, synthetic_root: Path) -> None:
+        index = json.loads((synthetic_root / "prompts" / "index.json").read_text())
+        assert index["statistics"]["total_prompts"] == 120
+        assert sum(index["statistics"]["categories"].values()) == 120
+
+        lazy = Catalog.load(synthetic_root, cache=False, lazy=True)
+        assert all(isinstance(p, LazyPromptEntry) for p in lazy.prompts.values())
+        eager = Catalog.load(synthetic_root, cache=False)
+        for pid, entry in eager.prompts.items():
+            assert lazy.prompts[pid].tags == entry.tags
+            assert lazy.prompts[pid].platforms == entry.platforms
+
+
+class TestCLIGenCatalog:
+    def test_gen_catalog(self, tmp_path: Path) -> None:
+        out = tmp_path / "cli"
+        runner = CliRunner()
+        args = ["dev", "gen-catalog", "--prompts", "30", "--kits", "2", "-o", str(out)]
+        result = runner.invoke(main, args)
+        assert result.exit_code == 0, result.output
+        assert "30 prompts" in result.output
+        assert len(list((out / "prompts").rglob("*.yaml"))) == 30
+
+        # Refuses to write into a non-empty directory without --force
+        result = runner.invoke(main, args)
+        assert result.exit_code == 1
+        result = runner.invoke(main, [*args, "--force"])
+        assert result.exit_code == 0
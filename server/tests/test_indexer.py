@@ -0,0 +1,138 @@
+"""Tests for the index.json builder and trusted-index loading."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from prompt_catalog_mcp import catalog as catalog_module
+from prompt_catalog_mcp.catalog import Catalog
+from prompt_catalog_mcp.cli import main
+from prompt_catalog_mcp.indexer import build_index, read_index, render_index, write_index
+
+pytestmark = pytest.mark.synthetic(prompts=60, kits=3, instructions=4, seed=5)
+
+
+@pytest.fixture
+def indexed_root(synthetic_root: Path) -> Path:
+    write_index(synthetic_root, build_index(synthetic_root).index)
+    return synthetic_root
+
+
+def _no_glob(*args, **kwargs):
+    raise AssertionError("trusted load should not glob the source directories")
+
+
+class TestBuildIndex:
+    def test_rows_cover_sources(self, synthetic_root: Path) -> None:
+        build = build_index(synthetic_root)
+        assert build.errors == []
+        # Generated prompt rows already carry sha256/size, so they are reused by hash.
+        assert build.parsed + build.reused == 60 + 4 + 3
+        index = build.index
+        assert [r["id"] for r in index["prompts"]] == list(Catalog.load(synthetic_root, cache=False).prompts)
+        row = index["prompts"][0]
+        assert {"sha256", "size", "mtime_ns"} <= row.keys()
+        assert index["statistics"]["total_prompts"] == 60
+        assert sum(index["statistics"]["skill_levels"].values()) == 60
+        assert set(index["source_dirs"]) >= {"prompts/planning", "instructions/guardrails"}
+
+    def test_rebuild_is_stable(self, indexed_root: Path) -> None:
+        build = build_index(indexed_root)
+        assert build.parsed == 0
+        assert build.reused == 60 + 4 + 3
+        assert write_index(indexed_root, build.index) is False
+
+    def test_only_changed_files_are_parsed(self, indexed_root: Path) -> None:
+        row = read_index(indexed_root)["prompts"][3]
+        path = indexed_root / row["file"]
+        path.write_text(path.read_text().replace(json.dumps(row["title"]), '"Renamed Prompt"'))
+
+        build = build_index(indexed_root)
+        assert build.parsed == 1
+        assert build.index["prompts"][3]["title"] == "Renamed Prompt"
+        assert build.index["prompts"][3]["sha256"] != row["sha256"]
+
+    def test_touched_file_is_reused_by_hash(self, indexed_root: Path) -> None:
+        row = read_index(indexed_root)["prompts"][0]
+        path = indexed_root / row["file"]
+        path.write_bytes(path.read_bytes())
+        path.touch()
+
+        build = build_index(indexed_root)
+        assert build.parsed == 0
+        assert build.index["prompts"][0]["mtime_ns"] == path.stat().st_mtime_ns
+
+    def test_curated_keys_are_kept(self, synthetic_root: Path) -> None:
+        index = read_index(synthetic_root)
+        index["instructions"][0]["id"] = "PHASE-CURATED"
+        index["chains"] = {"demo": ["A", "B"]}
+        (synthetic_root / "prompts" / "index.json").write_text(json.dumps(index))
+
+        rebuilt = build_index(synthetic_root).index
+        assert rebuilt["instructions"][0]["id"] == "PHASE-CURATED"
+        assert rebuilt["chains"] == {"demo": ["A", "B"]}
+
+    def test_render_is_deterministic(self, synthetic_root: Path) -> None:
+        assert render_index(build_index(synthetic_root).index) == render_index(build_index(synthetic_root).index)
+
+
+class TestTrustIndex:
+    def test_matches_full_load(self, indexed_root: Path, monkeypatch) -> None:
+        expected = Catalog.load(indexed_root, cache=False)
+        monkeypatch.setattr(catalog_module, "iter_sources", _no_glob)
+        for lazy in (False, True):
+            trusted = Catalog.load(indexed_root, cache=False, lazy=lazy, trust_index=True)
+            assert list(trusted.prompts) == list(expected.prompts)
+            assert list(trusted.instructions) == list(expected.instructions)
+            assert list(trusted.starter_kits) == list(expected.starter_kits)
+            first = next(iter(expected.prompts))
+            assert trusted.prompts[first].prompt_text == expected.prompts[first].prompt_text
+
+    def test_added_file_falls_back_to_glob(self, indexed_root: Path) -> None:
+        src = next((indexed_root / "prompts").rglob("*.yaml"))
+        extra = src.with_name("zz-extra.yaml")
+        extra.write_text(src.read_text().replace(src.stem.upper(), "ZZ-EXTRA-001"))
+
+        catalog = Catalog.load(indexed_root, cache=False, trust_index=True)
+        assert len(catalog.prompts) == 61
+
+    def test_untrusted_without_fingerprints(self, synthetic_root: Path, monkeypatch) -> None:
+        monkeypatch.setattr(catalog_module, "iter_sources", _no_glob)
+        with pytest.raises(AssertionError):
+            Catalog.load(synthetic_root, cache=False, trust_index=True)
+
+
+class TestIndexCli:
+    def test_check_then_build(self, synthetic_root: Path, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(synthetic_root))
+        runner = CliRunner()
+
+        stale = runner.invoke(main, ["index", "build", "--check"])
+        assert stale.exit_code == 1
+        assert "out of date" in stale.output
+
+        built = runner.invoke(main, ["index", "build"])
+        assert built.exit_code == 0, built.output
+        assert "Wrote" in built.output
+
+        fresh = runner.invoke(main, ["index", "build", "--check"])
+        assert fresh.exit_code == 0
+        assert "up to date" in fresh.output
+
+    def test_check_ignores_mtimes(self, indexed_root: Path, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(indexed_root))
+        for path in (indexed_root / "prompts" / "planning").glob("*.yaml"):
+            os.utime(path, ns=(1, 1))
+        os.utime(indexed_root / "prompts" / "planning", ns=(1, 1))
+        result = CliRunner().invoke(main, ["index", "build", "--check"])
+        assert result.exit_code == 0, result.output
+
+        path = next((indexed_root / "prompts" / "planning").glob("*.yaml"))
+        path.write_text(path.read_text() + "\n# edited\n")
+        result = CliRunner().invoke(main, ["index", "build", "--check"])
+        assert result.exit_code == 1
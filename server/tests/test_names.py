@@ -0,0 +1,119 @@
+"""Tests for prompt and kit name resolution."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import importlib.util
+from pathlib import Path
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from prompt_catalog_mcp.catalog import Catalog, LazyPromptEntry
+from prompt_catalog_mcp.cli import main
+from prompt_catalog_mcp.indexer import build_index, read_index, write_index
+from prompt_catalog_mcp.names import Resolution
+from prompt_catalog_mcp.packed import write_pack
+from prompt_catalog_mcp.store import CatalogStore
+
+HAS_MCP = importlib.util.find_spec("mcp") is not None
+
+
+@pytest.fixture
+def aliased_root(catalog_root: Path) -> Path:
+    """``catalog_root`` with names declared on test-prompt-2 and a kit alias."""
+    path = catalog_root / "prompts" / "planning" / "test-prompt-2.yaml"
+    data = yaml.safe_load(path.read_text())
+    # "test-prompt-1" is another prompt's ID, so this alias never wins.
+    data["aliases"] = ["Arch-Review", "test-prompt-1"]
+    data["deprecated_ids"] = ["old-prompt-2"]
+    path.write_text(yaml.dump(data))
+    kit = catalog_root / "starter-kits" / "test-kit.yaml"
+    kit.write_text(kit.read_text() + "aliases: [tk]\n")
+    return catalog_root
+
+
+def _check(catalog: Catalog) -> None:
+    assert catalog.lookup_prompt("TEST-PROMPT-2") == Resolution("test-prompt-2", "id")
+    assert catalog.lookup_prompt(" arch-review ") == Resolution("test-prompt-2", "alias")
+    assert catalog.lookup_prompt("OLD-PROMPT-2") == Resolution("test-prompt-2", "deprecated")
+    assert catalog.lookup_prompt("test-prompt-1") == Resolution("test-prompt-1", "id")
+    assert catalog.lookup_prompt("nope") is None
+    assert catalog.find_prompt("arch-review").id == "test-prompt-2"
+    assert catalog.find_kit("TK").id == "test-kit"
+
+
+class TestResolution:
+    def test_loaded(self, aliased_root: Path) -> None:
+        _check(Catalog.load(aliased_root, cache=False))
+
+    def test_lazy_rows_carry_names(self, aliased_root: Path) -> None:
+        write_index(aliased_root, build_index(aliased_root).index)
+        catalog = Catalog.load(aliased_root, cache=False, lazy=True)
+        _check(catalog)
+        entry = catalog.prompts["test-prompt-2"]
+        assert isinstance(entry, LazyPromptEntry)
+        with pytest.raises(AttributeError):
+            object.__getattribute__(entry, "prompt_text")  # never hydrated
+
+    def test_removed_alias_leaves_index(self, aliased_root: Path) -> None:
+        write_index(aliased_root, build_index(aliased_root).index)
+        path = aliased_root / "prompts" / "planning" / "test-prompt-2.yaml"
+        data = yaml.safe_load(path.read_text())
+        del data["aliases"]
+        path.write_text(yaml.dump(data))
+        write_index(aliased_root, build_index(aliased_root).index)
+
+        row = next(r for r in read_index(aliased_root)["prompts"] if r["id"] == "test-prompt-2")
+        assert "aliases" not in row
+        assert row["deprecated_ids"] == ["old-prompt-2"]
+        assert Catalog.load(aliased_root, cache=False, lazy=True).find_prompt("arch-review") is None
+
+    def test_store_and_pack(self, aliased_root: Path, tmp_path: Path) -> None:
+        catalog = Catalog.load(aliased_root, cache=False)
+        _check(Catalog.open_store(CatalogStore.build(catalog, tmp_path / "c.sqlite3")))
+        _check(Catalog.open_packed(write_pack(catalog, tmp_path / "c.pack")))
+
+    def test_follows_reload(self, aliased_root: Path) -> None:
+        catalog = Catalog.load(aliased_root, cache=False)
+        path = aliased_root / "prompts" / "planning" / "test-prompt-2.yaml"
+        path.unlink()
+        new = catalog.reload([path])
+        assert new.lookup_prompt("arch-review") is None
+        assert catalog.lookup_prompt("arch-review") is not None
+
+    def test_similar_accepts_aliases(self, aliased_root: Path) -> None:
+        pytest.importorskip("numpy")
+        catalog = Catalog.load(aliased_root, cache=False)
+        assert [h.prompt.id for h in catalog.similar("old-prompt-2")] == ["test-prompt-1"]
+
+
+class TestNamesCli:
+    def test_show_deprecated_id(self, aliased_root: Path, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(aliased_root))
+        result = CliRunner().invoke(main, ["show", "old-prompt-2"])
+        assert result.exit_code == 0, result.output
+        assert "old-prompt-2 is deprecated; it is now test-prompt-2." in result.output
+        result = CliRunner().invoke(main, ["kit", "show", "TK"])
+        assert result.exit_code == 0, result.output
+        assert "test-kit" in result.output
+
+    def test_validate_reports_clashes(self, aliased_root: Path) -> None:
+        from prompt_catalog_mcp.validator import validate_prompts
+
+        issues = [i.message for i in validate_prompts(aliased_root).issues]
+        assert "Name 'test-prompt-1' already refers to test-prompt-1 (prompts/planning/test-prompt-1.yaml)" in issues
+
+
+@pytest.mark.skipif(not HAS_MCP, reason="mcp package not installed")
+class TestNamesServer:
+    def test_get_prompt_by_alias(self, aliased_root: Path, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(aliased_root))
+        import prompt_catalog_mcp.server as srv
+
+        importlib.reload(srv)
+        srv._catalog = None
+        result = asyncio.run(srv.get_prompt("ARCH-REVIEW", {"project_name": "Atlas"}))
+        assert result.messages[0].content.text == "Review the architecture for Atlas."
@@ -0,0 +1,143 @@
+"""Tests for the packed, memory-mapped catalog file."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import importlib.util
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from prompt_catalog_mcp.catalog import Catalog
+from prompt_catalog_mcp.cli import main
+from prompt_catalog_mcp.packed import (
+    PackedCatalogFile,
+    PackedPromptEntry,
+    default_pack_path,
+    write_pack,
+)
+
+HAS_MCP = importlib.util.find_spec("mcp") is not None
+
+
+@pytest.fixture
+def packed(catalog_root: Path) -> tuple[Catalog, Catalog]:
+    """The fixture catalog loaded from YAML and from a freshly written pack."""
+    catalog = Catalog.load(catalog_root, cache=False)
+    return catalog, Catalog.open_packed(write_pack(catalog))
+
+
+class TestPackedCatalog:
+    def test_default_path(self, catalog_root: Path, packed) -> None:
+        assert default_pack_path(catalog_root).is_file()
+
+    def test_round_trip(self, packed) -> None:
+        catalog, from_pack = packed
+        assert list(from_pack.prompts) == list(catalog.prompts)
+        assert list(from_pack.instructions) == list(catalog.instructions)
+        assert from_pack.starter_kits == catalog.starter_kits
+        assert from_pack.files == catalog.files
+        for pid, entry in catalog.prompts.items():
+            got = from_pack.prompts[pid]
+            assert isinstance(got, PackedPromptEntry)
+            for name in ("title", "tags", "variables", "chain_position", "file_path", "prompt_text"):
+                assert getattr(got, name) == getattr(entry, name)
+            assert got.raw == entry.raw
+
+    def test_bodies_stay_in_the_mapping(self, packed) -> None:
+        _, from_pack = packed
+        entry = from_pack.prompts["test-prompt-1"]
+        assert entry.render({"project_name": "Acme"}).startswith("Generate a plan for Acme")
+        with pytest.raises(AttributeError):
+            object.__getattribute__(entry, "prompt_text")  # decoded per read, never stored
+
+    def test_metadata_decoded_on_first_read(self, packed) -> None:
+        _, from_pack = packed
+        entry = from_pack.prompts["test-prompt-1"]
+        with pytest.raises(AttributeError):
+            object.__getattribute__(entry, "title")
+        assert entry.title == "Test Prompt"
+        assert object.__getattribute__(entry, "tags") == entry.tags
+
+    def test_prompt_sources_stay_in_the_mapping(self, catalog_root: Path, packed) -> None:
+        catalog, from_pack = packed
+        path = catalog_root / "prompts" / "planning" / "test-prompt-1.yaml"
+        source = catalog.prompts["test-prompt-1"].read_text()
+        path.unlink()
+        entry = from_pack.prompts["test-prompt-1"]
+        assert entry.read_text() == source
+        assert entry.raw["id"] == "test-prompt-1"
+
+    def test_instruction_bodies(self, packed) -> None:
+        catalog, from_pack = packed
+        for stem, entry in catalog.instructions.items():
+            assert from_pack.instructions[stem].read_text() == entry.read_text()
+            assert from_pack.instructions[stem].read_body() == entry.read_body()
+
+    def test_pack_is_independent_of_sources(self, catalog_root: Path, packed) -> None:
+        _, from_pack = packed
+        (catalog_root / "instructions" / "guardrails" / "test-guard.instructions.md").unlink()
+        assert "test guardrail" in from_pack.instructions["test-guard.instructions"].read_body()
+
+    def test_find_prompt(self, packed) -> None:
+        catalog, _ = packed
+        pack = PackedCatalogFile(default_pack_path(catalog.root))
+        try:
+            assert pack.find_prompt("test-prompt-2") == catalog.prompts["test-prompt-2"].prompt_text
+            assert pack.find_prompt("test-prompt-0") is None
+            assert pack.find_prompt("zzz") is None
+        finally:
+            pack.close()
+
+    def test_queries(self, packed) -> None:
+        catalog, from_pack = packed
+        assert [p.id for p in from_pack.filter_prompts(platform="web")] == [
+            p.id for p in catalog.filter_prompts(platform="web")
+        ]
+        prompts, _ = from_pack.resolve_kit("test-kit")
+        assert [p.id for p in prompts] == ["test-prompt-1", "test-prompt-2"]
+
+    def test_reload_replaces_packed_entries(self, catalog_root: Path, packed) -> None:
+        _, from_pack = packed
+        path = catalog_root / "prompts" / "planning" / "test-prompt-2.yaml"
+        path.unlink()
+        reloaded = from_pack.reload([path])
+        assert list(reloaded.prompts) == ["test-prompt-1"]
+
+    def test_rejects_other_files(self, tmp_path: Path) -> None:
+        bogus = tmp_path / "bogus.pack"
+        bogus.write_bytes(b"not a pack" * 10)
+        with pytest.raises(ValueError):
+            PackedCatalogFile(bogus)
+
+
+class TestCLIPack:
+    def test_pack_and_show(self, catalog_root: Path, tmp_path: Path) -> None:
+        runner = CliRunner()
+        env = {"CATALOG_ROOT": str(catalog_root)}
+        out = tmp_path / "catalog.pack"
+        result = runner.invoke(main, ["pack", "-o", str(out)], env=env)
+        assert result.exit_code == 0, result.output
+        assert out.is_file()
+
+        result = runner.invoke(main, ["--packed", str(out), "show", "test-prompt-1"], env=env)
+        assert result.exit_code == 0
+        assert "Test Prompt" in result.output
+
+
+@pytest.mark.skipif(not HAS_MCP, reason="mcp package not installed")
+class TestPackedServer:
+    def test_resources_served_from_the_pack(self, catalog_root: Path, packed, monkeypatch) -> None:
+        catalog, _ = packed
+        monkeypatch.setenv("CATALOG_ROOT", str(catalog_root))
+        monkeypatch.setenv("PROMPT_CATALOG_PACK", str(default_pack_path(catalog_root)))
+        import prompt_catalog_mcp.server as srv
+
+        importlib.reload(srv)
+        srv._catalog = None
+        source = catalog.prompts["test-prompt-1"].read_text()
+        (catalog_root / "prompts" / "planning" / "test-prompt-1.yaml").unlink()
+        text = asyncio.run(srv.read_resource("prompt-catalog://prompts/planning/test-prompt-1"))
+        assert text == source
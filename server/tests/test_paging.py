@@ -0,0 +1,137 @@
+"""Tests for streamed, cursor-paged listings."""
+
+from __future__ import annotations
+
+import json
+from itertools import islice
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from prompt_catalog_mcp.catalog import Catalog
+from prompt_catalog_mcp.cli import main
+from prompt_catalog_mcp.paging import decode_cursor, encode_cursor, hit_cursor, prompt_cursor
+from prompt_catalog_mcp.store import CatalogStore
+
+from .conftest import prompt_ids
+
+
+pytestmark = pytest.mark.synthetic(prompts=400, seed=11)
+
+
+def _pages(catalog: Catalog, size: int, **kwargs) -> list[list[str]]:
+    pages, cursor = [], None
+    while True:
+        page = list(islice(catalog.iter_prompts(cursor=cursor, **kwargs), size))
+        if not page:
+            return pages
+        pages.append(prompt_ids(page))
+        cursor = prompt_cursor(page[-1], kwargs.get("order", "id"))
+
+
+class TestCursors:
+    def test_round_trip(self) -> None:
+        cursor = encode_cursor("title", ("threat modeling", "SEC-THREAT-001"))
+        assert decode_cursor(cursor, "title") == ("threat modeling", "SEC-THREAT-001")
+
+    def test_rejects_bad_cursors(self) -> None:
+        with pytest.raises(ValueError, match="order 'id'"):
+            decode_cursor(encode_cursor("id", ("X",)), "title")
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor("not a cursor!", "id")
+        for order, key in [("relevance", ("high", "X")), ("relevance", (1.5,)), ("id", (3,)), ("title", ("a", None))]:
+            with pytest.raises(ValueError, match="Invalid cursor"):
+                decode_cursor(encode_cursor(order, key), order)
+
+
+class TestIterPrompts:
+    @pytest.mark.parametrize("order", ["id", "title"])
+    @pytest.mark.parametrize(
+        "filters",
+        [{}, {"category": "security"}, {"tag": "security", "skill_level": "advanced"},
+         {"platform": "web", "query": "cach"}],
+    )
+    def test_matches_sorted_filter(self, synthetic: Catalog, order: str, filters: dict) -> None:
+        keys = {"id": lambda p: (p.id,), "title": lambda p: (p.title.lower(), p.id)}
+        expected = prompt_ids(sorted(synthetic.filter_prompts(**filters), key=keys[order]))
+        assert prompt_ids(synthetic.iter_prompts(order=order, **filters)) == expected
+        assert synthetic.count_prompts(**filters) == len(expected)
+        assert sum(_pages(synthetic, 37, order=order, **filters), []) == expected
+
+    def test_yields_lazily(self, synthetic: Catalog) -> None:
+        stream = synthetic.iter_prompts()
+        assert next(stream).id == min(synthetic.prompts)
+
+    def test_cursor_survives_reload(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        first = next(catalog.iter_prompts())
+        assert first.id == "test-prompt-1"
+        path = catalog_root / "prompts" / "planning" / "test-prompt-1.yaml"
+        path.unlink()
+        new = catalog.reload([path])
+        assert prompt_ids(new.iter_prompts(cursor=prompt_cursor(first))) == ["test-prompt-2"]
+
+    def test_unknown_order(self, catalog_root: Path) -> None:
+        with pytest.raises(ValueError, match="Unknown order"):
+            Catalog.load(catalog_root, cache=False).iter_prompts(order="score")
+
+    def test_store_backed(self, synthetic: Catalog) -> None:
+        store = Catalog.open_store(CatalogStore.build(synthetic))
+        assert sum(_pages(store, 50, order="title", category="testing"), []) == sum(
+            _pages(synthetic, 50, order="title", category="testing"), []
+        )
+
+
+class TestIterSearch:
+    def test_pages_follow_ranking(self, synthetic: Catalog) -> None:
+        full = prompt_ids(h.prompt for h in synthetic.search_hits("security"))
+        seen, cursor = [], None
+        while page := list(islice(synthetic.iter_search("security", cursor), 25)):
+            seen += prompt_ids(h.prompt for h in page)
+            cursor = hit_cursor(page[-1])
+        assert seen == full
+
+
+class TestPagingCli:
+    def test_list_pages(self, synthetic: Catalog, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(synthetic.root))
+        runner = CliRunner()
+        result = runner.invoke(main, ["list", "-n", "5", "--offset", "2"])
+        assert result.exit_code == 0, result.output
+        ids = sorted(synthetic.prompts)
+        assert "(400 found)" in result.output
+        assert ids[2] in result.output and ids[6] in result.output and ids[7] not in result.output
+        cursor = result.output.split("--cursor ")[1].split()[0]
+        result = runner.invoke(main, ["list", "-n", "1", "--cursor", cursor])
+        assert ids[7] in result.output and ids[6] not in result.output
+
+    def test_list_json_streams_valid_json(self, synthetic: Catalog, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(synthetic.root))
+        result = CliRunner().invoke(main, ["list", "--json", "--order", "title"])
+        rows = json.loads(result.output)
+        assert len(rows) == 400
+        assert rows == sorted(rows, key=lambda r: (r["title"].lower(), r["id"]))
+        result = CliRunner().invoke(main, ["list", "--json", "--category", "nope"])
+        assert json.loads(result.output) == []
+
+    def test_search_cursor(self, synthetic: Catalog, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(synthetic.root))
+        runner = CliRunner()
+        ranked = prompt_ids(synthetic.search("security", limit=4))
+        result = runner.invoke(main, ["search", "security", "-n", "3"])
+        cursor = result.output.split("--cursor ")[1].split()[0]
+        result = runner.invoke(main, ["search", "security", "-n", "1", "--cursor", cursor])
+        assert result.exit_code == 0, result.output
+        assert ranked[3] in result.output and ranked[2] not in result.output
+        assert f"({len(synthetic.search('security'))} found)" in result.output
+
+        result = runner.invoke(main, ["search", "security", "--cursor", encode_cursor("relevance", ("x", "y"))])
+        assert result.exit_code == 1
+        assert "Invalid cursor" in result.output
+
+    def test_bad_cursor(self, catalog_root: Path, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(catalog_root))
+        result = CliRunner().invoke(main, ["list", "--cursor", "garbage"])
+        assert result.exit_code == 1
+        assert "Invalid cursor" in result.output
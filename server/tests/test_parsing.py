@@ -0,0 +1,137 @@
+"""Parity tests for the libyaml and pure-Python YAML backends."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from prompt_catalog_mcp import parsing
+from prompt_catalog_mcp.catalog import Catalog, iter_sources
+from prompt_catalog_mcp.validator import validate_all
+
+HAS_LIBYAML = getattr(yaml, "__with_libyaml__", False)
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+requires_libyaml = pytest.mark.skipif(not HAS_LIBYAML, reason="PyYAML built without libyaml")
+
+
+def _load_with(monkeypatch, loader: type, root: Path) -> Catalog:
+    monkeypatch.setattr(parsing, "SafeLoader", loader)
+    return Catalog.load(root, cache=False)
+
+
+class TestBackend:
+    def test_backend_reported(self) -> None:
+        assert parsing.YAML_BACKEND == ("libyaml" if HAS_LIBYAML else "python")
+
+    def test_load_yaml(self) -> None:
+        assert parsing.load_yaml("id: x\ntags: [a, b]\n") == {"id": "x", "tags": ["a", "b"]}
+
+    def test_version_reports_backend(self) -> None:
+        from click.testing import CliRunner
+        from prompt_catalog_mcp.cli import main
+
+        result = CliRunner().invoke(main, ["--version"])
+        assert result.exit_code == 0
+        assert f"YAML backend: {parsing.YAML_BACKEND}" in result.output
+
+
+@requires_libyaml
+class TestBackendParity:
+    def test_every_repo_source_parses_identically(self) -> None:
+        for kind, _, path in iter_sources(REPO_ROOT):
+            if kind == "instruction":
+                continue
+            text = path.read_text(encoding="utf-8")
+            assert parsing.load_yaml(text, yaml.CSafeLoader) == parsing.load_yaml(
+                text, yaml.SafeLoader
+            ), path
+
+    @pytest.mark.parametrize("root", ["fixture", "repo"])
+    def test_catalogs_identical(self, root: str, catalog_root: Path, monkeypatch) -> None:
+        path = catalog_root if root == "fixture" else REPO_ROOT
+        fast = _load_with(monkeypatch, yaml.CSafeLoader, path)
+        slow = _load_with(monkeypatch, yaml.SafeLoader, path)
+        assert fast.prompts == slow.prompts
+        assert fast.instructions == slow.instructions
+        assert fast.starter_kits == slow.starter_kits
+
+    def test_validation_identical(self, catalog_root: Path, monkeypatch) -> None:
+        (catalog_root / "prompts" / "planning" / "bad.yaml").write_text("id: bad\n  broken: x")
+
+        def summary(loader: type) -> dict:
+            monkeypatch.setattr(parsing, "SafeLoader", loader)
+            return {
+                cat: (r.files_checked, r.files_passed, r.error_count, r.warning_count)
+                for cat, r in validate_all(catalog_root).items()
+            }
+
+        assert summary(yaml.CSafeLoader) == summary(yaml.SafeLoader)
+
+
+INSTRUCTION = """\
+---
+name: Guard
+description: A guardrail
+---
+
+<!-- Catalog Metadata
+id: INST-GUARD-009
+version: 1.2.0
+scope: guardrail
+priority: high
+load_with: INST-GUARD-001, INST-GUARD-002
+-->
+
+# Guard
+
+Body text.
+"""
+
+
+class TestMarkdownHead:
+    def test_reads_frontmatter_and_metadata(self, tmp_path: Path) -> None:
+        path = tmp_path / "guard.instructions.md"
+        path.write_text(INSTRUCTION, encoding="utf-8")
+        head = parsing.read_markdown_head(path)
+        assert head.frontmatter == {"name": "Guard", "description": "A guardrail"}
+        assert head.metadata["id"] == "INST-GUARD-009"
+        assert head.metadata["load_with"] == "INST-GUARD-001, INST-GUARD-002"
+        assert parsing.read_body(path, head.body_offset) == "\n# Guard\n\nBody text.\n"
+
+    def test_does_not_read_body(self, tmp_path: Path, monkeypatch) -> None:
+        path = tmp_path / "guard.instructions.md"
+        path.write_text(INSTRUCTION + "x" * 1_000_000, encoding="utf-8")
+        monkeypatch.setattr(Path, "read_text", lambda *a, **k: pytest.fail("read whole file"))
+        head = parsing.read_markdown_head(path)
+        assert head.body_offset < 400
+
+    def test_without_metadata(self, tmp_path: Path) -> None:
+        path = tmp_path / "plain.instructions.md"
+        path.write_text("---\nname: Plain\n---\n# Body\n", encoding="utf-8")
+        head = parsing.read_markdown_head(path)
+        assert head.metadata == {}
+        assert parsing.read_body(path, head.body_offset) == "# Body\n"
+
+    def test_missing_and_empty_frontmatter(self, tmp_path: Path) -> None:
+        missing = tmp_path / "missing.md"
+        missing.write_text("# No frontmatter\n", encoding="utf-8")
+        empty = tmp_path / "empty.md"
+        empty.write_text("---\n---\n# Body\n", encoding="utf-8")
+        assert parsing.read_markdown_head(missing).frontmatter is None
+        assert parsing.read_markdown_head(empty).frontmatter == {}
+
+    def test_unterminated_frontmatter(self, tmp_path: Path) -> None:
+        path = tmp_path / "open.md"
+        path.write_text("---\nname: Open\n# Body\n", encoding="utf-8")
+        with pytest.raises(ValueError):
+            parsing.read_markdown_head(path)
+
+    def test_body_has_content(self, tmp_path: Path) -> None:
+        path = tmp_path / "short.md"
+        path.write_text("---\nname: S\n---\n\n   short body   \n\n", encoding="utf-8")
+        offset = parsing.read_markdown_head(path).body_offset
+        assert parsing.body_has_content(path, offset, 10)
+        assert not parsing.body_has_content(path, offset, 50)
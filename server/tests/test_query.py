@@ -0,0 +1,177 @@
+"""Tests for the boolean query language."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import importlib.util
+import re
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from prompt_catalog_mcp.catalog import SKILL_ORDER, Catalog, PromptEntry
+from prompt_catalog_mcp.cli import main
+from prompt_catalog_mcp.query import (
+    And,
+    Facet,
+    Not,
+    Or,
+    QueryEngine,
+    QuerySyntaxError,
+    Skill,
+    Text,
+    parse,
+)
+from prompt_catalog_mcp.search import FIELD_BOOSTS, _field_text, tokenize
+
+HAS_MCP = importlib.util.find_spec("mcp") is not None
+pytestmark = pytest.mark.synthetic(prompts=300, seed=12)
+
+
+def _engine(catalog: Catalog) -> QueryEngine:
+    return QueryEngine(catalog.facet_index(), catalog.search_index())
+
+
+def _matches(node, p: PromptEntry) -> bool:
+    """Reference evaluation of ``node`` against one prompt."""
+    if isinstance(node, And):
+        return all(_matches(c, p) for c in node.children)
+    if isinstance(node, Or):
+        return any(_matches(c, p) for c in node.children)
+    if isinstance(node, Not):
+        return not _matches(node.child, p)
+    if isinstance(node, Facet):
+        if node.field == "platform":
+            return node.value in p.platforms or "all" in p.platforms
+        value = getattr(p, "tags" if node.field == "tag" else node.field)
+        return node.value in value if isinstance(value, list) else node.value == value
+    if isinstance(node, Skill):
+        if p.skill_level not in SKILL_ORDER:
+            return False
+        a, b = SKILL_ORDER.index(p.skill_level), SKILL_ORDER.index(node.level)
+        return {"<=": a <= b, "<": a < b, ">=": a >= b, ">": a > b, "=": a == b, ":": a == b}[node.op]
+    fields = [tokenize(_field_text(p, name)) for name in FIELD_BOOSTS]
+    words = {w for f in fields for w in f}
+    for i, term in enumerate(node.terms):
+        if node.prefix and i == len(node.terms) - 1 and len(term) >= 3:
+            if not any(w.startswith(term) for w in words):
+                return False
+        elif term not in words:
+            return False
+    if node.phrase:
+        needle = f" {' '.join(node.terms)} "
+        return any(needle in f" {' '.join(f)} " for f in fields)
+    return True
+
+
+class TestParse:
+    def test_precedence(self) -> None:
+        node = parse("tag:a OR NOT tag:b category:c")
+        assert node == Or((Facet("tag", "a"), And((Not(Facet("tag", "b")), Facet("category", "c")))))
+
+    def test_terms(self) -> None:
+        assert parse('skill<=advanced "Load  test" threat-mod') == And((
+            Skill("<=", "advanced"),
+            Text(("load", "test"), phrase=True),
+            Text(("threat", "mod"), prefix=True),
+        ))
+        # Lower-case operators are ordinary words; only the last word is a prefix.
+        assert parse("plan and or") == And((Text(("plan",)), Text(("and",)), Text(("or",), prefix=True)))
+        assert parse('"x" --') == Text(("x",))
+        assert parse("--") is None
+
+    def test_round_trips_through_str(self) -> None:
+        for text in ['category:testing AND (platform:web OR platform:cloud) AND NOT tag:legacy',
+                     'skill>expert OR "load test" OR tag:"two words"']:
+            node = parse(text)
+            assert parse(str(node)) == node
+
+    @pytest.mark.parametrize(
+        "text, message",
+        [('"load test', "Unterminated quote"), ("(tag:a", "Expected ')'"), ("tag:a)", "Unexpected ')'"),
+         ("foo:bar", "Unknown field 'foo'"), ("skill<=guru", "Unknown skill level"),
+         ("tag<=x", "Only skill"), ("NOT", "Expected a term"), ("NOT --", "NOT needs a term"),
+         ("OR tag:a", "Unexpected 'OR'")],
+    )
+    def test_errors(self, text: str, message: str) -> None:
+        with pytest.raises(QuerySyntaxError, match=re.escape(message)):
+            parse(text)
+
+
+class TestEngine:
+    @pytest.mark.parametrize(
+        "text",
+        ["security", "category:testing AND (platform:web OR platform:cloud) AND NOT tag:legacy",
+         "skill<=intermediate tag:api NOT platform:ios", "skill>advanced OR category:planning",
+         "skill=beginner platform:windows", 'NOT "experienced engineer"', "tag:security tag:api perf",
+         "NOT (category:domains OR tag:security)", "platform:cross-platform OR platform:nonexistent"],
+    )
+    def test_agrees_with_reference(self, synthetic: Catalog, text: str) -> None:
+        plan = synthetic.query_plan(text)
+        expected = {p.id for p in synthetic.prompts.values() if _matches(parse(text), p)}
+        assert {h.prompt.id for h in plan.hits} == expected
+        assert plan.total == len(expected)
+
+    def test_plain_words_match_search(self, synthetic: Catalog) -> None:
+        for text in ["security", "security cach", "api perf"]:
+            expected = [(h.prompt.id, h.score) for h in synthetic.search_hits(text, 10)]
+            assert [(h.prompt.id, pytest.approx(h.score)) for h in synthetic.query(text, 10)] == expected
+
+    def test_orders_and_operands(self, synthetic: Catalog) -> None:
+        engine = _engine(synthetic)
+        node = engine.optimize(parse("NOT tag:api category:domains tag:compliance (tag:a OR tag:b)"))
+        assert isinstance(node, And)
+        assert isinstance(node.children[-1], Not)
+        sizes = [engine.estimate(c) for c in node.children[:-1]]
+        assert sizes == sorted(sizes)
+
+    def test_short_circuits(self, synthetic: Catalog) -> None:
+        plan = synthetic.query_plan("tag:no-such-tag AND security AND NOT category:domains")
+        assert plan.total == 0
+        explained = plan.explain()
+        assert "tag:no-such-tag  est=0  actual=0" in explained
+        assert "  security  est=261  actual=skipped" in explained
+
+    def test_phrases_need_adjacent_words(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        assert [h.prompt.id for h in catalog.query('"the architecture"')] == ["test-prompt-2"]
+        assert catalog.query('"architecture the"') == []
+
+    def test_cache_shares_equivalent_queries(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        cache = catalog.enable_query_cache()
+        catalog.query("tag:test  planning")
+        catalog.query("tag:test AND planning")
+        assert (cache.hits, cache.misses) == (1, 1)
+
+
+class TestQueryCli:
+    def test_search_explain(self, synthetic: Catalog, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(synthetic.root))
+        result = CliRunner().invoke(main, ["search", "category:testing platform:web", "--explain"])
+        assert result.exit_code == 0, result.output
+        assert "AND (2 operands)" in result.output
+        assert "actual=" in result.output
+        assert "Search results" in result.output
+
+    def test_syntax_error(self, catalog_root: Path, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(catalog_root))
+        result = CliRunner().invoke(main, ["search", "category:planning AND ("])
+        assert result.exit_code == 1
+        assert "Expected a term" in result.output
+
+
+@pytest.mark.skipif(not HAS_MCP, reason="mcp package not installed")
+class TestQueryServer:
+    def test_search_tool(self, catalog_root: Path, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(catalog_root))
+        import prompt_catalog_mcp.server as srv
+
+        importlib.reload(srv)
+        srv._catalog = None
+        result = asyncio.run(srv.call_tool("search", {"query": "tag:test NOT skill>beginner", "explain": True}))
+        assert result["total"] == 1
+        assert [p["id"] for p in result["prompts"]] == ["test-prompt-1"]
+        assert "skill>beginner" in result["plan"]
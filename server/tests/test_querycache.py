@@ -0,0 +1,129 @@
+"""Tests for the generation-aware query result cache."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from prompt_catalog_mcp.catalog import Catalog
+from prompt_catalog_mcp.querycache import QueryCache, approx_size
+
+HAS_MCP = importlib.util.find_spec("mcp") is not None
+
+
+def _ids(entries) -> list[str]:
+    return [p.id for p in entries]
+
+
+class TestQueryCache:
+    def test_counts_hits_and_misses(self) -> None:
+        cache = QueryCache()
+        calls = []
+        for _ in range(3):
+            assert cache.get_or_compute(0, "k", lambda: calls.append(1) or [1, 2]) == [1, 2]
+        assert len(calls) == 1
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 1)
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = QueryCache(max_entries=2)
+        cache.get_or_compute(0, "a", lambda: [1])
+        cache.get_or_compute(0, "b", lambda: [2])
+        cache.get_or_compute(0, "a", lambda: [1])  # "b" is now the oldest
+        cache.get_or_compute(0, "c", lambda: [3])
+        assert cache.evictions == 1
+        cache.get_or_compute(0, "a", lambda: [1])
+        assert cache.hits == 2
+        cache.get_or_compute(0, "b", lambda: [2])
+        assert cache.misses == 4
+
+    def test_byte_budget(self) -> None:
+        value = list(range(100))
+        cache = QueryCache(max_bytes=approx_size(value) * 2)
+        for key in "abc":
+            cache.get_or_compute(0, key, lambda: list(range(100)))
+        assert len(cache) == 2
+        assert cache.bytes <= cache.max_bytes
+        assert cache.evictions == 1
+        # Results larger than the whole budget are returned but not kept.
+        big = cache.get_or_compute(0, "big", lambda: list(range(10_000)))
+        assert len(big) == 10_000
+        assert "big" not in cache._entries
+
+    def test_newer_generation_invalidates(self) -> None:
+        cache = QueryCache()
+        cache.get_or_compute(0, "k", lambda: "old")
+        assert cache.get_or_compute(1, "k", lambda: "new") == "new"
+        assert cache.invalidations == 1
+        # A call still running on the old generation neither reads nor stores.
+        assert cache.get_or_compute(0, "k", lambda: "stale") == "stale"
+        assert cache.get_or_compute(1, "k", lambda: "unused") == "new"
+
+
+class TestCatalogQueryCache:
+    def test_results_match_uncached(self, catalog_root: Path) -> None:
+        plain = Catalog.load(catalog_root, cache=False)
+        cached = Catalog.load(catalog_root, cache=False)
+        cached.enable_query_cache()
+        for _ in range(2):
+            assert _ids(cached.filter_prompts(tag="planning")) == _ids(plain.filter_prompts(tag="planning"))
+            assert _ids(cached.search("architect")) == _ids(plain.search("architect"))
+            assert cached.suggest("test-promt-1") == plain.suggest("test-promt-1")
+            assert cached.facets(tag="test").counts == plain.facets(tag="test").counts
+        assert cached.query_cache.hits == 4
+
+    def test_equivalent_queries_share_entries(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        cache = catalog.enable_query_cache()
+        catalog.facets(tag=["test", "planning"], platform="web")
+        catalog.facets(tag=["planning", "test"], platform=["web"])
+        catalog.search("Architecture  review")
+        catalog.search("architecture, REVIEW")
+        catalog.filter_prompts(query="Architecture")
+        catalog.filter_prompts(query="architecture")
+        assert (cache.hits, cache.misses) == (3, 3)
+
+    def test_callers_cannot_corrupt_entries(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        catalog.enable_query_cache()
+        catalog.filter_prompts().clear()
+        assert len(catalog.filter_prompts()) == 2
+
+    def test_reload_invalidates(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        cache = catalog.enable_query_cache()
+        assert _ids(catalog.search("architecture")) == ["test-prompt-2"]
+        path = catalog_root / "prompts" / "planning" / "test-prompt-2.yaml"
+        path.unlink()
+        new = catalog.reload([path])
+        assert new.query_cache is cache
+        assert new.search("architecture") == []
+        assert cache.invalidations == 1
+        # The old generation still answers from its own indexes.
+        assert _ids(catalog.search("architecture")) == ["test-prompt-2"]
+
+
+@pytest.mark.skipif(not HAS_MCP, reason="mcp package not installed")
+class TestQueryCacheServer:
+    @pytest.fixture
+    def srv(self, catalog_root: Path, monkeypatch):
+        monkeypatch.setenv("CATALOG_ROOT", str(catalog_root))
+        monkeypatch.setenv("PROMPT_CATALOG_QUERY_CACHE", "16")
+        import prompt_catalog_mcp.server as srv
+
+        importlib.reload(srv)
+        srv._catalog = None
+        return srv
+
+    def test_stats_tool(self, srv) -> None:
+        for _ in range(3):
+            asyncio.run(srv.call_tool("suggest", {"name": "test-promt-2"}))
+        stats = asyncio.run(srv.call_tool("catalog_stats", {}))
+        assert stats["prompts"] == 2
+        cache = stats["query_cache"]
+        assert (cache["hits"], cache["misses"], cache["max_entries"]) == (2, 1, 16)
@@ -0,0 +1,110 @@
+"""Tests for the rendered prompt cache."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from prompt_catalog_mcp.catalog import Catalog
+from prompt_catalog_mcp.rendercache import RenderCache, render_key, rendered_size
+from prompt_catalog_mcp.template import MissingArgumentsError
+
+HAS_MCP = importlib.util.find_spec("mcp") is not None
+
+
+class TestRenderKey:
+    def test_canonical_arguments(self, catalog_root: Path) -> None:
+        entry = Catalog.load(catalog_root, cache=False).prompts["test-prompt-1"]
+        key = render_key("text", entry, {"project_name": "A", "methodology": "B"})
+        assert render_key("text", entry, {"unused": "x", "methodology": "B", "project_name": "A"}) == key
+        assert render_key("text", entry, {"project_name": "A"}) != key
+        assert render_key("other", entry, {"project_name": "A", "methodology": "B"}) != key
+        assert render_key("text", entry, None) == render_key("text", entry, {"unused": "x"})
+
+    def test_version_and_body(self, catalog_root: Path) -> None:
+        entry = Catalog.load(catalog_root, cache=False).prompts["test-prompt-1"]
+        key = render_key("text", entry, None)
+        # A digest of the body, not the per-process salted hash().
+        assert hashlib.sha256(entry.prompt_text.encode("utf-8")).hexdigest() in key
+        entry.version = "9.9.9"
+        assert render_key("text", entry, None) != key
+        edited = Catalog.load(catalog_root, cache=False).prompts["test-prompt-1"]
+        edited.prompt_text += " Be brief."
+        assert render_key("text", edited, None) != key
+
+
+class TestRenderCache:
+    def test_byte_budget_counts_text(self) -> None:
+        text = "x" * 10_000
+        assert rendered_size(text) > 10_000
+        cache = RenderCache(max_bytes=25_000)
+        for key in "abc":
+            cache.get_or_compute(0, key, lambda: "x" * 10_000)
+        assert (len(cache), cache.evictions) == (2, 1)
+        assert cache.bytes <= cache.max_bytes
+
+
+class TestCatalogRenderCache:
+    def test_hits_match_uncached(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        cache = catalog.enable_render_cache()
+        entry = catalog.prompts["test-prompt-1"]
+        for arguments in [{"project_name": "Acme"}, {"project_name": "Acme", "x": "y"}, None, None]:
+            assert catalog.render(entry, arguments) == entry.render(arguments)
+        assert (cache.hits, cache.misses) == (2, 2)
+        assert cache.stats()["hit_rate"] == pytest.approx(0.5)
+
+    def test_check_required_before_lookup(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        catalog.enable_render_cache()
+        entry = catalog.prompts["test-prompt-1"]
+        entry.variables = [{"name": "project_name", "required": True}]
+        catalog.render(entry, None)
+        with pytest.raises(MissingArgumentsError):
+            catalog.render(entry, None, check_required=True)
+
+    def test_reload_invalidates(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        cache = catalog.enable_render_cache()
+        assert catalog.render(catalog.prompts["test-prompt-2"]).startswith("Review the architecture")
+        path = catalog_root / "prompts" / "planning" / "test-prompt-2.yaml"
+        path.write_text(path.read_text().replace("Review the architecture", "Audit the design"))
+        new = catalog.reload([path])
+        assert new.render_cache is cache
+        assert new.render(new.prompts["test-prompt-2"]).startswith("Audit the design")
+        assert cache.invalidations == 1
+
+    def test_disabled(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        calls = []
+        for _ in range(2):
+            catalog.rendered(catalog.prompts["test-prompt-1"], None, "k", lambda: calls.append(1))
+        assert len(calls) == 2
+
+
+@pytest.mark.skipif(not HAS_MCP, reason="mcp package not installed")
+class TestRenderCacheServer:
+    @pytest.fixture
+    def srv(self, catalog_root: Path, monkeypatch):
+        monkeypatch.setenv("CATALOG_ROOT", str(catalog_root))
+        monkeypatch.setenv("PROMPT_CATALOG_RENDER_CACHE", "8")
+        import prompt_catalog_mcp.server as srv
+
+        importlib.reload(srv)
+        srv._catalog = None
+        return srv
+
+    def test_get_prompt_reuses_result(self, srv) -> None:
+        first = asyncio.run(srv.get_prompt("test-prompt-2", {"project_name": "Atlas"}))
+        again = asyncio.run(srv.get_prompt("TEST-PROMPT-2", {"project_name": "Atlas"}))
+        other = asyncio.run(srv.get_prompt("test-prompt-2", {"project_name": "Zeus"}))
+        assert again is first
+        assert other.messages[0].content.text == "Review the architecture for Zeus."
+        stats = asyncio.run(srv.call_tool("catalog_stats", {}))["render_cache"]
+        assert (stats["hits"], stats["misses"], stats["max_entries"]) == (1, 2, 8)
+        assert stats["bytes"] > 0
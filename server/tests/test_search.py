@@ -0,0 +1,83 @@
+"""Tests for BM25 full-text search."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from prompt_catalog_mcp.catalog import Catalog
+from prompt_catalog_mcp.cli import main
+from prompt_catalog_mcp.search import SearchIndex, tokenize
+
+from .conftest import prompt_ids
+
+
+pytestmark = pytest.mark.synthetic(prompts=300, seed=4)
+
+
+class TestTokenize:
+    def test_lowercases_and_splits(self) -> None:
+        assert tokenize("STRIDE-based Threat_Model, v2") == ["stride", "based", "threat", "model", "v2"]
+
+
+class TestSearchIndex:
+    def test_searches_body(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        # "architecture" only appears in test-prompt-2's body.
+        assert prompt_ids(catalog.search("architecture")) == ["test-prompt-2"]
+
+    def test_all_terms_required(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        assert prompt_ids(catalog.search("review project")) == ["test-prompt-2"]
+        assert catalog.search("review zzzz") == []
+        assert catalog.search("  --  ") == []
+
+    def test_last_term_is_prefix(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        assert prompt_ids(catalog.search("architect")) == ["test-prompt-2"]
+        # Earlier terms and short prefixes match whole terms only.
+        assert catalog.search("architect review") == []
+        assert catalog.search("ar") == []
+
+    def test_top_k_matches_full_ranking(self, synthetic: Catalog) -> None:
+        full = synthetic.search_hits("security")
+        assert len(full) > 10
+        scores = [h.score for h in full]
+        assert scores == sorted(scores, reverse=True)
+        top = synthetic.search_hits("security", limit=10)
+        assert [(h.prompt.id, h.score) for h in top] == [(h.prompt.id, h.score) for h in full[:10]]
+
+    def test_every_hit_contains_every_term(self, synthetic: Catalog) -> None:
+        index = synthetic.search_index()
+        hits = synthetic.search_hits("security cach")
+        assert hits
+        for hit in hits:
+            text = " ".join(
+                [hit.prompt.id, hit.prompt.title, hit.prompt.description, " ".join(hit.prompt.tags),
+                 hit.prompt.prompt_text, " ".join(hit.prompt.quality_criteria),
+                 " ".join(hit.prompt.anti_patterns)]
+            )
+            tokens = set(tokenize(text))
+            assert "security" in tokens
+            assert any(t.startswith("cach") for t in tokens)
+        assert isinstance(index, SearchIndex)
+
+    def test_index_follows_reload(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        assert catalog.search("architecture")
+        path = catalog_root / "prompts" / "planning" / "test-prompt-2.yaml"
+        path.unlink()
+        assert catalog.reload([path]).search("architecture") == []
+
+
+class TestSearchCli:
+    def test_scores_and_limit(self, synthetic: Catalog, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(synthetic.root))
+        result = CliRunner().invoke(main, ["search", "security", "-n", "3"])
+        assert result.exit_code == 0, result.output
+        assert f"({len(synthetic.search('security'))} found)" in result.output
+        assert "Score" in result.output
+        best = synthetic.search("security", limit=1)[0]
+        assert best.id in result.output
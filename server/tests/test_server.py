@@ -36,3 +36,58 @@ class TestMCPServer:
         srv._catalog = None
         catalog = srv._get_catalog()
         assert len(catalog.prompts) == 2
+
+    def test_reload_swaps_generation(self, catalog_root: Path) -> None:
+        """A reload publishes a new catalog and leaves the old one intact."""
+        import importlib
+        import prompt_catalog_mcp.server as srv
+        importlib.reload(srv)
+        srv._catalog = None
+        old = srv._get_catalog()
+
+        path = catalog_root / "prompts" / "planning" / "test-prompt-2.yaml"
+        path.unlink()
+        new = srv._reload_catalog({path})
+
+        assert srv._get_catalog() is new
+        assert new.generation == old.generation + 1
+        assert "test-prompt-2" not in new.prompts
+        assert "test-prompt-2" in old.prompts
+
+    def test_watch_rejects_store_and_pack(self, tmp_path: Path, monkeypatch) -> None:
+        """A store or pack is a snapshot; watching its sources would drop it."""
+        import importlib
+        import prompt_catalog_mcp.server as srv
+
+        monkeypatch.setenv("PROMPT_CATALOG_WATCH", "1")
+        monkeypatch.setenv("PROMPT_CATALOG_PACK", str(tmp_path / "catalog.pack"))
+        importlib.reload(srv)
+        try:
+            with pytest.raises(SystemExit, match="cannot be combined"):
+                srv.main()
+        finally:
+            monkeypatch.undo()
+            importlib.reload(srv)
+
+    def test_watcher_reloads_in_background(self, catalog_root: Path) -> None:
+        """The background watch task picks up edits without a restart."""
+        import asyncio
+        import importlib
+        import prompt_catalog_mcp.server as srv
+        importlib.reload(srv)
+        srv._catalog = None
+        srv._get_catalog()
+
+        async def edit_and_wait():
+            task = asyncio.create_task(srv._watch_catalog(interval=0.01))
+            await asyncio.sleep(0.05)
+            path = catalog_root / "prompts" / "planning" / "test-prompt-1.yaml"
+            path.write_text(path.read_text().replace("title: Test Prompt", "title: Live Edit"))
+            for _ in range(200):
+                await asyncio.sleep(0.01)
+                if srv._get_catalog().generation:
+                    break
+            task.cancel()
+
+        asyncio.run(edit_and_wait())
+        assert srv._get_catalog().prompts["test-prompt-1"].title == "Live Edit"
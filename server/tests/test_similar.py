@@ -0,0 +1,81 @@
+"""Tests for TF-IDF "similar prompt" search."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import importlib.util
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+np = pytest.importorskip("numpy")
+
+from prompt_catalog_mcp.catalog import Catalog  # noqa: E402
+from prompt_catalog_mcp.cli import main  # noqa: E402
+from prompt_catalog_mcp.similar import SimilarityIndex  # noqa: E402
+
+from .conftest import prompt_ids
+
+HAS_MCP = importlib.util.find_spec("mcp") is not None
+pytestmark = pytest.mark.synthetic(prompts=300, seed=6)
+
+
+class TestSimilarityIndex:
+    def test_matrix_layout(self, synthetic: Catalog) -> None:
+        index = synthetic.similarity_index()
+        assert isinstance(index, SimilarityIndex)
+        assert index.matrix.dtype == np.float32
+        assert index.matrix.flags["C_CONTIGUOUS"]
+        assert index.matrix.shape == (len(synthetic.prompts), index.dim)
+        assert np.allclose(np.linalg.norm(index.matrix, axis=1), 1.0, atol=1e-5)
+
+    def test_by_prompt_id_excludes_itself(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        assert prompt_ids(catalog.similar("TEST-PROMPT-1")) == ["test-prompt-2"]
+
+    def test_matches_word_forms(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        # Neither word appears verbatim; "architecture" and "review" do.
+        assert prompt_ids(catalog.similar("architectural reviewing"))[0] == "test-prompt-2"
+        assert catalog.similar("zzzz qqqq") == []
+
+    def test_top_k_matches_full_ranking(self, synthetic: Catalog) -> None:
+        index = synthetic.similarity_index()
+        query = "security caching for services"
+        scores = index.matrix @ index.vector(query)
+        order = sorted(range(len(scores)), key=lambda i: (-scores[i], i))[:10]
+        hits = synthetic.similar(query, limit=10)
+        assert prompt_ids(hits) == [index.prompts[i].id for i in order]
+        assert [h.score for h in hits] == sorted((h.score for h in hits), reverse=True)
+
+    def test_index_follows_reload(self, catalog_root: Path) -> None:
+        catalog = Catalog.load(catalog_root, cache=False)
+        assert catalog.similar("test-prompt-1")
+        path = catalog_root / "prompts" / "planning" / "test-prompt-2.yaml"
+        path.unlink()
+        assert catalog.reload([path]).similar("test-prompt-1") == []
+
+
+class TestSimilarCli:
+    def test_similar_command(self, catalog_root: Path, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(catalog_root))
+        result = CliRunner().invoke(main, ["similar", "test-prompt-2"])
+        assert result.exit_code == 0, result.output
+        assert "test-prompt-1" in result.output
+        assert "Similarity" in result.output
+
+
+@pytest.mark.skipif(not HAS_MCP, reason="mcp package not installed")
+class TestSimilarServer:
+    def test_similar_tool(self, catalog_root: Path, monkeypatch) -> None:
+        monkeypatch.setenv("CATALOG_ROOT", str(catalog_root))
+        import prompt_catalog_mcp.server as srv
+
+        importlib.reload(srv)
+        srv._catalog = None
+        assert "similar" in [t.name for t in asyncio.run(srv.list_tools())]
+        result = asyncio.run(srv.call_tool("similar", {"query": "test-prompt-1"}))
+        assert [p["id"] for p in result["prompts"]] == ["test-prompt-2"]
+        assert 0 < result["prompts"][0]["score"] <= 1
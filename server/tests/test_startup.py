@@ -0,0 +1,108 @@
+"""Startup regression tests: heavy modules stay out of fast CLI paths.
+
+Each command runs in a fresh interpreter under ``-X importtime``; the
+report names every module imported, so these tests fail as soon as a
+top-level import drags ``rich``, PyYAML or the MCP stack back in.
+``benchmarks/bench_startup.py`` reports the wall-clock numbers.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+CLI = [sys.executable, "-X", "importtime", "-c", "from prompt_catalog_mcp.cli import main; main()"]
+SERVER_DIR = Path(__file__).resolve().parents[1]
+
+# Cumulative import time allowed for prompt_catalog_mcp.cli (click included).
+CLI_IMPORT_BUDGET_US = 150_000
+# Wall time allowed from spawning ``serve`` to its initialize response.
+SERVE_HANDSHAKE_BUDGET_S = 10.0
+
+HEAVY = ("rich", "yaml", "mcp", "pydantic")
+
+
+def _imports(stderr: str) -> dict[str, int]:
+    """Module name → cumulative microseconds, from ``-X importtime`` output."""
+    out = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.split("|")
+        try:
+            out[parts[2].strip()] = int(parts[1])
+        except (IndexError, ValueError):
+            continue  # header line
+    return out
+
+
+def _heavy(imports: dict[str, int], allowed: tuple[str, ...] = ()) -> list[str]:
+    return sorted(
+        m for m in imports if m.split(".")[0] in HEAVY and m.split(".")[0] not in allowed
+    )
+
+
+@pytest.fixture
+def env(catalog_root: Path) -> dict:
+    pythonpath = os.pathsep.join(filter(None, [str(SERVER_DIR), os.environ.get("PYTHONPATH")]))
+    return {**os.environ, "CATALOG_ROOT": str(catalog_root), "PYTHONPATH": pythonpath}
+
+
+def _run(args: list[str], env: dict) -> dict[str, int]:
+    proc = subprocess.run(CLI + args, env=env, capture_output=True, text=True, timeout=60)
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    return _imports(proc.stderr)
+
+
+class TestStartup:
+    def test_help(self, env) -> None:
+        imports = _run(["--help"], env)
+        assert _heavy(imports) == []
+        assert "prompt_catalog_mcp.catalog" not in imports
+        assert imports["prompt_catalog_mcp.cli"] <= CLI_IMPORT_BUDGET_US
+
+    def test_list_json(self, env) -> None:
+        # The first run parses YAML and writes the snapshot...
+        assert "yaml" in _run(["list", "--json"], env)
+        # ...after which listing needs neither YAML nor rich.
+        imports = _run(["list", "--json"], env)
+        assert _heavy(imports) == []
+
+    def test_serve_handshake(self, env) -> None:
+        request = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {},
+                "clientInfo": {"name": "test_startup", "version": "0"},
+            },
+        }
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            CLI + ["serve"], env=env, text=True,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        )
+        try:
+            proc.stdin.write(json.dumps(request) + "\n")
+            proc.stdin.flush()
+            response = json.loads(proc.stdout.readline())
+            elapsed = time.perf_counter() - start
+            proc.stdin.close()
+            stderr = proc.stderr.read()
+            proc.wait(timeout=30)
+        finally:
+            proc.kill()
+
+        assert response["id"] == 1
+        assert response["result"]["serverInfo"]["name"] == "prompt-catalog"
+        assert elapsed <= SERVE_HANDSHAKE_BUDGET_S
+        # The catalog (and PyYAML with it) loads on the first request, not before.
+        assert "yaml" not in _imports(stderr)
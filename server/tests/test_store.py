@@ -0,0 +1,183 @@
+"""Tests for the SQLite catalog store."""
+
+from __future__ import annotations
+
+import itertools
+import sqlite3
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from prompt_catalog_mcp.catalog import Catalog
+from prompt_catalog_mcp.cli import main
+from prompt_catalog_mcp.store import CatalogStore, default_store_path, fts5_available
+
+from .conftest import prompt_ids
+
+
+@pytest.fixture
+def stored(catalog_root: Path) -> tuple[Catalog, Catalog]:
+    """The fixture catalog loaded from YAML and from a freshly built store."""
+    catalog = Catalog.load(catalog_root, cache=False)
+    path = CatalogStore.build(catalog)
+    return catalog, Catalog.open_store(path)
+
+
+pytestmark = pytest.mark.synthetic(prompts=300, kits=5, instructions=6, seed=3)
+
+
+@pytest.fixture(scope="module")
+def synthetic_stored(synthetic: Catalog) -> tuple[Catalog, Catalog]:
+    """The synthetic catalog and the same catalog opened from a store."""
+    return synthetic, Catalog.open_store(CatalogStore.build(synthetic))
+
+
+class TestCatalogStore:
+    def test_build_default_path(self, catalog_root: Path, stored) -> None:
+        assert default_store_path(catalog_root).is_file()
+
+    def test_entries_round_trip(self, stored) -> None:
+        catalog, from_store = stored
+        assert list(from_store.prompts) == list(catalog.prompts)
+        assert len(from_store.prompts) == 2
+        for pid, entry in catalog.prompts.items():
+            got = from_store.prompts[pid]
+            for name in ("title", "tags", "platforms", "variables", "prompt_text", "file_path"):
+                assert getattr(got, name) == getattr(entry, name)
+            assert got.raw == entry.raw  # re-read from the YAML file
+        assert from_store.instructions == catalog.instructions
+        assert from_store.starter_kits.keys() == catalog.starter_kits.keys()
+        assert from_store.starter_kits["test-kit"].prompts == ["test-prompt-1", "test-prompt-2"]
+
+    def test_mapping(self, stored) -> None:
+        _, from_store = stored
+        assert "test-prompt-1" in from_store.prompts
+        assert "missing" not in from_store.prompts
+        assert from_store.prompts.get("missing") is None
+        with pytest.raises(KeyError):
+            from_store.prompts["missing"]
+
+    def test_filter_prompts(self, stored) -> None:
+        _, from_store = stored
+        assert prompt_ids(from_store.filter_prompts(platform="windows")) == ["test-prompt-1"]  # "all"
+        assert prompt_ids(from_store.filter_prompts(tag="planning")) == ["test-prompt-2"]
+        assert prompt_ids(from_store.filter_prompts(skill_level="beginner")) == ["test-prompt-1"]
+        assert prompt_ids(from_store.filter_prompts(query="ANOTHER")) == ["test-prompt-2"]
+
+    def test_filter_parity(self, synthetic_stored) -> None:
+        catalog, from_store = synthetic_stored
+        for category, skill, platform, tag in itertools.product(
+            [None, "security", "domains"],
+            [None, "beginner", "advanced"],
+            [None, "ios", "web"],
+            [None, "security", "api"],
+        ):
+            kwargs = dict(category=category, skill_level=skill, platform=platform, tag=tag)
+            assert prompt_ids(from_store.filter_prompts(**kwargs)) == prompt_ids(catalog.filter_prompts(**kwargs))
+
+    def test_get_chain_parity(self, synthetic_stored) -> None:
+        catalog, from_store = synthetic_stored
+        starts = [p.id for p in catalog.prompts.values() if p.chain_position["next"]][:20]
+        assert starts
+        for pid in starts:
+            assert prompt_ids(from_store.get_chain(pid)) == prompt_ids(catalog.get_chain(pid))
+        assert from_store.get_chain("missing") == []
+
+    def test_resolve_kit(self, synthetic_stored) -> None:
+        catalog, from_store = synthetic_stored
+        for kit_id in catalog.starter_kits:
+            prompts, instructions = from_store.resolve_kit(kit_id)
+            expected_prompts, expected_instructions = catalog.resolve_kit(kit_id)
+            assert prompt_ids(prompts) == prompt_ids(expected_prompts)
+            assert instructions == expected_instructions
+        with pytest.raises(ValueError):
+            from_store.resolve_kit("missing")
+
+    @pytest.mark.skipif(not fts5_available(), reason="SQLite built without FTS5")
+    def test_search(self, stored) -> None:
+        _, from_store = stored
+        # "architecture" only appears in test-prompt-2's body, which the store indexes
+        assert prompt_ids(from_store.search("architecture")) == ["test-prompt-2"]
+        assert set(prompt_ids(from_store.search("prompt"))) == {"test-prompt-1", "test-prompt-2"}
+        assert len(from_store.search("prompt", limit=1)) == 1
+        assert prompt_ids(from_store.search("second prompt")) == ["test-prompt-2"]
+
+    @pytest.mark.skipif(not fts5_available(), reason="SQLite built without FTS5")
+    def test_search_quotes_syntax(self, stored) -> None:
+        _, from_store = stored
+        assert from_store.search('"unbalanced AND (') == []
+        assert from_store.search("   ") == []
+
+    @pytest.mark.parametrize(
+        "text",
+        ["category:testing AND (platform:web OR platform:cloud) AND NOT tag:legacy",
+         "skill<=intermediate tag:api NOT platform:ios", "skill>advanced OR category:planning",
+         "NOT (category:domains OR tag:security)", "tag:security tag:api perf", "api perf"],
+    )
+    @pytest.mark.skipif(not fts5_available(), reason="SQLite built without FTS5")
+    def test_query_parity(self, synthetic_stored, text: str, monkeypatch) -> None:
+        from prompt_catalog_mcp.store import StoredPrompts
+
+        catalog, from_store = synthetic_stored
+        expected = catalog.query_plan(text)
+
+        def no_scan(self):
+            raise AssertionError("store queries must not load every prompt")
+
+        monkeypatch.setattr(StoredPrompts, "values", no_scan)
+        plan = from_store.query_plan(text)
+        assert set(prompt_ids(h.prompt for h in plan.hits)) == set(prompt_ids(h.prompt for h in expected.hits))
+        assert plan.total == expected.total
+        assert "sql: " in plan.explain()
+        assert len(from_store.query(text, 3)) == min(3, plan.total)
+
+    @pytest.mark.skipif(not fts5_available(), reason="SQLite built without FTS5")
+    def test_query_ranks_with_fts(self, stored) -> None:
+        _, from_store = stored
+        hits = from_store.query('tag:test OR "the architecture"')
+        assert prompt_ids(h.prompt for h in hits) == ["test-prompt-2", "test-prompt-1"]
+        assert hits[0].score > hits[1].score == 0
+        assert prompt_ids(h.prompt for h in from_store.query('"architecture the"')) == []
+        assert prompt_ids(h.prompt for h in from_store.query("second")) == prompt_ids(from_store.search("second"))
+
+    def test_reload_is_rejected(self, catalog_root: Path, stored) -> None:
+        _, from_store = stored
+        with pytest.raises(ValueError, match="store build"):
+            from_store.reload([catalog_root / "prompts" / "planning" / "test-prompt-1.yaml"])
+
+    def test_open_rejects_other_databases(self, tmp_path: Path) -> None:
+        path = tmp_path / "other.db"
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        conn.commit()
+        conn.close()
+        with pytest.raises(ValueError):
+            CatalogStore.open(path)
+        with pytest.raises(FileNotFoundError):
+            CatalogStore.open(tmp_path / "missing.db")
+
+
+class TestCLIStore:
+    def test_build_and_query(self, catalog_root: Path, tmp_path: Path) -> None:
+        runner = CliRunner()
+        env = {"CATALOG_ROOT": str(catalog_root)}
+        db = tmp_path / "catalog.db"
+        result = runner.invoke(main, ["store", "build", "-o", str(db)], env=env)
+        assert result.exit_code == 0, result.output
+        assert db.is_file()
+
+        result = runner.invoke(main, ["--store", str(db), "list", "--tag", "planning"], env=env)
+        assert result.exit_code == 0
+        assert "test-prompt-2" in result.output
+        assert "test-prompt-1" not in result.output
+
+        result = runner.invoke(main, ["--store", str(db), "show", "test-prompt-1"], env=env)
+        assert result.exit_code == 0
+        assert "Test Prompt" in result.output
+
+    def test_serve_watch_rejects_store(self, catalog_root: Path, tmp_path: Path) -> None:
+        env = {"CATALOG_ROOT": str(catalog_root)}
+        result = CliRunner().invoke(main, ["--store", str(tmp_path / "catalog.db"), "serve", "--watch"], env=env)
+        assert result.exit_code == 2
+        assert "--watch cannot be combined" in result.output
@@ -0,0 +1,61 @@
+"""Tests for compiled prompt templates."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from prompt_catalog_mcp.catalog import Catalog, PromptEntry
+from prompt_catalog_mcp.generator import generate_catalog
+from prompt_catalog_mcp.template import MissingArgumentsError, Template
+
+
+def _replace(text: str, arguments: dict[str, str]) -> str:
+    for key, value in arguments.items():
+        text = text.replace(f"{{{{{key}}}}}", value)
+    return text
+
+
+class TestTemplate:
+    def test_compile(self) -> None:
+        template = Template.compile("Plan {{a}} with {{b}}, then {{a}} again {{ not_a_var }}.")
+        assert template.parts == ("Plan ", "{{a}}", " with ", "{{b}}", ", then ", "{{a}}", " again {{ not_a_var }}.")
+        assert template.slots == ("a", "b", "a")
+        assert template.variables == ("a", "b")
+        assert Template.compile("no variables").render({"a": "x"}) == "no variables"
+
+    def test_values_are_not_substituted_again(self) -> None:
+        template = Template.compile("{{a}} and {{b}}")
+        assert template.render({"a": "{{b}}", "b": "B"}) == "{{b}} and B"
+        assert template.render({"b": "B", "unused": "x"}) == "{{a}} and B"
+
+    def test_matches_replace_on_catalog(self, tmp_path: Path) -> None:
+        generate_catalog(tmp_path, prompts=60, kits=1, instructions=1, seed=4)
+        for p in Catalog.load(tmp_path, cache=False).prompts.values():
+            arguments = {name: f"<{name}>" for name in p.extract_variable_names()[::2]}
+            assert p.render(arguments) == _replace(p.prompt_text, arguments)
+
+
+class TestRender:
+    def test_compiled_once(self, catalog_root: Path) -> None:
+        entry = PromptEntry.from_yaml(catalog_root / "prompts" / "planning" / "test-prompt-1.yaml")
+        entry.render({"project_name": "Acme"})
+        assert entry.template is entry.template
+        assert entry.extract_variable_names() == ["project_name", "methodology"]
+
+    def test_check_required(self, catalog_root: Path) -> None:
+        entry = PromptEntry.from_yaml(catalog_root / "prompts" / "planning" / "test-prompt-1.yaml")
+        entry.variables = [{"name": "project_name", "required": True}, {"name": "methodology"}]
+        assert entry.render({"project_name": "Acme"}, check_required=True).startswith("Generate a plan for Acme")
+        with pytest.raises(MissingArgumentsError, match="test-prompt-1: project_name") as exc:
+            entry.render({"methodology": "scrum"}, check_required=True)
+        assert exc.value.names == ["project_name"]
+
+    def test_store_entries(self, catalog_root: Path, tmp_path: Path) -> None:
+        from prompt_catalog_mcp.store import CatalogStore
+
+        catalog = Catalog.load(catalog_root, cache=False)
+        store = Catalog.open_store(CatalogStore.build(catalog, tmp_path / "c.sqlite3"))
+        entry = store.prompts["test-prompt-2"]
+        assert entry.render({"project_name": "Atlas"}) == "Review the architecture for Atlas."
@@ -0,0 +1,79 @@
+"""Tests for the catalog file watchers."""
+
+from __future__ import annotations
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+from prompt_catalog_mcp.catalog import PROMPT_DIRS
+from prompt_catalog_mcp.watcher import InotifyWatcher, PollingWatcher, open_watcher
+
+linux_only = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+
+
+def _edit(catalog_root: Path) -> tuple[Path, Path, Path]:
+    planning = catalog_root / "prompts" / "planning"
+    modified = planning / "test-prompt-1.yaml"
+    modified.write_text(modified.read_text() + "\n# edited\n")
+    added = catalog_root / "starter-kits" / "new-kit.yaml"
+    added.write_text("id: new-kit\nname: New Kit\n")
+    deleted = catalog_root / "instructions" / "guardrails" / "test-guard.instructions.md"
+    deleted.unlink()
+    (planning / "notes.txt").write_text("not a catalog source")
+    return modified, added, deleted
+
+
+class TestPollingWatcher:
+    def test_no_changes(self, catalog_root: Path) -> None:
+        assert PollingWatcher(catalog_root).poll() == set()
+
+    def test_reports_added_modified_deleted(self, catalog_root: Path) -> None:
+        watcher = PollingWatcher(catalog_root)
+        expected = set(_edit(catalog_root))
+        assert watcher.poll() == expected
+        assert watcher.poll() == set()
+
+
+@linux_only
+class TestInotifyWatcher:
+    def test_reports_added_modified_deleted(self, catalog_root: Path) -> None:
+        watcher = InotifyWatcher(catalog_root)
+        try:
+            assert watcher.poll() == set()
+            expected = set(_edit(catalog_root))
+            assert watcher.poll() == expected
+            assert watcher.poll() == set()
+        finally:
+            watcher.close()
+
+    def test_watches_directories_created_later(self, catalog_root: Path) -> None:
+        kits = catalog_root / "starter-kits"
+        shutil.rmtree(kits)
+        category = next(
+            catalog_root / "prompts" / d for d in PROMPT_DIRS if not (catalog_root / "prompts" / d).exists()
+        )
+        watcher = InotifyWatcher(catalog_root)
+        try:
+            kits.mkdir()
+            kit = kits / "new-kit.yaml"
+            kit.write_text("id: new-kit\nname: New Kit\n")
+            category.mkdir()
+            prompt = category / "new-prompt.yaml"
+            prompt.write_text("id: new-prompt\n")
+            assert watcher.poll() == {kit, prompt}
+
+            later = kits / "later-kit.yaml"
+            later.write_text("id: later-kit\nname: Later Kit\n")
+            assert watcher.poll() == {later}
+        finally:
+            watcher.close()
+
+    def test_open_watcher_prefers_inotify(self, catalog_root: Path) -> None:
+        watcher = open_watcher(catalog_root)
+        try:
+            assert isinstance(watcher, InotifyWatcher)
+        finally:
+            watcher.close()